@@ -0,0 +1,8 @@
+"""Performance benchmarks for nfb_studio.
+
+Benchmarks are plain scripts, each of them can be run as a module from the repository root:
+```
+python -m benchmarks.encoder_dispatch
+```
+Benchmarks that build schemes need a QApplication. If no display is available, the "offscreen" Qt platform is used.
+"""
@@ -0,0 +1,48 @@
+"""Benchmark of the compact binary experiment format.
+
+Compares the size of a synthetic experiment saved as json and in the binary format, and the time it takes to save and
+load each. Decoding alone (the format without constructing the experiment) is measured separately, since building
+the scheme takes most of the loading time. An experiment loaded from the binary format must save to the same json.
+"""
+from nfb_studio.experiment import Experiment
+from nfb_studio.serial import json, binary, hooks
+
+from .util import make_experiment, measure, report
+
+
+def main():
+    ex = make_experiment(signal_count=100, block_count=50)
+    print("Saving an experiment with {} signal nodes".format(len(ex.signal_scheme.graph.nodes)))
+
+    json_time, json_data = measure(ex.save, "json")
+    binary_time, binary_data = measure(ex.save, "binary")
+
+    json_size = len(json_data.encode("utf-8"))
+    print("{:<40} {:>10} bytes".format("json", json_size))
+    print("{:<40} {:>10} bytes  ({:.2f}x)".format("binary", len(binary_data), json_size / len(binary_data)))
+
+    report("save, json", json_time)
+    report("save, binary", binary_time, baseline=json_time)
+
+    # Decoding into dicts and primitives only
+    json_decode_time, _ = measure(json.loads, json_data, decoder=json.JSONDecoder(registry=RawRegistry()))
+    binary_decode_time, _ = measure(binary.loads, binary_data, decoder=binary.BinaryDecoder(registry=RawRegistry()))
+    report("decode, json", json_decode_time)
+    report("decode, binary", binary_decode_time, baseline=json_decode_time)
+
+    json_load_time, _ = measure(Experiment.load, json_data, repeat=1)
+    binary_load_time, loaded = measure(Experiment.load, binary_data, repeat=1)
+    report("load, json", json_load_time)
+    report("load, binary", binary_load_time, baseline=json_load_time)
+
+    assert loaded.save() == json_data
+
+
+class RawRegistry:
+    """Registry that resolves every class to a function returning the data as-is."""
+    def resolve(self, module_path, class_name):
+        return (object, lambda data: data)
+
+
+if __name__ == "__main__":
+    main()
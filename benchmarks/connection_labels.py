@@ -0,0 +1,86 @@
+"""Benchmark of lazily created connection labels.
+
+Creates a scheme with 200 derived signals (1200 nodes and 1000 edges) and compares it with a scheme where every
+connection creates its text label right away, as it did before. Also compares holding Alt in a view that shows a part
+of the scheme, which used to show the labels of every connection. The first time Alt is held, labels of visible
+connections are created.
+"""
+from PySide2.QtWidgets import QApplication
+
+from nfb_studio.scheme.node import Connection
+from nfb_studio.scheme.scheme import Scheme
+
+from .scheme_batch import make_chains, fill
+from .util import application, measure, report
+
+
+class EagerLabels:
+    """Context manager that makes every Connection created inside it create its text label right away."""
+    def __enter__(self):
+        self.init = Connection.__init__
+
+        def init(connection, *args, **kwargs):
+            self.init(connection, *args, **kwargs)
+            connection.showText()
+            connection.hideText()
+
+        Connection.__init__ = init
+
+    def __exit__(self, *args):
+        Connection.__init__ = self.init
+
+
+def make_scheme(signal_count):
+    scheme = Scheme()
+    fill(scheme, make_chains(signal_count))
+    return scheme
+
+
+def make_scheme_with_eager_labels(signal_count):
+    with EagerLabels():
+        return make_scheme(signal_count)
+
+
+def show_all_labels(scheme):
+    """Show and hide connection text by iterating over all nodes, as Alt did before."""
+    for node in scheme.graph.nodes:
+        node.showConnectionText()
+    for node in scheme.graph.nodes:
+        node.hideConnectionText()
+
+
+def show_visible_labels(scheme):
+    scheme.setConnectionTextVisible(True)
+    scheme.setConnectionTextVisible(False)
+
+
+def main():
+    application()
+    signal_count = 200
+
+    old_time, old_scheme = measure(make_scheme_with_eager_labels, signal_count, repeat=1)
+    new_time, new_scheme = measure(make_scheme, signal_count, repeat=1)
+
+    report("create scheme, eager labels", old_time)
+    report("create scheme, lazy labels", new_time, baseline=old_time)
+    print("scene items: {} eager, {} lazy".format(len(old_scheme.items()), len(new_scheme.items())))
+
+    view = new_scheme.getView()
+    view.resize(1280, 720)
+    view.centerOn(0, 0)
+
+    # Let the scenes build their item indexes, as they would in a running application
+    for _ in range(10):
+        QApplication.processEvents()
+
+    old_time, _ = measure(show_all_labels, old_scheme)
+    first_time, _ = measure(show_visible_labels, new_scheme, repeat=1)
+    new_time, _ = measure(show_visible_labels, new_scheme)
+
+    report("hold Alt, all connections", old_time)
+    report("hold Alt first, visible connections", first_time, baseline=old_time)
+    report("hold Alt, visible connections", new_time, baseline=old_time)
+
+
+if __name__ == "__main__":
+    main()
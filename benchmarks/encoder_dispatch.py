@@ -0,0 +1,32 @@
+"""Benchmark of the per-type dispatch cache in BaseEncoder.
+
+Encodes a large synthetic experiment with the regular BaseEncoder, and with an encoder that resolves the encoding method
+for every single value, as BaseEncoder did before the dispatch cache was introduced.
+"""
+from nfb_studio.serial import hooks
+from nfb_studio.serial.base import BaseEncoder
+
+from .util import make_experiment, measure, report
+
+
+class UncachedEncoder(BaseEncoder):
+    """BaseEncoder that resolves the encoding method of every value from scratch."""
+    def encode(self, obj, /):
+        return self._resolve(type(obj))(obj)
+
+
+def main():
+    ex = make_experiment(signal_count=333, block_count=50)  # About 2000 nodes in the signal scheme
+    print("Encoding an experiment with {} signal nodes".format(len(ex.signal_scheme.graph.nodes)))
+
+    uncached_time, uncached_result = measure(UncachedEncoder(hooks=hooks.qt).encode, ex)
+    cached_time, cached_result = measure(BaseEncoder(hooks=hooks.qt).encode, ex)
+
+    assert uncached_result == cached_result
+
+    report("BaseEncoder, no dispatch cache", uncached_time)
+    report("BaseEncoder, dispatch cache", cached_time, baseline=uncached_time)
+
+
+if __name__ == "__main__":
+    main()
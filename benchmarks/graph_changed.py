@@ -0,0 +1,78 @@
+"""Benchmark of coalesced graphChanged notifications.
+
+Copies a sequence of 200 blocks in a sequence editor and pastes it. The sequence editor rebuilds its sequence selector
+on every graphChanged. Compares the regular Scheme, which sends one notification after the paste, with a scheme that
+sends a notification for every added node and edge, as Scheme did before.
+"""
+from PySide2.QtWidgets import QApplication
+
+from nfb_studio.scheme.scheme import Scheme
+from nfb_studio.sequence_editor import SequenceEditor
+
+from .util import application, measure, report
+
+
+class ImmediateScheme(Scheme):
+    """Scheme that emits graphChanged for every change."""
+    def _graphChanged(self, item, added: bool):
+        super()._graphChanged(item, added)
+        self.flushGraphChanged()
+
+
+def make_editor(scheme_class, block_count):
+    from nfb_studio.sequence_nodes import BlockNode
+
+    editor = SequenceEditor()
+    scheme = scheme_class()
+    editor.setScheme(scheme)
+
+    last = None
+    for i in range(block_count):
+        node = BlockNode()
+        node.setPos(i * 250, 0)
+        scheme.addItem(node)
+
+        if last is not None:
+            scheme.connect_nodes(last.outputs[0], node.inputs[0])
+        last = node
+
+    QApplication.processEvents()
+    return editor
+
+
+def paste(scheme):
+    scheme.pasteEvent()
+    QApplication.processEvents()  # Deliver coalesced notifications
+
+
+def main():
+    application()
+    block_count = 200
+
+    times = {}
+    for name, scheme_class in (("every change", ImmediateScheme), ("coalesced", Scheme)):
+        editor = make_editor(scheme_class, block_count)
+        scheme = editor.scheme()
+
+        # Select all blocks and edges without going through selection callbacks of every item
+        for item in scheme.graph:
+            item.setSelected(True)
+        scheme.copyEvent()
+
+        notifications = []
+        scheme.graphChanged.connect(notifications.append)
+
+        times[name], _ = measure(paste, scheme, repeat=1)
+        print("{}: {} nodes, {} edges, {} graphChanged".format(
+            name, len(scheme.graph.nodes), len(scheme.graph.edges), len(notifications)
+        ))
+
+    report("paste, graphChanged on every change", times["every change"])
+    report("paste, coalesced graphChanged", times["coalesced"], baseline=times["every change"])
+
+    # Qt may crash on exit if the clipboard still holds data from this process
+    QApplication.clipboard().clear()
+
+
+if __name__ == "__main__":
+    main()
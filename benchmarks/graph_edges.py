@@ -0,0 +1,69 @@
+"""Benchmark of the edge indexes in Graph.
+
+Deletes a selection of nodes from a large signal scheme, and disconnects a number of edges, with the regular Graph and
+with a graph that finds edges by scanning all of them, as Graph did before edge indexes were introduced.
+"""
+from nfb_studio.scheme.graph import Graph
+
+from .util import make_experiment, measure, report
+
+
+class ScanningGraph(Graph):
+    """Graph that finds edges of a node by scanning every edge in the graph."""
+    def connectedEdges(self, node):
+        return [edge for edge in self.edges if edge.sourceNode() is node or edge.targetNode() is node]
+
+    def disconnect_nodes(self, source, target):
+        for edge in self.edges:
+            if edge.source() == source and edge.target() == target:
+                self.discard(edge)
+                return edge
+        return None
+
+
+def make_scheme(graph_class, signal_count):
+    scheme = make_experiment(signal_count=signal_count, block_count=0).signal_scheme
+
+    graph = graph_class()
+    graph.merge(scheme.graph)
+    scheme.graph = graph
+
+    return scheme
+
+
+def delete_selection(scheme, count):
+    """Delete every third node out of the first `count` nodes, sorted by position."""
+    nodes = sorted(scheme.graph.nodes, key=lambda node: (node.y(), node.x()))
+    for node in nodes[:count:3]:
+        node.setSelected(True)
+
+    scheme.extract(scheme.wideSelection())
+
+
+def disconnect(scheme, count):
+    """Disconnect the first `count` edges."""
+    edges = sorted(scheme.graph.edges, key=lambda edge: (edge.sourceNode().y(), edge.sourceNode().x()))
+    for edge in edges[:count]:
+        scheme.disconnect_nodes(edge.source(), edge.target())
+
+
+def main():
+    signal_count = 500  # 3000 nodes, 2500 edges
+
+    for name, func, count in (("delete selection", delete_selection, 300), ("disconnect", disconnect, 250)):
+        scanning = make_scheme(ScanningGraph, signal_count)
+        indexed = make_scheme(Graph, signal_count)
+        print("{}: {} nodes, {} edges".format(name, len(indexed.graph.nodes), len(indexed.graph.edges)))
+
+        scan_time, _ = measure(func, scanning, count, repeat=1)
+        index_time, _ = measure(func, indexed, count, repeat=1)
+
+        assert len(scanning.graph.nodes) == len(indexed.graph.nodes)
+        assert len(scanning.graph.edges) == len(indexed.graph.edges)
+
+        report(name + ", edge scan", scan_time)
+        report(name + ", edge indexes", index_time, baseline=scan_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark of node and connection indexing in Graph.serialize.
+
+Serializes a signal scheme of about 5000 nodes, as is done when saving an experiment or copying a selection to the
+clipboard, with the regular Graph and with a graph that looks up node and connection indices with list searches, as
+Graph did before.
+"""
+from nfb_studio.scheme.graph import Graph
+
+from .util import make_experiment, measure, report
+
+
+class ListSearchGraph(Graph):
+    """Graph that finds node and connection indices of every edge with a list search."""
+    def serialize(self) -> dict:
+        nodes = list(self.nodes)
+        edges = []
+
+        for edge in self.edges:
+            source_node = edge.sourceNode()
+            target_node = edge.targetNode()
+
+            edges.append({
+                "source": {
+                    "node_index": nodes.index(source_node),
+                    "connection_index": source_node.outputs.index(edge.source())
+                },
+                "target": {
+                    "node_index": nodes.index(target_node),
+                    "connection_index": target_node.inputs.index(edge.target())
+                }
+            })
+
+        return {
+            "nodes": nodes,
+            "edges": edges
+        }
+
+
+def edge_set(graph, data):
+    """Return the edges of serialized graph data as a set of connection pairs, independent of node and edge order."""
+    nodes = data["nodes"]
+    result = set()
+
+    for edge in data["edges"]:
+        if isinstance(edge["source"], dict):
+            source = nodes[edge["source"]["node_index"]].outputs[edge["source"]["connection_index"]]
+            target = nodes[edge["target"]["node_index"]].inputs[edge["target"]["connection_index"]]
+        else:
+            source = graph.item(edge["source"])
+            target = graph.item(edge["target"])
+
+        result.add((source, target))
+
+    return result
+
+
+def main():
+    scheme = make_experiment(signal_count=834, block_count=0).signal_scheme  # 5004 nodes
+    print("Serializing a scheme with {} nodes and {} edges".format(len(scheme.graph.nodes), len(scheme.graph.edges)))
+
+    old_graph = ListSearchGraph()
+    old_graph.merge(scheme.graph)
+
+    old_time, old_data = measure(old_graph.serialize)
+    new_time, new_data = measure(scheme.graph.serialize)
+
+    assert edge_set(old_graph, old_data) == edge_set(scheme.graph, new_data)
+
+    report("Graph.serialize, list search", old_time)
+    report("Graph.serialize, item IDs", new_time, baseline=old_time)
+
+
+if __name__ == "__main__":
+    main()
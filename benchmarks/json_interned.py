@@ -0,0 +1,49 @@
+"""Benchmark of the JSON layout with interned class metadata.
+
+Saves a synthetic experiment in the regular `.nfbex` layout and with `intern_metadata=True`, and compares the file size,
+the time to parse each file into dicts and primitives, and the number of Python objects allocated during parsing.
+"""
+import gc
+import json as std_json
+import tracemalloc
+
+from nfb_studio.serial import json, hooks
+
+from .util import make_experiment, measure, report
+
+
+def allocated_blocks(func, *args):
+    """Call func and return the number of memory blocks, allocated by Python and still alive, that its result holds."""
+    gc.collect()
+    tracemalloc.start()
+    result = func(*args)
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+
+    del result
+    return blocks
+
+
+def main():
+    ex = make_experiment(signal_count=333, block_count=50)  # About 2000 nodes in the signal scheme
+    print("Saving an experiment with {} signal nodes".format(len(ex.signal_scheme.graph.nodes)))
+
+    legacy = json.JSONEncoder(indent="\t", hooks=hooks.qt, single_pass=True).encode(ex)
+    interned = json.JSONEncoder(indent="\t", hooks=hooks.qt, intern_metadata=True).encode(ex)
+
+    print("{:<40} {:>10} bytes".format("regular", len(legacy.encode("utf-8"))))
+    print("{:<40} {:>10} bytes  ({:.2f}x)".format(
+        "interned", len(interned.encode("utf-8")), len(legacy) / len(interned)
+    ))
+
+    legacy_time, _ = measure(std_json.loads, legacy)
+    interned_time, _ = measure(std_json.loads, interned)
+    report("parse, regular", legacy_time)
+    report("parse, interned", interned_time, baseline=legacy_time)
+
+    print("{:<40} {:>10} blocks".format("parse, regular", allocated_blocks(std_json.loads, legacy)))
+    print("{:<40} {:>10} blocks".format("parse, interned", allocated_blocks(std_json.loads, interned)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Benchmark of single-pass JSON encoding.
+
+Saves a large synthetic experiment the way `Experiment.save` does, with custom objects serialized through
+`json.JSONEncoder.default` and with the whole experiment converted to primitives first (`single_pass=True`). Both
+encoders must produce identical output. The compact, non-indented format is measured too, since only that one can use
+the C accelerator of the json module.
+"""
+from nfb_studio.serial import json, hooks
+
+from .util import make_experiment, measure, report
+
+
+def main():
+    ex = make_experiment(signal_count=333, block_count=50)  # About 2000 nodes in the signal scheme
+    print("Saving an experiment with {} signal nodes".format(len(ex.signal_scheme.graph.nodes)))
+
+    for name, indent in (("indented", "\t"), ("compact", None)):
+        default_encoder = json.JSONEncoder(indent=indent, hooks=hooks.qt)
+        single_pass_encoder = json.JSONEncoder(indent=indent, hooks=hooks.qt, single_pass=True)
+
+        default_time, default_result = measure(default_encoder.encode, ex)
+        single_pass_time, single_pass_result = measure(single_pass_encoder.encode, ex)
+
+        assert default_result == single_pass_result
+
+        report("JSONEncoder, {}, default".format(name), default_time)
+        report("JSONEncoder, {}, single pass".format(name), single_pass_time, baseline=default_time)
+
+
+if __name__ == "__main__":
+    main()
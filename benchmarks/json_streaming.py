@@ -0,0 +1,75 @@
+"""Benchmark of saving and opening experiment files through file objects.
+
+Compares peak memory, allocated by Python, when an experiment is saved with `Experiment.save` and written to a file as
+one string, and when it is written with `Experiment.dump`. Opening the file with `Experiment.load` and
+`Experiment.load_file` is measured the same way.
+"""
+import os
+import tempfile
+import tracemalloc
+
+from nfb_studio.experiment import Experiment
+
+from .util import make_experiment, measure, report
+
+
+def peak_memory(func, *args):
+    """Call func and return the peak memory in MiB, allocated by Python during the call."""
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak / 2**20
+
+
+def save_string(ex, path):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(ex.save())
+
+
+def save_stream(ex, path):
+    with open(path, "w", encoding="utf-8") as file:
+        ex.dump(file)
+
+
+def open_string(path):
+    with open(path, encoding="utf-8") as file:
+        return Experiment.load(file.read())
+
+
+def open_stream(path):
+    with open(path, encoding="utf-8") as file:
+        return Experiment.load_file(file)
+
+
+def main():
+    ex = make_experiment(signal_count=333, block_count=50)  # About 2000 nodes in the signal scheme
+    print("Saving and opening an experiment with {} signal nodes".format(len(ex.signal_scheme.graph.nodes)))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        string_path = os.path.join(temp_dir, "string.nfbex")
+        stream_path = os.path.join(temp_dir, "stream.nfbex")
+
+        for name, func, path in (
+            ("Experiment.save + write", save_string, string_path),
+            ("Experiment.dump", save_stream, stream_path),
+        ):
+            seconds, _ = measure(func, ex, path, repeat=3)
+            report(name, seconds)
+            print("{:<40} {:>10.1f} MiB peak".format("", peak_memory(func, ex, path)))
+
+        with open(string_path, encoding="utf-8") as a, open(stream_path, encoding="utf-8") as b:
+            assert a.read() == b.read()
+
+        for name, func in (
+            ("read + Experiment.load", open_string),
+            ("Experiment.load_file", open_stream),
+        ):
+            seconds, _ = measure(func, stream_path, repeat=1)
+            report(name, seconds)
+            print("{:<40} {:>10.1f} MiB peak".format("", peak_memory(func, stream_path)))
+
+
+if __name__ == "__main__":
+    main()
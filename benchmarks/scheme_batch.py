@@ -0,0 +1,63 @@
+"""Benchmark of Scheme.batch.
+
+Adds the nodes of 500 derived signals (3000 nodes and 2500 edges) to a scheme one by one, and then the same nodes
+inside a batch. Also measures building the signal scheme of an imported 500-signal NFBLab file.
+"""
+from nfb_studio.experiment import Experiment
+from nfb_studio.scheme.scheme import Scheme
+
+from .util import application, make_experiment, measure, report
+
+
+def make_chains(signal_count):
+    """Return a list of node chains, each one going from LSL input to signal export."""
+    from nfb_studio.signal_nodes import (LSLInput, SpatialFilter, BandpassFilter, EnvelopeDetector, Standardise,
+                                         DerivedSignalExport)
+
+    chains = []
+    for i in range(signal_count):
+        chain = [LSLInput(), SpatialFilter(), BandpassFilter(), EnvelopeDetector(), Standardise(), DerivedSignalExport()]
+        for j, node in enumerate(chain):
+            node.setPos(j * 250, i * 250)
+
+        chains.append(chain)
+
+    return chains
+
+
+def fill(scheme, chains):
+    for chain in chains:
+        for node in chain:
+            scheme.addItem(node)
+
+        for source, target in zip(chain, chain[1:]):
+            scheme.connect_nodes(source.outputs[0], target.inputs[0])
+
+
+def fill_batch(scheme, chains):
+    with scheme.batch():
+        fill(scheme, chains)
+
+
+def main():
+    application()
+    signal_count = 500
+
+    times = {}
+    for name, func in (("one by one", fill), ("batch", fill_batch)):
+        scheme = Scheme()
+        chains = make_chains(signal_count)
+        times[name], _ = measure(func, scheme, chains, repeat=1)
+
+    report("add items, one by one", times["one by one"])
+    report("add items, batch", times["batch"], baseline=times["one by one"])
+
+    xml = make_experiment(signal_count=signal_count, block_count=0).export()
+    import_time, ex = measure(Experiment.import_xml, xml, repeat=1)
+    scheme_time, _ = measure(lambda: ex.signal_scheme, repeat=1)
+    report("import 500 signals", import_time)
+    report("build imported signal scheme", scheme_time)
+
+
+if __name__ == "__main__":
+    main()
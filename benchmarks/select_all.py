@@ -0,0 +1,68 @@
+"""Benchmark of selecting all items in a scheme.
+
+Selects all nodes of a scheme with 50 derived signals (300 nodes and 250 edges), as rubber-band selection or Ctrl+A
+does, and then clears the selection. Compares the regular Scheme and Style with a scheme where every selection toggle
+scans the whole graph for selected items and a style that makes new pens on every palette change, as they did before.
+"""
+from PySide2.QtGui import QPen, QBrush
+
+from nfb_studio.scheme.palette import Palette
+from nfb_studio.scheme.scheme import Scheme
+from nfb_studio.scheme.style import Style
+
+from .scheme_batch import make_chains, fill
+from .util import application, measure, report
+
+
+class ScanningScheme(Scheme):
+    """Scheme that finds selected nodes and edges by scanning the graph."""
+    def selectedNodeCount(self):
+        return len(self.graph.selection().nodes)
+
+    def selectedEdges(self):
+        return list(self.graph.selection().edges)
+
+
+class CopyingStyle(Style):
+    """Style that makes new pens and brushes every time they are requested."""
+    def framePen(self, palette):
+        result = QPen(self._frame_pen)
+        result.setColor(palette.color(Palette.Frame))
+        return result
+
+    def edgePen(self, palette):
+        result = QPen(self._edge_pen)
+        result.setColor(palette.color(Palette.Edge))
+        return result
+
+    def textBackgroundBrush(self, palette):
+        color = palette.background().color()
+        color.setAlpha(196)
+        return QBrush(color)
+
+
+def select_all(scheme):
+    scheme.selectAll()
+    scheme.clearSelection()
+
+
+def main():
+    application()
+    signal_count = 50
+
+    old_scheme = ScanningScheme()
+    old_scheme.setStyle(CopyingStyle())
+    fill(old_scheme, make_chains(signal_count))
+
+    new_scheme = Scheme()
+    fill(new_scheme, make_chains(signal_count))
+
+    old_time, _ = measure(select_all, old_scheme, repeat=1)
+    new_time, _ = measure(select_all, new_scheme, repeat=3)
+
+    report("select all, scanning selection", old_time)
+    report("select all, tracked selection", new_time, baseline=old_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark of sequence enumeration in the sequence editor.
+
+Builds a sequence scheme of 12 layers with 2 blocks each, where every block is connected to both blocks of the next
+layer (4096 possible sequences), then connects one more block at the end. Compares enumerating all sequences from
+scratch, as SequenceEditor did before, with a SequenceIndex that is updated from the GraphDelta of the change.
+"""
+from nfb_studio.scheme.graph import Graph
+from nfb_studio.scheme.scheme import Scheme
+from nfb_studio.sequence_index import SequenceIndex
+
+from .util import application, measure, report
+
+
+def possible_sequences(graph):
+    """Enumerate all sequences by building a Graph and a list for each one, as SequenceEditor did before."""
+    def sequences_from(node):
+        has_sequences = False
+
+        for edge in graph.outgoingEdges(node):
+            for sequence_graph, sequence_list in sequences_from(edge.targetNode()):
+                sequence_graph.add(node)
+                sequence_graph.add(edge)
+                sequence_list.insert(0, node)
+
+                yield (sequence_graph, sequence_list)
+                has_sequences = True
+
+        if not has_sequences:
+            result = (Graph(), list())
+            result[0].add(node)
+            result[1].append(node)
+            yield result
+
+    for node in graph.nodes:
+        if len(graph.incomingEdges(node)) == 0:
+            yield from sequences_from(node)
+
+
+def make_scheme(layer_count):
+    from nfb_studio.sequence_nodes import BlockNode
+
+    scheme = Scheme()
+    previous = []
+
+    with scheme.batch():
+        for i in range(layer_count):
+            layer = [BlockNode(), BlockNode()]
+
+            for j, node in enumerate(layer):
+                node.setPos(i * 250, j * 250)
+                scheme.addItem(node)
+
+                for source in previous:
+                    scheme.connect_nodes(source.outputs[0], node.inputs[0])
+
+            previous = layer
+
+    scheme.flushGraphChanged()
+    return scheme, previous
+
+
+def main():
+    application()
+    from nfb_studio.sequence_nodes import BlockNode
+
+    scheme, last_layer = make_scheme(12)
+    index = SequenceIndex(scheme.graph, limit=200)
+    index.sequences()
+
+    deltas = []
+    scheme.graphChanged.connect(deltas.append)
+
+    node = BlockNode()
+    scheme.addItem(node)
+    scheme.connect_nodes(last_layer[0].outputs[0], node.inputs[0])
+    scheme.flushGraphChanged()
+    delta = deltas[-1]
+
+    def update():
+        index.update(delta)
+        return index.sequences(), index.count()
+
+    old_time, old_sequences = measure(lambda: list(possible_sequences(scheme.graph)), repeat=1)
+    new_time, (new_sequences, count) = measure(update, repeat=1)
+
+    assert count == len(old_sequences)
+    assert set(new_sequences) <= {tuple(sequence_list) for _, sequence_list in old_sequences}
+    print("{} sequences, {} shown".format(count, len(new_sequences)))
+
+    report("enumerate all sequences", old_time)
+    report("update SequenceIndex", new_time, baseline=old_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark of choosing the active sequence after a change in the sequence editor.
+
+Builds a sequence scheme of 9 layers with 2 blocks each, where every block is connected to both blocks of the next layer
+(512 possible sequences). The previously active sequence is the last one with one more block at the end, which is not
+a subset of any sequence, so all of them are compared with it. Compares subset tests between Graph objects, as
+SequenceEditor did before, with subset tests between bitsets of node IDs.
+"""
+from nfb_studio.scheme.graph import Graph
+from nfb_studio.sequence_editor import SequenceEditor
+from nfb_studio.sequence_index import Sequence
+
+from .util import application, measure, report
+
+
+def to_graph(scheme, sequence):
+    """Return a Graph with nodes of `sequence` and edges between them, as SequenceEditor used to represent sequences."""
+    graph = Graph()
+
+    for node, next_node in zip(sequence, sequence[1:]):
+        graph.add(node)
+        for edge in scheme.graph.outgoingEdges(node):
+            if edge.targetNode() is next_node:
+                graph.add(edge)
+    graph.add(sequence[-1])
+
+    return graph
+
+
+def following_graph(selected, options):
+    """Choose the next active sequence by comparing Graph objects, as SequenceEditor did before."""
+    selected_graph, selected_list = selected
+
+    candidates = []
+    for row, (sgraph, slist) in enumerate(options):
+        if selected_graph <= sgraph:
+            return row
+
+        if sgraph <= selected_graph:
+            candidates.append((sgraph, row))
+
+    for node in selected_list:
+        for sgraph, row in candidates:
+            if node in sgraph:
+                return row
+
+    return 0
+
+
+def make_editor(layer_count):
+    from nfb_studio.scheme.scheme import Scheme
+    from nfb_studio.sequence_nodes import BlockNode
+
+    editor = SequenceEditor()
+    scheme = Scheme()
+    editor.setScheme(scheme)
+    previous = []
+
+    with scheme.batch():
+        for i in range(layer_count):
+            layer = [BlockNode(), BlockNode()]
+
+            for j, node in enumerate(layer):
+                node.setPos(i * 250, j * 250)
+                scheme.addItem(node)
+
+                for source in previous:
+                    scheme.connect_nodes(source.outputs[0], node.inputs[0])
+
+            previous = layer
+
+    scheme.flushGraphChanged()
+    return editor
+
+
+def main():
+    application()
+    from nfb_studio.sequence_nodes import BlockNode
+
+    editor = make_editor(9)
+    scheme = editor.scheme()
+    sequences = editor.sequences()
+
+    extra = BlockNode()
+    scheme.addItem(extra)
+    selected = Sequence(sequences[-1] + (extra,))
+
+    options = [(to_graph(scheme, sequence), list(sequence)) for sequence in sequences]
+    selected_option = (to_graph(scheme, selected), list(selected))
+
+    old_time, old_row = measure(following_graph, selected_option, options)
+    new_time, new_row = measure(editor._followingRow, selected)
+
+    assert old_row == new_row
+    print("{} sequences".format(len(sequences)))
+
+    report("choose active sequence, Graph subsets", old_time)
+    report("choose active sequence, ID bitsets", new_time, baseline=old_time)
+
+
+if __name__ == "__main__":
+    main()
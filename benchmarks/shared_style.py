@@ -0,0 +1,48 @@
+"""Benchmark of shared styles and palettes of scheme items.
+
+Creates the nodes of 200 derived signals (1200 nodes, each with its connections, messages and text items). Compares
+items that use the shared style and palette with items that get their own Style and Palette, as every SchemeItem did
+before.
+"""
+from nfb_studio.scheme.scheme_item import SchemeItem
+from nfb_studio.scheme.style import Style
+from nfb_studio.scheme.palette import Palette
+
+from .scheme_batch import make_chains
+from .util import application, measure, report
+
+
+class OwnStyleAndPalette:
+    """Context manager that gives every SchemeItem created inside it its own Style and Palette."""
+    def __enter__(self):
+        self.init = SchemeItem.__init__
+
+        def init(item, parent=None):
+            self.init(item, parent)
+            item._style = Style()
+            item._palette = Palette()
+
+        SchemeItem.__init__ = init
+
+    def __exit__(self, *args):
+        SchemeItem.__init__ = self.init
+
+
+def make_chains_with_own_style(signal_count):
+    with OwnStyleAndPalette():
+        return make_chains(signal_count)
+
+
+def main():
+    application()
+    signal_count = 200
+
+    old_time, _ = measure(make_chains_with_own_style, signal_count, repeat=1)
+    new_time, _ = measure(make_chains, signal_count, repeat=1)
+
+    report("create nodes, own style and palette", old_time)
+    report("create nodes, shared style and palette", new_time, baseline=old_time)
+
+
+if __name__ == "__main__":
+    main()
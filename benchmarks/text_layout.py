@@ -0,0 +1,72 @@
+"""Benchmark of text layout in TextLineItem.
+
+Creates 2000 text items the way connections and messages do (set text, font and maximum width), using 20 different
+labels. Compares the regular TextLineItem, which shares cached layouts, with an item that measures and elides its text
+with QFontMetricsF on every change, as TextLineItem did before.
+"""
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QFontMetricsF
+
+from nfb_studio.scheme.style import Style
+from nfb_studio.scheme.text_line_item import TextLineItem
+from nfb_studio.scheme.unitconv import inches_to_pixels as px
+
+from .util import application, measure, report
+
+
+class MeasuringTextLineItem(TextLineItem):
+    """TextLineItem that lays out its text from scratch on every change."""
+    def adjust(self):
+        metrics = QFontMetricsF(self.font())
+
+        self._bounding_rect = metrics.boundingRect(self.text())
+        if self.maximumWidth() is not None:
+            self._bounding_rect.setWidth(self.maximumWidth())
+
+        self._elided_text = metrics.elidedText(self.text(), self.elideMode(), self.boundingRect().width())
+
+        self._bounding_rect = metrics.boundingRect(self.elidedText())
+        metrics_correction = px(1/72)
+        self._bounding_rect.adjust(-metrics_correction, 0, metrics_correction, 0)
+
+        if self.alignMode() & Qt.AlignLeft:
+            self._bounding_rect.moveLeft(0)
+        elif self.alignMode() & Qt.AlignRight:
+            self._bounding_rect.moveRight(0)
+        else:
+            self._bounding_rect.moveLeft(-self._bounding_rect.width()/2)
+
+        self.background.setRect(self.boundingRect())
+
+
+def make_items(item_class, labels, count):
+    style = Style.default()
+    font = style.font(Style.ConnectionTextFont)
+    max_width = style.pixelMetric(Style.ConnectionTextLength)
+
+    items = []
+    for i in range(count):
+        item = item_class(labels[i % len(labels)])
+        item.setFont(font)
+        item.setMaximumWidth(max_width)
+        items.append(item)
+
+    return items
+
+
+def main():
+    application()
+    labels = ["Connection label number {}, long enough to be elided".format(i) for i in range(20)]
+
+    old_time, old_items = measure(make_items, MeasuringTextLineItem, labels, 2000)
+    new_time, new_items = measure(make_items, TextLineItem, labels, 2000)
+
+    for old, new in zip(old_items, new_items):
+        assert old.elidedText() == new.elidedText() and old.boundingRect() == new.boundingRect()
+
+    report("create text items, measure every change", old_time)
+    report("create text items, cached layout", new_time, baseline=old_time)
+
+
+if __name__ == "__main__":
+    main()
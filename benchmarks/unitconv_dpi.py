@@ -0,0 +1,39 @@
+"""Benchmark of unit conversions in scheme/unitconv.
+
+Converts 10000 points from inches to pixels, as is done when node positions are loaded and when style metrics are
+looked up during geometry updates and painting. Compares measuring dpi with a new QWidget on every conversion, as
+`dpi()` did before, with the cached dpi, and with converting all points at once.
+"""
+from PySide2.QtCore import QPointF
+from PySide2.QtWidgets import QWidget
+
+from nfb_studio.scheme.unitconv import inches_to_pixels, inches_to_pixels_all
+
+from .util import application, measure, report
+
+
+def widget_dpi_conversion(points):
+    return [point * QWidget().logicalDpiX() for point in points]
+
+
+def cached_dpi_conversion(points):
+    return [inches_to_pixels(point) for point in points]
+
+
+def main():
+    application()
+    points = [QPointF(i * 0.01, i * 0.02) for i in range(10000)]
+
+    old_time, old_result = measure(widget_dpi_conversion, points)
+    new_time, new_result = measure(cached_dpi_conversion, points)
+    all_time, all_result = measure(inches_to_pixels_all, points)
+
+    assert old_result == new_result == all_result
+
+    report("inches_to_pixels, QWidget per call", old_time)
+    report("inches_to_pixels, cached dpi", new_time, baseline=old_time)
+    report("inches_to_pixels_all", all_time, baseline=old_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Helper functions shared by the benchmarks."""
+import gc
+import os
+import sys
+from timeit import default_timer
+
+
+def application():
+    """Return the running QApplication, creating one if necessary."""
+    if "DISPLAY" not in os.environ and sys.platform.startswith("linux"):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PySide2.QtWidgets import QApplication
+    return QApplication.instance() or QApplication(sys.argv[:1])
+
+
+def make_experiment(signal_count=100, block_count=10):
+    """Build a synthetic experiment.
+
+    The signal scheme contains `signal_count` derived signals, each one a chain of 6 nodes (from LSL input to signal
+    export). The experiment also contains `block_count` blocks, arranged in a linear sequence.
+    """
+    application()
+
+    from nfb_studio.experiment import Experiment
+    from nfb_studio.block import Block
+    from nfb_studio.signal_nodes import (LSLInput, SpatialFilter, BandpassFilter, EnvelopeDetector, Standardise,
+                                         DerivedSignalExport)
+    from nfb_studio.sequence_nodes import BlockNode
+
+    ex = Experiment()
+
+    for i in range(signal_count):
+        chain = [LSLInput(), SpatialFilter(), BandpassFilter(), EnvelopeDetector(), Standardise(), DerivedSignalExport()]
+        chain[1].setMatrixPath("matrix{}.txt".format(i))
+        chain[-1].setSignalName("Signal{}".format(i))
+
+        for j, node in enumerate(chain):
+            node.setPos(j * 250, i * 250)
+            ex.signal_scheme.addItem(node)
+
+        for source, target in zip(chain, chain[1:]):
+            ex.signal_scheme.connect_nodes(source.outputs[0], target.inputs[0])
+
+    last = None
+    for i in range(block_count):
+        name = "Block{}".format(i)
+        ex.blocks[name] = Block()
+
+        node = BlockNode()
+        node.setTitle(name)
+        node.setPos(i * 250, 0)
+        ex.sequence_scheme.addItem(node)
+
+        if last is not None:
+            ex.sequence_scheme.connect_nodes(last.outputs[0], node.inputs[0])
+        last = node
+
+    ex.sequence = list(ex.blocks)
+
+    return ex
+
+
+def measure(func, *args, repeat=5, **kwargs):
+    """Call func several times and return the best time in seconds, along with the result of the last call.
+    Like timeit, garbage collection is disabled while func is running.
+    """
+    best = None
+    result = None
+
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = default_timer()
+            result = func(*args, **kwargs)
+            elapsed = default_timer() - start
+        finally:
+            gc.enable()
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best, result
+
+
+def report(name, seconds, baseline=None):
+    """Print a line with the benchmark result."""
+    line = "{:<40} {:>10.4f} s".format(name, seconds)
+    if baseline is not None:
+        line += "  ({:.2f}x)".format(baseline / seconds)
+
+    print(line)
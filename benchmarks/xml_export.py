@@ -0,0 +1,47 @@
+"""Benchmark of the single-pass XML writer.
+
+Exports a synthetic experiment with hundreds of signals and blocks for NFBLab, with `XMLEncoder.encode` (the encoder
+converts the experiment into dicts and passes them to xmltodict) and with `XMLEncoder.dump`, which writes the XML in a
+single pass. Both must produce identical output.
+"""
+from io import StringIO
+
+from nfb_studio.block import Block
+from nfb_studio.experiment import Experiment
+from nfb_studio.group import Group
+from nfb_studio.serial import xml
+
+from .util import make_experiment, measure, report
+
+
+def dump(encoder, data):
+    file = StringIO()
+    encoder.dump(data, file)
+    return file.getvalue()
+
+
+def main():
+    ex = make_experiment(signal_count=300, block_count=300)
+    print("Exporting an experiment with {} signals and {} blocks".format(300, len(ex.blocks)))
+
+    # Same settings as in Experiment.export
+    hooks = {
+        Experiment: Experiment.nfb_export_data,
+        Block: Block.nfb_export_data,
+        Group: Group.nfb_export_data,
+        bool: lambda x: int(x)
+    }
+    encoder = xml.XMLEncoder(separator="\n", indent="\t", metadata=False, hooks=hooks)
+    data = {"NeurofeedbackSignalSpecs": ex}
+
+    xmltodict_time, xmltodict_result = measure(encoder.encode, data)
+    writer_time, writer_result = measure(dump, encoder, data)
+
+    assert xmltodict_result == writer_result
+
+    report("XMLEncoder.encode (xmltodict)", xmltodict_time)
+    report("XMLEncoder.dump (single pass)", writer_time, baseline=xmltodict_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark of importing large NFBLab experiment files.
+
+Generates exported files with a growing number of sequence entries (`s` elements) and imports them with
+`Experiment.import_xml_file`. Import time per entry should stay constant. Peak memory, allocated by Python, is measured
+for parsing alone, without building the experiment.
+"""
+import tracemalloc
+from io import StringIO
+from xml.etree.ElementTree import iterparse
+
+from nfb_studio.experiment import Experiment
+from nfb_studio.serial.xml import element_to_dict
+
+from .util import make_experiment, measure, report
+
+
+def parse_only(text):
+    """Walk the file the same way import_xml_file does, discarding each sequence entry after it is read."""
+    path = []
+    for event, element in iterparse(StringIO(text), events=("start", "end")):
+        if event == "start":
+            path.append(element)
+            continue
+
+        path.pop()
+        if len(path) == 2:
+            element_to_dict(element)
+            path[-1].remove(element)
+
+
+def main():
+    template = make_experiment(signal_count=50, block_count=10)
+    names = list(template.blocks)
+
+    for count in (1000, 2000, 4000):
+        template.sequence = [names[i % len(names)] for i in range(count)]
+        text = template.export()
+
+        seconds, ex = measure(lambda: Experiment.import_xml_file(StringIO(text)), repeat=1)
+        assert len(ex.sequence_scheme.graph.nodes) == count
+
+        report("import, {} sequence entries".format(count), seconds)
+        print("{:<40} {:>10.2f} us per entry".format("", seconds / count * 1e6))
+
+        tracemalloc.start()
+        parse_only(text)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("{:<40} {:>10.1f} MiB peak (parsing, file is {:.1f} MiB)".format(
+            "", peak / 2**20, len(text) / 2**20
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,26 @@
-"""NFB experiment designer."""
+"""NFB experiment designer.
+
+Classes of the designer are imported when they are first accessed, so that Qt-free parts of this package, such as
+`nfb_studio.model` and `nfb_studio.convert`, can be imported without loading the GUI.
+"""
 import os
 
-from .block import Block, BlockView
-from .group import Group, GroupView
+_exports = {
+    "Block": ".block",
+    "BlockView": ".block",
+    "Group": ".group",
+    "GroupView": ".group",
+    "Experiment": ".experiment",
+    "ExperimentView": ".experiment_view",
+    "GeneralView": ".general_view",
+    "PropertyTree": ".property_tree",
+}
+"""Classes exported by this package. Maps a class name to the module it is defined in."""
+
+
+def __getattr__(name):
+    if name in _exports:
+        from importlib import import_module
+        return getattr(import_module(_exports[name], __name__), name)
 
-from .experiment import Experiment
-from .experiment_view import ExperimentView
-from .general_view import GeneralView
-from .property_tree import PropertyTree
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -1,4 +1,14 @@
-"""Main building block of the experiment."""
+"""Main building block of the experiment.
+
+BlockView is imported when it is first accessed, so that blocks can be used without QtWidgets.
+"""
 from .block import Block
-from .block_view import BlockView
 from .block_dict import BlockDict
+
+
+def __getattr__(name):
+    if name == "BlockView":
+        from .block_view import BlockView
+        return BlockView
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
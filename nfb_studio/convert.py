@@ -0,0 +1,194 @@
+"""Batch converter between nfb_studio experiments and NFBLab XML files.
+
+Converts experiment files without opening the experiment designer. The direction is given with `--to`: `--to xml`
+exports `.nfbex` files to NFBLab `.xml` files, and `--to nfbex` imports `.xml` files into `.nfbex` files. Directories
+are converted file by file. Files are converted in parallel by a pool of worker processes, and the time spent on each
+file is reported. Conversion works on Qt-free experiment models, so no QApplication or display is needed.
+
+Existing files are never overwritten unless `--force` is given. Each file is written to a temporary file first and
+moved into place when it is complete, so a failed conversion does not leave a truncated file behind.
+
+Usage:
+```
+python -m nfb_studio.convert experiments/ --to xml -o protocols/
+python -m nfb_studio.convert protocol.xml --to nfbex --binary
+```
+"""
+import argparse
+import os
+import sys
+import multiprocessing
+from timeit import default_timer
+
+formats = {
+    "xml": ".nfbex",
+    "nfbex": ".xml",
+}
+"""Maps target formats to extensions of the files that are converted into them."""
+
+
+def convert_file(source: str, destination: str, binary=False, force=False):
+    """Convert a single file. The direction is determined by the extension of `source`.
+    If `binary` is True, `.nfbex` files are saved in the compact binary format. If `destination` exists, it is only
+    overwritten if `force` is True.
+    """
+    from nfb_studio.experiment import Experiment
+
+    if not force and os.path.exists(destination):
+        raise FileExistsError("{} already exists (use --force to overwrite)".format(destination))
+
+    extension = os.path.splitext(source)[1].lower()
+
+    if extension == ".nfbex":
+        with open(source, "rb") as file:
+            ex = Experiment.load_file(file)
+
+        write = ex.export_file
+        mode = "w"
+    elif extension == ".xml":
+        with open(source, encoding="utf-8") as file:
+            ex = Experiment.import_xml_file(file)
+
+        if binary:
+            write = lambda file: ex.dump(file, format="binary")
+            mode = "wb"
+        else:
+            write = ex.dump
+            mode = "w"
+    else:
+        raise ValueError("unknown file type \"{}\"".format(extension))
+
+    # Write to a temporary file first, so that an error during encoding does not leave a truncated destination
+    temp_path = destination + ".tmp"
+    try:
+        with open(temp_path, mode, encoding=None if "b" in mode else "utf-8") as file:
+            write(file)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+    os.replace(temp_path, destination)
+
+
+def run_task(task):
+    """Convert a file in a worker process.
+    Returns a tuple (source, destination, seconds, error), where error is None or a string describing the exception.
+    """
+    source, destination, binary, force = task
+
+    start = default_timer()
+    try:
+        convert_file(source, destination, binary, force)
+    except Exception as e:
+        error = "{}: {}".format(type(e).__name__, e)
+    else:
+        error = None
+
+    return (source, destination, default_timer() - start, error)
+
+
+def find_tasks(paths, to, output=None, recursive=False, binary=False, force=False):
+    """Build a list of tasks for `run_task` from a list of files and directories.
+    `to` is the target format, "xml" or "nfbex". Only files that are converted into that format are taken from
+    directories. If `output` is a directory, converted files are placed there, keeping their path relative to the input
+    directory. Otherwise they are placed next to the input files.
+    """
+    source_extension = formats[to]
+    destination_extension = "." + to
+    tasks = []
+    destinations = {}
+
+    def add(source, relative_path):
+        if output is None:
+            destination = os.path.splitext(source)[0] + destination_extension
+        else:
+            destination = os.path.join(output, os.path.splitext(relative_path)[0] + destination_extension)
+
+        key = os.path.normcase(os.path.abspath(destination))
+        if key in destinations:
+            raise ValueError("{} and {} would both be converted to {}".format(destinations[key], source, destination))
+        destinations[key] = source
+
+        tasks.append((source, destination, binary, force))
+
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                if not recursive:
+                    dirnames.clear()
+                dirnames.sort()
+
+                for filename in sorted(filenames):
+                    if os.path.splitext(filename)[1].lower() == source_extension:
+                        source = os.path.join(dirpath, filename)
+                        add(source, os.path.relpath(source, path))
+        elif os.path.splitext(path)[1].lower() == source_extension:
+            add(path, os.path.basename(path))
+        else:
+            raise ValueError("{}: not an {} file (converting to {})".format(path, source_extension, to))
+
+    return tasks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m nfb_studio.convert",
+        description="Convert nfb_studio experiments (.nfbex) to NFBLab files (.xml), and NFBLab files to experiments."
+    )
+    parser.add_argument("paths", nargs="+", metavar="PATH", help="files or directories to convert")
+    parser.add_argument(
+        "-t", "--to", required=True, choices=sorted(formats),
+        help="target format: xml converts .nfbex files to NFBLab files, nfbex converts .xml files to experiments"
+    )
+    parser.add_argument("-o", "--output", help="directory for converted files (default: next to the input files)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="convert files in subdirectories")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(),
+        help="number of worker processes (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--binary", action="store_true", help="save .nfbex files in the compact binary format"
+    )
+    parser.add_argument("-f", "--force", action="store_true", help="overwrite existing files")
+    args = parser.parse_args(argv)
+
+    if args.binary and args.to != "nfbex":
+        parser.error("--binary can only be used with --to nfbex")
+
+    try:
+        tasks = find_tasks(args.paths, args.to, args.output, args.recursive, args.binary, args.force)
+    except ValueError as e:
+        parser.error(str(e))
+
+    for source, destination, binary, force in tasks:
+        os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+
+    start = default_timer()
+    failed = 0
+
+    if args.jobs <= 1 or len(tasks) <= 1:
+        results = map(run_task, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(min(args.jobs, len(tasks)))
+        results = pool.imap_unordered(run_task, tasks)
+
+    try:
+        for source, destination, seconds, error in results:
+            if error is None:
+                print("{:8.3f} s  {} -> {}".format(seconds, source, destination))
+            else:
+                failed += 1
+                print("{:8.3f} s  {}: {}".format(seconds, source, error), file=sys.stderr)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    print("Converted {} of {} files in {:.3f} s".format(len(tasks) - failed, len(tasks), default_timer() - start))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
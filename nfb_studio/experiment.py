@@ -1,12 +1,80 @@
 """NFB Experiment."""
 import re
+from io import StringIO
+from xml.etree.ElementTree import iterparse
 
 from .block import Block, BlockDict
 from .group import Group, GroupDict
-from .serial import json, xml, hooks
-from .scheme import Scheme
-from .signal_nodes import *
-from .sequence_nodes import *
+from .serial import json, xml, binary, hooks, ClassRegistry
+from .serial.base import BaseEncoder, BaseDecoder
+from .serial.xml import element_to_dict
+from .model import data_type
+from .model import (SchemeModel, InputModel, OutputModel, MessageModel, InfoMessageModel, WarningMessageModel,
+                    ErrorMessageModel, LSLInputModel, SpatialFilterModel, BandpassFilterModel, EnvelopeDetectorModel,
+                    StandardiseModel, DerivedSignalExportModel, CompositeSignalExportModel, BlockNodeModel,
+                    GroupNodeModel)
+
+
+_scheme_registry = ClassRegistry(hooks.qt.deserialize, modules=["nfb_studio"])
+"""Classes that can be loaded from an experiment file.
+Only nfb_studio's own classes and classes with library-provided hooks are allowed, so that opening an untrusted file
+never imports arbitrary modules.
+"""
+
+_registry = ClassRegistry(hooks.qt.deserialize, modules=["nfb_studio"])
+"""Same as `_scheme_registry`, except that schemes and their items are loaded as Qt-free models.
+Models are also saved under the names of the classes they stand in for.
+"""
+_saved_names = {
+    SchemeModel: ("nfb_studio.scheme.scheme", "Scheme"),
+    InputModel: ("nfb_studio.scheme.node.connection.input", "Input"),
+    OutputModel: ("nfb_studio.scheme.node.connection.output", "Output"),
+    MessageModel: ("nfb_studio.scheme.node.message", "Message"),
+    InfoMessageModel: ("nfb_studio.scheme.node.message", "InfoMessage"),
+    WarningMessageModel: ("nfb_studio.scheme.node.message", "WarningMessage"),
+    ErrorMessageModel: ("nfb_studio.scheme.node.message", "ErrorMessage"),
+    LSLInputModel: ("nfb_studio.signal_nodes.lsl_input", "LSLInput"),
+    SpatialFilterModel: ("nfb_studio.signal_nodes.spatial_filter", "SpatialFilter"),
+    BandpassFilterModel: ("nfb_studio.signal_nodes.bandpass_filter", "BandpassFilter"),
+    EnvelopeDetectorModel: ("nfb_studio.signal_nodes.envelope_detector", "EnvelopeDetector"),
+    StandardiseModel: ("nfb_studio.signal_nodes.standardise", "Standardise"),
+    DerivedSignalExportModel: ("nfb_studio.signal_nodes.derived_signal_export", "DerivedSignalExport"),
+    CompositeSignalExportModel: ("nfb_studio.signal_nodes.composite_signal_export", "CompositeSignalExport"),
+    BlockNodeModel: ("nfb_studio.sequence_nodes.block_node", "BlockNode"),
+    GroupNodeModel: ("nfb_studio.sequence_nodes.group_node", "GroupNode"),
+}
+"""Maps models to the names of the classes they stand in for, as (module, qualname).
+The names are spelled out instead of taken from the classes, so that loading and exporting experiments does not import
+the GUI.
+"""
+for _model_cls, _name in _saved_names.items():
+    _registry.register(_model_cls, name=_name)
+_registry.register(data_type.DataType, name=data_type.saved_name)
+
+_encoder = json.JSONEncoder(indent="\t", hooks=hooks.qt, registry=_registry, single_pass=True)
+_decoder = json.JSONDecoder(hooks=hooks.qt, registry=_registry)
+_binary_encoder = binary.BinaryEncoder(hooks=hooks.qt, registry=_registry)
+_binary_decoder = binary.BinaryDecoder(hooks=hooks.qt, registry=_registry)
+
+_base_encoder = BaseEncoder(hooks=hooks.qt, registry=_registry)
+_base_decoder = BaseDecoder(hooks=hooks.qt, registry=_registry)
+_scheme_decoder = BaseDecoder(hooks=hooks.qt, registry=_scheme_registry)
+
+
+def _scheme(model: SchemeModel) -> "Scheme":
+    """Create a Scheme with the contents of a SchemeModel.
+    The scheme and node classes are GUI classes. `_scheme_registry` imports them by name when the first scheme is
+    created, so they are not imported until a scheme is opened in the editor.
+    """
+    return _scheme_decoder.decode(_base_encoder.encode(model))
+
+
+def _scheme_model(scheme) -> SchemeModel:
+    """Return a SchemeModel with the contents of `scheme`, which is a Scheme or a SchemeModel."""
+    if isinstance(scheme, SchemeModel):
+        return scheme
+
+    return _base_decoder.decode(_base_encoder.encode(scheme))
 
 
 class Experiment:
@@ -37,8 +105,8 @@ class Experiment:
         self.show_proto_rectangle = False
         self.show_notch_filters = False
 
-        self.signal_scheme = Scheme()
-        self.sequence_scheme = Scheme()
+        self._signal_scheme = SchemeModel()
+        self._sequence_scheme = SchemeModel()
         self.sequence = []
         """A list of nodes that is the subset of scheme to be exported."""
 
@@ -48,6 +116,34 @@ class Experiment:
         self.blocks.setExperiment(self)
         self.groups.setExperiment(self)
     
+    @property
+    def signal_scheme(self) -> "Scheme":
+        """Scheme of the experiment's signals.
+        Until it is first accessed, the scheme is kept as a SchemeModel, which does not create any graphics items.
+        """
+        if isinstance(self._signal_scheme, SchemeModel):
+            self._signal_scheme = _scheme(self._signal_scheme)
+
+        return self._signal_scheme
+
+    @signal_scheme.setter
+    def signal_scheme(self, value):
+        self._signal_scheme = value
+
+    @property
+    def sequence_scheme(self) -> "Scheme":
+        """Scheme of the experiment's sequence of blocks and groups.
+        Until it is first accessed, the scheme is kept as a SchemeModel, which does not create any graphics items.
+        """
+        if isinstance(self._sequence_scheme, SchemeModel):
+            self._sequence_scheme = _scheme(self._sequence_scheme)
+
+        return self._sequence_scheme
+
+    @sequence_scheme.setter
+    def sequence_scheme(self, value):
+        self._sequence_scheme = value
+
     def checkName(self, name: str):
         """Check if a name is appropriate for adding a new block or group.
         Returns a bool (name good or not) and a reason why the name is not good (or None).
@@ -69,6 +165,14 @@ class Experiment:
     
     # Serialization ====================================================================================================
     def export(self) -> str:
+        """Export the experiment into an XML string for NFBLab."""
+        file = StringIO()
+        self.export_file(file)
+
+        return file.getvalue()
+
+    def export_file(self, fp):
+        """Export the experiment for NFBLab, writing XML to a text file object `fp` while it is being encoded."""
         data = {"NeurofeedbackSignalSpecs": self}
 
         enc_hooks = {
@@ -79,50 +183,158 @@ class Experiment:
         }
 
         encoder = xml.XMLEncoder(separator="\n", indent="\t", metadata=False, hooks=enc_hooks)
+        encoder.dump(data, fp)
 
-        return encoder.encode(data)
+    def save(self, format="json"):
+        """Save the experiment.
+        Returns a str if `format` is "json", or bytes if `format` is "binary". The binary format is several times more
+        compact, and is meant for archiving large numbers of experiments.
+        """
+        if format == "json":
+            return json.dumps(self, encoder=_encoder)
+        if format == "binary":
+            return binary.dumps(self, encoder=_binary_encoder)
 
-    def save(self) -> str:
-        encoder = json.JSONEncoder(separator="\n", indent="\t", hooks=hooks.qt)
+        raise ValueError("unknown format \"{}\"".format(format))
 
-        return encoder.encode(self)
+    def dump(self, fp, format="json"):
+        """Save the experiment to a file object `fp`.
+        The result is the same as `save(format)`. For the "json" format `fp` is a text file, and the experiment is
+        written to it while it is being encoded. For the "binary" format `fp` is a binary file.
+        """
+        if format == "json":
+            json.dump(self, fp, encoder=_encoder)
+        elif format == "binary":
+            binary.dump(self, fp, encoder=_binary_encoder)
+        else:
+            raise ValueError("unknown format \"{}\"".format(format))
     
     @classmethod
-    def load(cls, data: str):
-        decoder = json.JSONDecoder(hooks=hooks.qt)
-        return decoder.decode(data)
+    def load(cls, data):
+        """Load an experiment, saved with `save()`.
+        `data` is a str or bytes. The format is detected automatically.
+        """
+        if isinstance(data, (bytes, bytearray)) and binary.is_binary(data):
+            return binary.loads(data, decoder=_binary_decoder)
+
+        return json.loads(data, decoder=_decoder)
+
+    @classmethod
+    def load_file(cls, fp):
+        """Load an experiment from a file object `fp`, saved with `save()` or `dump()`.
+        To open files in any format, `fp` should be opened in binary mode. The format is detected automatically.
+        """
+        return cls.load(fp.read())
 
     @classmethod
     def import_xml(cls, xml_string: str):
         """Decode an XML string containing an exported file into an nfb_studio experiment.
+        See `import_xml_file`.
+        """
+        return cls.import_xml_file(StringIO(xml_string))
+
+    @classmethod
+    def import_xml_file(cls, fp):
+        """Decode an XML file object containing an exported file into an nfb_studio experiment.
         Decoding xml files is an imperfect science, since nfb_studio has more information, like node position, their
         connections, and so on. This function does it's best to at least produce the correct experiment flow.
+
+        The file is parsed incrementally. Signals, blocks, groups and sequence entries are added to the experiment as
+        soon as they are read, and then discarded, so that memory use does not grow with the size of the file.
         """
         ex = cls()
+        data = {}  # Main experiment properties
+        sequence_scheme = ex._sequence_scheme
 
-        # Decode the string --------------------------------------------------------------------------------------------
-        decoder = xml.XMLDecoder(force_list=("DerivedSignal", "CompositeSignal", "FeedbackProtocol", "PGroup", "s"))
-        root = decoder.decode(xml_string)
-        data = next(iter(root.values()))  # Get first (and only) value in root
-
-        # Add empty signal/block/group/sequence lists if they are missing ----------------------------------------------
-        if data["vSignals"] is None:
-            data["vSignals"] = {
-                "DerivedSignal": [],
-                "CompositeSignal": [],
-            }
-        else:
-            if "DerivedSignal" not in data["vSignals"]:
-                data["vSignals"]["DerivedSignal"] = []
-            if "CompositeSignal" not in data["vSignals"]:
-                data["vSignals"]["CompositeSignal"] = []
-        
-        if data["vProtocols"] is None:
-            data["vProtocols"] = {"FeedbackProtocol": []}
-        if data["vPGroups"] is None:
-            data["vPGroups"] = {"PGroup": []}
-        if data["vPSequence"] is None:
-            data["vPSequence"] = {"s": []}
+        signal_pos = [0, 0]  # In inches
+        composite_signals = []  # Added after all derived signals
+
+        sequence_pos = [0, 0]
+        sequence_node = None
+        sequence_pending = []  # Sequence entries, read before all blocks are known
+        blocks_done = False
+
+        def add_sequence_node(name):
+            nonlocal sequence_node
+            last = sequence_node
+
+            if name in ex.blocks:
+                sequence_node = BlockNodeModel()
+            else:
+                sequence_node = GroupNodeModel()
+
+            sequence_node.setTitle(name)
+            sequence_node.setPosition(*sequence_pos)
+            sequence_pos[0] += 2.5
+
+            sequence_scheme.addNode(sequence_node)
+
+            if last is not None:
+                sequence_scheme.connect_nodes(last.outputs[0], sequence_node.inputs[0])
+
+        # Parse the file -----------------------------------------------------------------------------------------------
+        # Elements are processed when they end. Depth 1 is the root, depth 2 are experiment properties and lists of
+        # signals, blocks, etc., depth 3 are the items of these lists.
+        path = []
+
+        for event, element in iterparse(fp, events=("start", "end")):
+            if event == "start":
+                path.append(element)
+                continue
+
+            path.pop()
+            depth = len(path) + 1
+            parent_tag = path[-1].tag if path else None
+
+            if depth == 2:
+                if element.tag == "vProtocols":
+                    blocks_done = True
+                elif element.tag not in ("vSignals", "vPGroups", "vPSequence"):
+                    data[element.tag] = element_to_dict(element)
+            elif depth == 3:
+                if parent_tag == "vSignals" and element.tag == "DerivedSignal":
+                    cls._import_derived_signal(ex, element_to_dict(element), signal_pos)
+                elif parent_tag == "vSignals" and element.tag == "CompositeSignal":
+                    composite_signals.append(element_to_dict(element))
+                elif parent_tag == "vProtocols" and element.tag == "FeedbackProtocol":
+                    block_data = element_to_dict(element)
+                    ex.blocks[block_data["sProtocolName"]] = Block.nfb_import_data(block_data)
+                elif parent_tag == "vPGroups" and element.tag == "PGroup":
+                    group_data = element_to_dict(element)
+                    ex.groups[group_data["sName"]] = Group.nfb_import_data(group_data)
+                elif parent_tag == "vPSequence" and element.tag == "s":
+                    name = element_to_dict(element)
+                    ex.sequence.append(name)
+
+                    if blocks_done:
+                        add_sequence_node(name)
+                    else:
+                        sequence_pending.append(name)
+            else:
+                continue
+
+            # The element was processed, free the memory
+            path[-1].remove(element)
+
+        # Add composite signals separately -----------------------------------------------------------------------------
+        for comp_data in composite_signals:
+            if comp_data is None:
+                continue
+
+            n = CompositeSignalExportModel()
+            n.setSignalName(comp_data["sSignalName"])
+            n.setExpression(comp_data["sExpression"])
+
+            # Set position and add to scheme
+            n.setPosition(*signal_pos)
+            signal_pos[0] = 0
+            signal_pos[1] += 2.5
+
+            ex._signal_scheme.addNode(n)
+
+        # Add sequence entries that appeared before the blocks ---------------------------------------------------------
+        for name in sequence_pending:
+            add_sequence_node(name)
 
         # Decode main experiment properties ----------------------------------------------------------------------------
         ex.name = data["sExperimentName"]
@@ -152,135 +364,87 @@ class Experiment:
         ex.show_proto_rectangle = bool(float(data.get("bShowPhotoRectangle", ex.show_proto_rectangle)))
         ex.show_notch_filters = bool(float(data.get("sVizNotchFilters", ex.show_notch_filters)))
 
-        # Decode signals -----------------------------------------------------------------------------------------------
-        node_pos = [0, 0]
-        node_xdiff = -250  # TODO: Change to a size dependent on node default width
-        node_ydiff = 250
-
-        for signal_data in data["vSignals"]["DerivedSignal"]:
-            # Assemble the signal front to back, starting with the signal name.
-            # Some nodes may not be present, this loop accounts for it.
-            if "sSignalName" in signal_data:
-                # Create the node and set variables from data
-                n = DerivedSignalExport()
-                n.setSignalName(signal_data["sSignalName"])
-
-                # Set position and add to scheme
-                n.setPos(*node_pos)
-                node_pos[0] += node_xdiff
-
-                ex.signal_scheme.addItem(n)
-            if (signal_data.get("fAverage") is not None) or (signal_data.get("fStdDev") is not None):
-                last = n
-                n = Standardise()
-                n.setAverage(float(signal_data.get("fAverage", n.default_average)))
-                n.setStandardDeviation(float(signal_data.get("fStdDev", n.default_standard_deviation)))
-
-                n.setPos(*node_pos)
-                node_pos[0] += node_xdiff
-
-                ex.signal_scheme.addItem(n)
-                ex.signal_scheme.connect_nodes(n.outputs[0], last.inputs[0])
-            if ("fSmoothingFactor" in signal_data) or ("method" in signal_data):
-                last = n
-                n = EnvelopeDetector()
-                n.setSmoothingFactor(float(signal_data.get("fSmoothingFactor", n.default_smoothing_factor)))
-                n.setMethod(signal_data.get("method", n.default_method))
-
-                n.setPos(*node_pos)
-                node_pos[0] += node_xdiff
-
-                ex.signal_scheme.addItem(n)
-                ex.signal_scheme.connect_nodes(n.outputs[0], last.inputs[0])
-            if ("fBandpassLowHz" in signal_data) or ("fBandpassHighHz" in signal_data):
-                last = n
-                n = BandpassFilter()
-                n.setLowerBound(float(signal_data.get("fBandpassLowHz", n.default_lower_bound)))
-                n.setUpperBound(float(signal_data.get("fBandpassHighHz", n.default_upper_bound)))
-
-                n.setPos(*node_pos)
-                node_pos[0] += node_xdiff
-
-                ex.signal_scheme.addItem(n)
-                ex.signal_scheme.connect_nodes(n.outputs[0], last.inputs[0])
-            if "SpatialFilterMatrix" in signal_data:
-                last = n
-                n = SpatialFilter()
-                n.setMatrixPath(signal_data["SpatialFilterMatrix"])
-
-                n.setPos(*node_pos)
-                node_pos[0] += node_xdiff
-
-                ex.signal_scheme.addItem(n)
-                ex.signal_scheme.connect_nodes(n.outputs[0], last.inputs[0])
-            # Unconditionally add LSLInput
-            last = n
-            n = LSLInput()
+        # --------------------------------------------------------------------------------------------------------------
+        return ex
 
-            n.setPos(*node_pos)
-            node_pos[0] += node_xdiff
+    @staticmethod
+    def _import_derived_signal(ex, signal_data: dict, node_pos: list):
+        """Add a chain of nodes for a derived signal from an exported file to the experiment's signal scheme.
+        `node_pos` is the position of the first node in inches, it is advanced to the position of the next signal.
+        """
+        scheme = ex._signal_scheme
 
-            ex.signal_scheme.addItem(n)
-            ex.signal_scheme.connect_nodes(n.outputs[0], last.inputs[0])
+        node_xdiff = -2.5  # TODO: Change to a size dependent on node default width
+        node_ydiff = 2.5
 
-            # Bump vertial coordinates to prepare for a new signal
-            node_pos[0] = 0
-            node_pos[1] += node_ydiff
+        # Assemble the signal front to back, starting with the signal name.
+        # Some nodes may not be present, this function accounts for it.
+        if "sSignalName" in signal_data:
+            # Create the node and set variables from data
+            n = DerivedSignalExportModel()
+            n.setSignalName(signal_data["sSignalName"])
 
-        # Add composite signals separately
-        for comp_data in data["vSignals"]["CompositeSignal"]:
-            if comp_data is None:
-                continue
+            # Set position and add to scheme
+            n.setPosition(*node_pos)
+            node_pos[0] += node_xdiff
 
-            n = CompositeSignalExport()
-            n.setSignalName(comp_data["sSignalName"])
-            n.setExpression(comp_data["sExpression"])
+            scheme.addNode(n)
+        if (signal_data.get("fAverage") is not None) or (signal_data.get("fStdDev") is not None):
+            last = n
+            n = StandardiseModel()
+            n.setAverage(float(signal_data.get("fAverage", n.default_average)))
+            n.setStandardDeviation(float(signal_data.get("fStdDev", n.default_standard_deviation)))
 
-            # Set position and add to scheme
-            n.setPos(*node_pos)
-            node_pos[0] = 0
-            node_pos[1] += node_ydiff
+            n.setPosition(*node_pos)
+            node_pos[0] += node_xdiff
 
-            ex.signal_scheme.addItem(n)
+            scheme.addNode(n)
+            scheme.connect_nodes(n.outputs[0], last.inputs[0])
+        if ("fSmoothingFactor" in signal_data) or ("method" in signal_data):
+            last = n
+            n = EnvelopeDetectorModel()
+            n.setSmoothingFactor(float(signal_data.get("fSmoothingFactor", n.default_smoothing_factor)))
+            n.setMethod(signal_data.get("method", n.default_method))
 
-        # Decode blocks ------------------------------------------------------------------------------------------------
-        for block_data in data["vProtocols"]["FeedbackProtocol"]:
-            block = Block.nfb_import_data(block_data)
-            name = block_data["sProtocolName"]
-            ex.blocks[name] = block
-        
-        # Decode groups ------------------------------------------------------------------------------------------------
-        for group_data in data["vPGroups"]["PGroup"]:
-            group = Group.nfb_import_data(group_data)
-            name = group_data["sName"]
-            ex.groups[name] = group
-        
-        # Decode sequence ----------------------------------------------------------------------------------------------
-        ex.sequence = data["vPSequence"]["s"]
+            n.setPosition(*node_pos)
+            node_pos[0] += node_xdiff
 
-        node = None
-        node_pos = [0, 0]
-        node_xdiff = 250
+            scheme.addNode(n)
+            scheme.connect_nodes(n.outputs[0], last.inputs[0])
+        if ("fBandpassLowHz" in signal_data) or ("fBandpassHighHz" in signal_data):
+            last = n
+            n = BandpassFilterModel()
+            n.setLowerBound(float(signal_data.get("fBandpassLowHz", n.default_lower_bound)))
+            n.setUpperBound(float(signal_data.get("fBandpassHighHz", n.default_upper_bound)))
 
-        for name in ex.sequence:
-            last = node
+            n.setPosition(*node_pos)
+            node_pos[0] += node_xdiff
 
-            if name in ex.blocks:
-                node = BlockNode()
-            else:
-                node = GroupNode()
+            scheme.addNode(n)
+            scheme.connect_nodes(n.outputs[0], last.inputs[0])
+        if "SpatialFilterMatrix" in signal_data:
+            last = n
+            n = SpatialFilterModel()
+            n.setMatrixPath(signal_data["SpatialFilterMatrix"] or "")  # An empty element is read as None
 
-            node.setTitle(name)
-            node.setPos(*node_pos)
+            n.setPosition(*node_pos)
             node_pos[0] += node_xdiff
 
-            ex.sequence_scheme.addItem(node)
+            scheme.addNode(n)
+            scheme.connect_nodes(n.outputs[0], last.inputs[0])
+        # Unconditionally add LSLInput
+        last = n
+        n = LSLInputModel()
 
-            if last is not None:
-                ex.sequence_scheme.connect_nodes(last.outputs[0], node.inputs[0])
+        n.setPosition(*node_pos)
+        node_pos[0] += node_xdiff
 
-        # --------------------------------------------------------------------------------------------------------------
-        return ex
+        scheme.addNode(n)
+        scheme.connect_nodes(n.outputs[0], last.inputs[0])
+
+        # Bump vertial coordinates to prepare for a new signal
+        node_pos[0] = 0
+        node_pos[1] += node_ydiff
 
     def serialize(self) -> dict:
         return {
@@ -299,8 +463,8 @@ class Experiment:
             "reference_sub": self.reference_sub,
             "show_proto_rectangle": self.show_proto_rectangle,
             "show_notch_filters": self.show_notch_filters,
-            "signal_scheme": self.signal_scheme,
-            "sequence_scheme": self.sequence_scheme,
+            "signal_scheme": self._signal_scheme,
+            "sequence_scheme": self._sequence_scheme,
             "blocks": self.blocks,
             "groups": self.groups,
             "sequence": self.sequence
@@ -384,8 +548,10 @@ class Experiment:
         signals = []
 
         # Build a list of lists of nodes (e.g. list of sequences)
-        for node in self.signal_scheme.graph.nodes:
-            if isinstance(node, DerivedSignalExport):
+        signal_scheme = _scheme_model(self._signal_scheme)
+
+        for node in signal_scheme.nodes:
+            if isinstance(node, DerivedSignalExportModel):
                 signal = []
                 n = node
 
@@ -415,8 +581,8 @@ class Experiment:
         # Composite signals --------------------------------------------------------------------------------------------
         signals = []
 
-        for node in self.signal_scheme.graph.nodes:
-            if isinstance(node, CompositeSignalExport):
+        for node in signal_scheme.nodes:
+            if isinstance(node, CompositeSignalExportModel):
                 signal = {}
                 node.add_nfb_export_data(signal)
                 signals.append(signal)
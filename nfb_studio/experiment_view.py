@@ -180,7 +180,7 @@ class ExperimentView(QMainWindow):
         self.general_view.updateModel(ex)
 
         # Write the selected sequence
-        ex.sequence = [node.title() for node in self.sequence_editor.selectedSequence()[1]]
+        ex.sequence = [node.title() for node in self.sequence_editor.selectedSequence()]
 
     def updateView(self):
         ex = self.model()
@@ -239,9 +239,9 @@ class ExperimentView(QMainWindow):
             ex.groups.itemAdded.emit(name)
         
         # Sequence -----------------------------------------------------------------------------------------------------
-        for sgraph, slist, button in self.sequence_editor.sequences():
-            if ex.sequence == [node.title() for node in slist]:
-                button.setChecked(True)
+        for sequence in self.sequence_editor.sequences():
+            if ex.sequence == [node.title() for node in sequence]:
+                self.sequence_editor.setSelectedSequence(sequence)
                 break
 
     def _onBlockAdded(self, name):
@@ -316,10 +316,7 @@ class ExperimentView(QMainWindow):
                 node.setTitle(new_name)
         
         # Rename it in the sequence editor's current sequence widget
-        for _1, _2, button in self.sequence_editor.sequences():
-            label = button.text()
-            new_label = " → ".join([new_name if x == old_name else x for x in label.split(" → ")])
-            button.setText(new_label)
+        self.sequence_editor.sequence_list.updateTitles()
 
     def _onGroupRenamed(self, old_name, new_name):
         """Function that gets called when a group has been renamed."""
@@ -349,10 +346,7 @@ class ExperimentView(QMainWindow):
                 node.setTitle(new_name)
         
         # Rename it in the sequence editor's current sequence widget
-        for _1, _2, button in self.sequence_editor.sequences():
-            label = button.text()
-            new_label = " → ".join([new_name if x == old_name else x for x in label.split(" → ")])
-            button.setText(new_label)
+        self.sequence_editor.sequence_list.updateTitles()
 
     def _onBlockRemoved(self, name):
         """Function that gets called when a block has been removed from the experiment."""
@@ -424,8 +418,6 @@ class ExperimentView(QMainWindow):
             self.central_widget.setCurrentWidget(self.sequence_editor)
             return False
 
-        data = self.model().export()
-
         file_path = QFileDialog.getSaveFileName(filter="XML Files (*.xml)")[0]
         if file_path == "":
             return False  # Action was cancelled
@@ -433,8 +425,7 @@ class ExperimentView(QMainWindow):
         if os.path.splitext(file_path)[1] == "":  # No extension
             file_path = file_path + ".xml"
 
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(data)
+        self.fileExport(file_path)
         return True
 
     def actionSave(self) -> bool:
@@ -491,9 +482,8 @@ class ExperimentView(QMainWindow):
             return False
 
         with open(file_path, encoding="utf-8") as file:
-            data = file.read()
+            ex = Experiment.import_xml_file(file)
         
-        ex = Experiment.import_xml(data)
         self.setModel(ex)
         return True
 
@@ -513,8 +503,6 @@ class ExperimentView(QMainWindow):
         if results_path == "":
             return False  # Action was cancelled
 
-        data = self.model().export()
-
         temp_dir = QDir.tempPath() + "/nfb_studio"
         os.makedirs(temp_dir, exist_ok=True)
 
@@ -529,8 +517,7 @@ class ExperimentView(QMainWindow):
             timestamp.second
         )
 
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(data)
+        self.fileExport(file_path)
         
         proc = Process(target=run, args=(file_path, results_path))
         proc.start()
@@ -565,16 +552,36 @@ class ExperimentView(QMainWindow):
 
     # File operations ==================================================================================================
     def fileOpen(self, path):
-        with open(path, encoding="utf-8") as file:
-            data = file.read()
+        with open(path, "rb") as file:
+            ex = Experiment.load_file(file)
         
-        ex = Experiment.load(data)
         self.setModel(ex)
         self._save_path = path
 
     def fileSave(self, path):
         self.updateModel()
-        data = self.model().save()
 
-        with open(path, "w", encoding="utf-8") as file:
-            file.write(data)
+        # The experiment is written while it is being encoded. Write it to a temporary file first, so that an error
+        # during encoding does not destroy the previously saved file.
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                self.model().dump(file)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        os.replace(temp_path, path)
+
+    def fileExport(self, path):
+        """Export the experiment for NFBLab into an XML file at `path`."""
+        # Same as in fileSave, an error during encoding must not leave a truncated file in place of the previous one
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                self.model().export_file(file)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        os.replace(temp_path, path)
@@ -1,4 +1,14 @@
-"""A group of experiment blocks."""
+"""A group of experiment blocks.
+
+GroupView is imported when it is first accessed, so that groups can be used without QtWidgets.
+"""
 from .group import Group
-from .group_view import GroupView
 from .group_dict import GroupDict
+
+
+def __getattr__(name):
+    if name == "GroupView":
+        from .group_view import GroupView
+        return GroupView
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,16 @@
+"""Qt-free models of the experiment's schemes and their nodes.
+
+Nodes and schemes in the experiment designer are graphics items: constructing one creates fonts, text layouts and other
+graphics objects, and requires a QApplication. Models keep the same data without any of that: the graph of a scheme,
+and the title, position, connections and parameters of each node. A model is stored in a file the same way as the
+corresponding graphics item, so files can be loaded, saved and exported without creating a single graphics item.
+Experiment creates the schemes from the models when they are first needed.
+"""
+from .data_type import DataType, convertible
+from .node import (NodeModel, ConnectionModel, InputModel, OutputModel, MessageModel, InfoMessageModel,
+                   WarningMessageModel, ErrorMessageModel)
+from .scheme import SchemeModel, EdgeModel
+from .signal_nodes import (SignalNodeModel, LSLDataSource, LSLInputModel, SpatialFilterModel, BandpassFilterModel,
+                           EnvelopeDetectorModel, StandardiseModel, DerivedSignalExportModel,
+                           CompositeSignalExportModel)
+from .sequence_nodes import BlockNodeModel, GroupNodeModel
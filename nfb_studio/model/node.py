@@ -0,0 +1,282 @@
+"""Qt-free models of nodes, their connections and messages."""
+from PySide2.QtCore import QPointF
+from sortedcontainers import SortedList
+
+from nfb_studio.util import OrderedSet
+
+from .data_type import DataType
+
+
+class ConnectionModel:
+    """Model of a Connection: an input or output of a node."""
+
+    def __init__(self, text=None, datatype: DataType = None):
+        self.edges = OrderedSet()
+        """Edges attached to this connection. This set is managed by SchemeModel."""
+
+        self._node = None
+        self._index = None
+        self._item_id = None
+        self._text = text or "Connection"
+        self._datatype = datatype or DataType.Unknown
+        self._is_multiple = False
+
+    def node(self):
+        """Return the node that this connection belongs to, or None."""
+        return self._node
+
+    def index(self):
+        """Return the position of this connection in its node's list of inputs or outputs, or None."""
+        return self._index
+
+    def itemId(self):
+        return self._item_id
+
+    def setItemId(self, item_id):
+        self._item_id = item_id
+
+    def text(self):
+        return self._text
+
+    def dataType(self):
+        return self._datatype
+
+    def isMultiple(self):
+        return self._is_multiple
+
+    def setText(self, text):
+        self._text = text
+
+    def setDataType(self, datatype):
+        self._datatype = datatype
+
+    def setMultiple(self, multiple: bool):
+        self._is_multiple = multiple
+
+    # Serialization ====================================================================================================
+    def serialize(self) -> dict:
+        return {
+            "id": self.itemId(),
+            "text": self.text(),
+            "datatype": self.dataType(),
+            "is_multiple": self.isMultiple(),
+        }
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = cls()
+        obj.setItemId(data.get("id"))
+        obj.setText(data["text"])
+        obj.setDataType(data["datatype"])
+        obj.setMultiple(data["is_multiple"])
+
+        return obj
+
+
+class InputModel(ConnectionModel):
+    """Model of an Input."""
+
+    def __init__(self, text=None, datatype: DataType = None):
+        super().__init__(text or "Input", datatype)
+        self.setMultiple(False)
+
+
+class OutputModel(ConnectionModel):
+    """Model of an Output."""
+
+    def __init__(self, text=None, datatype: DataType = None):
+        super().__init__(text or "Output", datatype)
+        self.setMultiple(True)
+
+
+class MessageModel:
+    """Model of a Message, displayed below a node."""
+
+    def __init__(self, text=None):
+        self._text = text or "Message"
+
+    @classmethod
+    def severity(cls):
+        """Message severity: how important is this message. Lower is more important."""
+        return 0
+
+    def setText(self, text):
+        self._text = text
+
+    def text(self):
+        return self._text
+
+    # Serialization ====================================================================================================
+    def serialize(self) -> dict:
+        return {
+            "text": self.text()
+        }
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = cls()
+        obj.setText(data["text"])
+
+        return obj
+
+
+class InfoMessageModel(MessageModel):
+    def __init__(self, text=None):
+        super().__init__(text or "Info message")
+
+    @classmethod
+    def severity(cls):
+        return 3
+
+
+class WarningMessageModel(MessageModel):
+    def __init__(self, text=None):
+        super().__init__(text or "Warning message")
+
+    @classmethod
+    def severity(cls):
+        return 2
+
+
+class ErrorMessageModel(MessageModel):
+    def __init__(self, text=None):
+        super().__init__(text or "Error message")
+
+    @classmethod
+    def severity(cls):
+        return 1
+
+
+class NodeModel:
+    """Model of a Node: its title, description, position, connections and messages.
+
+    Unlike Node, the position of a model is measured in inches, the same way it is stored in a file.
+    """
+
+    def __init__(self):
+        self._title = "Node"
+        self._description = "No description"
+        self._position = QPointF()
+        self._item_id = None
+        self._scheme = None
+        """SchemeModel that contains this node. Used to give IDs to new connections. This value is managed by
+        SchemeModel.
+        """
+
+        self.inputs = []
+        self.outputs = []
+        self.messages = SortedList(key=lambda item: item.severity())
+
+    # Input/output management ==========================================================================================
+    def addInput(self, obj: InputModel):
+        self.inputs.append(obj)
+        obj._node = self
+        obj._index = len(self.inputs) - 1
+        if self._scheme is not None:
+            self._scheme._register(obj)
+
+    def removeInput(self, index):
+        removed = self.inputs.pop(index)
+        removed._node = None
+        removed._index = None
+        if self._scheme is not None:
+            self._scheme._unregister(removed)
+        _reindex(self.inputs)
+
+        return removed
+
+    def addOutput(self, obj: OutputModel):
+        self.outputs.append(obj)
+        obj._node = self
+        obj._index = len(self.outputs) - 1
+        if self._scheme is not None:
+            self._scheme._register(obj)
+
+    def removeOutput(self, index):
+        removed = self.outputs.pop(index)
+        removed._node = None
+        removed._index = None
+        if self._scheme is not None:
+            self._scheme._unregister(removed)
+        _reindex(self.outputs)
+
+        return removed
+
+    # Message management ===============================================================================================
+    def addMessage(self, obj: MessageModel):
+        self.messages.add(obj)
+
+    def removeMessage(self, index):
+        return self.messages.pop(index)
+
+    # Member variables =================================================================================================
+    def setTitle(self, title):
+        self._title = title
+
+    def setDescription(self, description):
+        self._description = description
+
+    def setItemId(self, item_id):
+        self._item_id = item_id
+
+    def setPosition(self, x, y):
+        """Set the position of the node in inches."""
+        self._position = QPointF(x, y)
+
+    def title(self):
+        return self._title
+
+    def description(self):
+        return self._description
+
+    def position(self) -> QPointF:
+        """Return the position of the node in inches."""
+        return self._position
+
+    def itemId(self):
+        return self._item_id
+
+    # Serialization ====================================================================================================
+    def serialize(self) -> dict:
+        return {
+            "id": self.itemId(),
+            "title": self.title(),
+            "description": self.description(),
+            "inputs": self.inputs,
+            "outputs": self.outputs,
+            "messages": list(self.messages),
+            "position": self.position()
+        }
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = cls()
+        obj.setItemId(data.get("id"))
+        obj.setTitle(data["title"])
+        obj.setDescription(data["description"])
+        obj._position = data["position"]
+
+        for i in range(len(obj.inputs)):
+            obj.removeInput(0)
+
+        for i in range(len(obj.outputs)):
+            obj.removeOutput(0)
+
+        obj.messages.clear()
+
+        for input in data["inputs"]:
+            obj.addInput(input)
+
+        for output in data["outputs"]:
+            obj.addOutput(output)
+
+        for message in data["messages"]:
+            obj.addMessage(message)
+
+        return obj
+
+
+def _reindex(connections: list):
+    """Update indexes of connections after one of them is removed."""
+    for i, connection in enumerate(connections):
+        connection._index = i
@@ -0,0 +1,160 @@
+"""Qt-free model of a scheme: a graph of nodes and edges."""
+from typing import Union
+
+from .node import NodeModel, InputModel, OutputModel
+
+
+class EdgeModel:
+    """Model of an Edge: a connection between an output of one node and an input of another."""
+
+    def __init__(self, source: OutputModel, target: InputModel):
+        self._source = source
+        self._target = target
+        self._item_id = None
+
+    def source(self) -> OutputModel:
+        return self._source
+
+    def target(self) -> InputModel:
+        return self._target
+
+    def sourceNode(self) -> Union[NodeModel, None]:
+        return self._source.node()
+
+    def targetNode(self) -> Union[NodeModel, None]:
+        return self._target.node()
+
+    def itemId(self):
+        return self._item_id
+
+    def setItemId(self, item_id):
+        self._item_id = item_id
+
+
+class SchemeModel:
+    """Model of a Scheme: a graph of node models and edges between them.
+
+    A SchemeModel is stored in a file exactly the same way as a Scheme, so either of them can be loaded from the same
+    data. Nodes and edges are kept in the order they were added, and are given integer IDs the same way Graph does.
+    """
+
+    def __init__(self):
+        self.nodes = []
+        self.edges = []
+
+        self._items = {}
+        """Nodes, connections and edges by their ID. Maps an integer ID to an item."""
+        self._next_id = 0
+        """The lowest ID that is guaranteed to be free."""
+
+    def _register(self, item):
+        """Give an item an ID that is unique in this scheme, and remember it."""
+        item_id = item.itemId()
+
+        if item_id is None or self._items.get(item_id, item) is not item:
+            while self._next_id in self._items:
+                self._next_id += 1
+
+            item_id = self._next_id
+            item.setItemId(item_id)
+
+        self._items[item_id] = item
+        self._next_id = max(self._next_id, item_id + 1)
+
+    def item(self, item_id: int):
+        """Return a node, connection or edge of this scheme by its ID, or None if there is no such item."""
+        return self._items.get(item_id)
+
+    def _unregister(self, item):
+        if self._items.get(item.itemId()) is item:
+            del self._items[item.itemId()]
+
+    def addNode(self, node: NodeModel):
+        self.nodes.append(node)
+        node._scheme = self
+
+        self._register(node)
+        for connection in node.inputs + node.outputs:
+            self._register(connection)
+
+    def connect_nodes(self, source: OutputModel, target: InputModel) -> EdgeModel:
+        """Connect an output to an input with an edge.
+
+        Returns the newly created edge.
+        """
+        edge = EdgeModel(source, target)
+        source.edges.add(edge)
+        target.edges.add(edge)
+
+        self.edges.append(edge)
+        self._register(edge)
+        return edge
+
+    # Serialization ====================================================================================================
+    def serialize(self) -> dict:
+        edges = []
+        node_index = {node: i for i, node in enumerate(self.nodes)}
+
+        for edge in self.edges:
+            edges.append({
+                "id": edge.itemId(),
+                "source": {
+                    "id": edge.source().itemId(),
+                    "node_index": node_index[edge.sourceNode()],
+                    "connection_index": edge.source().index()
+                },
+                "target": {
+                    "id": edge.target().itemId(),
+                    "node_index": node_index[edge.targetNode()],
+                    "connection_index": edge.target().index()
+                }
+            })
+
+        return {
+            "nodes": self.nodes,
+            "edges": edges
+        }
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = cls()
+
+        # Connections by the ID they were saved with, before adding nodes to the scheme can change it
+        connections = {}
+        for node in data["nodes"]:
+            for connection in node.inputs + node.outputs:
+                connections[connection.itemId()] = connection
+
+        for node in data["nodes"]:
+            obj.addNode(node)
+
+        for edge_data in data["edges"]:
+            source = find_connection(data["nodes"], connections, edge_data["source"], "outputs")
+            target = find_connection(data["nodes"], connections, edge_data["target"], "inputs")
+
+            edge = EdgeModel(source, target)
+            source.edges.add(edge)
+            target.edges.add(edge)
+            edge.setItemId(edge_data.get("id"))
+
+            obj.edges.append(edge)
+            obj._register(edge)
+
+        return obj
+
+
+def find_connection(nodes: list, connections: dict, data, kind: str):
+    """Find the connection that an edge refers to in serialized data.
+    `data` is a dict with the connection's ID and its node and connection indices, or just the ID. `kind` is "inputs" or
+    "outputs". `connections` maps IDs to connections of `nodes`. Files saved before item IDs were introduced only have
+    the indices.
+    This function is shared by SchemeModel and Graph.
+    """
+    if not isinstance(data, dict):
+        return connections[data]
+
+    if data.get("id") is not None and data["id"] in connections:
+        return connections[data["id"]]
+
+    node = nodes[data["node_index"]]
+    return getattr(node, kind)[data["connection_index"]]
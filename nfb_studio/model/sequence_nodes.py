@@ -0,0 +1,22 @@
+"""Qt-free models of sequence nodes."""
+from .data_type import DataType
+
+from .node import NodeModel, InputModel, OutputModel
+
+
+class BlockNodeModel(NodeModel):
+    def __init__(self):
+        super().__init__()
+
+        self.setTitle("Block")
+        self.addInput(InputModel("Input", DataType.Unknown))
+        self.addOutput(OutputModel("Output", DataType.Unknown))
+
+
+class GroupNodeModel(NodeModel):
+    def __init__(self):
+        super().__init__()
+
+        self.setTitle("Group")
+        self.addInput(InputModel("Input", DataType.Unknown))
+        self.addOutput(OutputModel("Output", DataType.Unknown))
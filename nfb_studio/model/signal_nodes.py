@@ -0,0 +1,395 @@
+"""Qt-free models of signal nodes.
+
+A model keeps the parameters of a signal node and knows how to describe and export them. Signal nodes in the signal
+designer keep their parameters in a model of the corresponding type.
+"""
+from .data_type import DataType
+
+from .node import NodeModel, InputModel, OutputModel
+
+
+class SignalNodeModel(NodeModel):
+    """Model of a SignalNode.
+    The description of a signal node is generated from its parameters.
+    """
+
+    def description(self):
+        return ""
+
+    def add_nfb_export_data(self, signal: dict):
+        """Add this node's data to the dict representation of the signal."""
+        pass
+
+
+class LSLDataSource:
+    def __init__(self, name=None, channel_count=None, frequency=None):
+        self.name = name
+        self.channel_count = channel_count
+        self.frequency = frequency
+
+
+class LSLInputModel(SignalNodeModel):
+    data_sources = [
+        LSLDataSource("NVX136_Data", 32, 500),
+        LSLDataSource("Mitsar", 30, 250),
+    ]
+
+    output_type = DataType(100)
+
+    def __init__(self):
+        super().__init__()
+
+        self.setTitle("LSL Input")
+        self.addOutput(OutputModel("LSL data stream", self.output_type))
+
+        self._data_source = self.data_sources[0].name
+
+    def dataSource(self):
+        return self._data_source
+
+    def setDataSource(self, source: str, /):
+        # TODO: Perform a check that this data source exists
+        self._data_source = source
+
+    def description(self):
+        ds = [x for x in self.data_sources if x.name == self.dataSource()][0]
+
+        return "{}\n{} channels\n{} Hz".format(
+            ds.name,
+            ds.channel_count,
+            ds.frequency,
+        )
+
+    # Serialization ====================================================================================================
+    def serialize(self) -> dict:
+        data = super().serialize()
+
+        data["data_source"] = self.dataSource()
+        return data
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = super().deserialize(data)
+        obj.setDataSource(data["data_source"])
+
+        return obj
+
+
+class SpatialFilterModel(SignalNodeModel):
+    input_type = LSLInputModel.output_type
+    output_type = DataType(101)
+
+    default_matrix_path = ""
+
+    def __init__(self):
+        super().__init__()
+
+        self.setTitle("Spatial Filter")
+        self.addInput(InputModel("Input", self.input_type))
+        self.addOutput(OutputModel("Output", self.output_type))
+
+        self._matrix_path = self.default_matrix_path
+
+    def matrixPath(self) -> str:
+        return self._matrix_path
+
+    def setMatrixPath(self, matrix_path: str, /):
+        self._matrix_path = matrix_path
+
+    def description(self):
+        if self.matrixPath() == "":
+            return "No Matrix"
+
+        return self.matrixPath()
+
+    # Serialization ====================================================================================================
+    def add_nfb_export_data(self, signal: dict):
+        signal["SpatialFilterMatrix"] = self.matrixPath()
+
+    def serialize(self) -> dict:
+        data = super().serialize()
+
+        data["matrix_path"] = self.matrixPath()
+        return data
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = super().deserialize(data)
+        obj.setMatrixPath(data["matrix_path"])
+
+        return obj
+
+
+class BandpassFilterModel(SignalNodeModel):
+    input_type = SpatialFilterModel.output_type
+    output_type = DataType(102)
+
+    default_lower_bound = 0
+    default_upper_bound = 250
+
+    def __init__(self):
+        super().__init__()
+
+        self.setTitle("Bandpass Filter")
+        self.addInput(InputModel("Input", self.input_type))
+        self.addOutput(OutputModel("Output", self.output_type))
+
+        self._lower_bound = self.default_lower_bound
+        self._upper_bound = self.default_upper_bound
+
+    def lowerBound(self):
+        return self._lower_bound
+
+    def upperBound(self):
+        return self._upper_bound
+
+    def setLowerBound(self, value, /):
+        self._lower_bound = value
+
+    def setUpperBound(self, value, /):
+        self._upper_bound = value
+
+    def description(self):
+        lower_bound = self.lowerBound()
+        if self.lowerBound() is None:
+            lower_bound = ""
+
+        upper_bound = self.upperBound()
+        if self.upperBound() is None:
+            upper_bound = ""
+
+        return "Range: {}~{} Hz".format(lower_bound, upper_bound)
+
+    # Serialization ====================================================================================================
+    def add_nfb_export_data(self, signal: dict):
+        signal["fBandpassLowHz"] = self.lowerBound()
+        signal["fBandpassHighHz"] = self.upperBound()
+
+    def serialize(self) -> dict:
+        data = super().serialize()
+
+        data["lower_bound"] = self.lowerBound()
+        data["upper_bound"] = self.upperBound()
+        return data
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = super().deserialize(data)
+        obj.setLowerBound(data["lower_bound"])
+        obj.setUpperBound(data["upper_bound"])
+
+        return obj
+
+
+class EnvelopeDetectorModel(SignalNodeModel):
+    input_type = DataType(103, convertible_from=[SpatialFilterModel.output_type, BandpassFilterModel.output_type])
+    output_type = DataType(104)
+
+    default_smoothing_factor = 0.0  # TODO: Is this the correct default value?
+    default_method = "Rectification"
+
+    def __init__(self):
+        super().__init__()
+
+        self.setTitle("Envelope Detector")
+        self.addInput(InputModel("Input", self.input_type))
+        self.addOutput(OutputModel("Output", self.output_type))
+
+        self._smoothing_factor = self.default_smoothing_factor
+        self._method = self.default_method
+
+    def smoothingFactor(self) -> float:
+        return self._smoothing_factor
+
+    def setSmoothingFactor(self, factor: float, /):
+        self._smoothing_factor = factor
+
+    def method(self) -> str:
+        return self._method
+
+    def setMethod(self, method: str, /):
+        self._method = method
+
+    def description(self):
+        return "Smoothing Factor: x{}\nMethod: {}".format(
+            self.smoothingFactor(),
+            self.method()
+        )
+
+    # Serialization ====================================================================================================
+    def add_nfb_export_data(self, signal: dict):
+        signal["fSmoothingFactor"] = self.smoothingFactor()
+        signal["method"] = self.method()
+
+    def serialize(self) -> dict:
+        data = super().serialize()
+
+        data["smoothing_factor"] = self.smoothingFactor()
+        data["method"] = self.method()
+        return data
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = super().deserialize(data)
+        obj.setSmoothingFactor(data["smoothing_factor"])
+        obj.setMethod(data["method"])
+
+        return obj
+
+
+class StandardiseModel(SignalNodeModel):
+    input_type = DataType(105, convertible_from=[
+        SpatialFilterModel.output_type,
+        BandpassFilterModel.output_type,
+        EnvelopeDetectorModel.output_type,
+    ])
+    output_type = DataType(106)
+
+    default_average = 0
+    default_standard_deviation = 1
+
+    def __init__(self):
+        super().__init__()
+
+        self.setTitle("Standardise")
+        self.addInput(InputModel("Input", self.input_type))
+        self.addOutput(OutputModel("Output", self.output_type))
+
+        self._average = self.default_average
+        self._standard_deviation = self.default_standard_deviation
+
+    def average(self):
+        return self._average
+
+    def standardDeviation(self):
+        return self._standard_deviation
+
+    def setAverage(self, value, /):
+        self._average = value
+
+    def setStandardDeviation(self, value, /):
+        self._standard_deviation = value
+
+    def description(self):
+        return "Average: x{}\nStd. Dev.: {}".format(
+            self.average(),
+            self.standardDeviation()
+        )
+
+    # Serialization ====================================================================================================
+    def add_nfb_export_data(self, signal: dict):
+        signal["fAverage"] = self.average()
+        signal["fStdDev"] = self.standardDeviation()
+
+    def serialize(self) -> dict:
+        data = super().serialize()
+
+        data["average"] = self.average()
+        data["standard_deviation"] = self.standardDeviation()
+        return data
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = super().deserialize(data)
+        obj.setAverage(data["average"])
+        obj.setStandardDeviation(data["standard_deviation"])
+
+        return obj
+
+
+class DerivedSignalExportModel(SignalNodeModel):
+    input_type = DataType(107, convertible_from=[
+        SpatialFilterModel.output_type,
+        BandpassFilterModel.output_type,
+        EnvelopeDetectorModel.output_type,
+        StandardiseModel.output_type,
+    ])
+    output_type = DataType(108)
+
+    def __init__(self):
+        super().__init__()
+
+        self.setTitle("Derived Signal Export")
+        self.addInput(InputModel("Input", self.input_type))
+        self.addOutput(OutputModel("Output", self.output_type))
+
+        self._signal_name = "Signal"
+
+    def signalName(self) -> str:
+        return self._signal_name
+
+    def setSignalName(self, name: str, /):
+        self._signal_name = name
+
+    def description(self):
+        return self.signalName()
+
+    # Serialization ====================================================================================================
+    def add_nfb_export_data(self, signal: dict):
+        signal["sSignalName"] = self.signalName()
+
+    def serialize(self) -> dict:
+        data = super().serialize()
+
+        data["signal_name"] = self.signalName()
+        return data
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = super().deserialize(data)
+        obj.setSignalName(data["signal_name"])
+
+        return obj
+
+
+class CompositeSignalExportModel(SignalNodeModel):
+    input_type = DerivedSignalExportModel.output_type
+
+    def __init__(self):
+        super().__init__()
+
+        self.setTitle("Composite Signal Export")
+        i = InputModel("Input", self.input_type)
+        i.setMultiple(True)
+        self.addInput(i)
+
+        self._signal_name = "Signal"
+        self._expression = ""
+
+    def signalName(self) -> str:
+        return self._signal_name
+
+    def expression(self) -> str:
+        return self._expression
+
+    def setSignalName(self, name: str, /):
+        self._signal_name = name
+
+    def setExpression(self, eq: str, /):
+        self._expression = eq
+
+    def description(self):
+        return "{} =\n{}".format(
+            self.signalName(),
+            self.expression(),
+        )
+
+    # Serialization ====================================================================================================
+    def add_nfb_export_data(self, signal: dict):
+        signal["sSignalName"] = self.signalName()
+        signal["sExpression"] = self.expression()
+
+    def serialize(self) -> dict:
+        data = super().serialize()
+
+        data["signal_name"] = self.signalName()
+        data["expression"] = self.expression()
+        return data
+
+    @classmethod
+    def deserialize(cls, data: dict):
+        obj = super().deserialize(data)
+        obj.setSignalName(data["signal_name"])
+        obj.setExpression(data["expression"])
+
+        return obj
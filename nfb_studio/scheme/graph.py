@@ -1,24 +1,55 @@
 """Classes representing the graph stucture in the node scheme."""
 from typing import Union
 
+from nfb_studio.util import OrderedSet
+from nfb_studio.model.scheme import find_connection
 from .graphics_item_group import GraphicsItemGroup
 from .node import Node, Edge, Input, Output
 
 
 class Graph(GraphicsItemGroup):
-    """A collection of nodes and edges connecting them."""
+    """A collection of nodes and edges connecting them.
+
+    Nodes, their connections and edges are identified by integer IDs. When an item is added to a graph, it keeps its
+    ID if it has one that is not used by another item of this graph, and is given a new ID otherwise. IDs are saved
+    along with the graph, so they persist between saving and loading.
+    """
     def __init__(self):
         super().__init__()
 
-        self.nodes = set()
-        self.edges = set()
+        self.nodes = OrderedSet()
+        self.edges = OrderedSet()
+
+        self._items = {}
+        """Nodes, connections and edges by their ID. Maps an integer ID to an item."""
+        self._next_id = 0
+        """The lowest ID that is guaranteed to be free."""
+
+        # Edge indexes -------------------------------------------------------------------------------------------------
+        # Edges are indexed by the connections they are attached to at the moment they are added to the graph.
+        self._incoming = {}
+        """Edges going to a node. Maps a node to a set of edges."""
+        self._outgoing = {}
+        """Edges going from a node. Maps a node to a set of edges."""
+        self._links = {}
+        """Edges between an output and an input. Maps (source, target) to a set of edges."""
+        self._ends = {}
+        """Connections that each edge was indexed under. Maps an edge to (source, target)."""
 
     # Core set methods =================================================================================================
     def add(self, item):
         if isinstance(item, Node):
-            self.nodes.add(item)
+            if item not in self.nodes:
+                self.nodes.add(item)
+                item._graphs[id(self)] = self
+                self._register(item)
+                for connection in item.inputs + item.outputs:
+                    self._register(connection)
         elif isinstance(item, Edge):
-            self.edges.add(item)
+            if item not in self.edges:
+                self.edges.add(item)
+                self._register(item)
+                self._index(item)
         else:
             raise TypeError("Graph accepts only Node and Edge objects, not " + type(item).__name__)
 
@@ -29,22 +60,87 @@ class Graph(GraphicsItemGroup):
         
         if isinstance(item, Node):
             # If a node is removed, all edges to or from that node are also removed.
-            # Remove connected edges
-            to_remove = []
-            for edge in self.edges:
-                if edge.sourceNode() == item or edge.targetNode() == item:
-                    to_remove.append(edge)
-            
-            for edge in to_remove:
+            for edge in self.connectedEdges(item):
                 self.discard(edge)
 
             # Remove the node
-            self.nodes.discard(item)
+            if item in self.nodes:
+                self.nodes.discard(item)
+                item._graphs.pop(id(self), None)
+                self._unregister(item)
+                for connection in item.inputs + item.outputs:
+                    self._unregister(connection)
         elif isinstance(item, Edge):
+            if item in self.edges:
+                self._unregister(item)
+                self._unindex(item)
+
             # Disconnect from nodes that are still in this graph
             item.detachAll()
             self.edges.discard(item)
-    
+
+    # Item IDs =========================================================================================================
+    def _register(self, item):
+        """Give an item an ID that is unique in this graph, and remember it."""
+        item_id = item.itemId()
+
+        if item_id is None or self._items.get(item_id, item) is not item:
+            while self._next_id in self._items:
+                self._next_id += 1
+
+            item_id = self._next_id
+            item.setItemId(item_id)
+
+        self._items[item_id] = item
+        self._next_id = max(self._next_id, item_id + 1)
+
+    def _unregister(self, item):
+        if self._items.get(item.itemId()) is item:
+            del self._items[item.itemId()]
+
+    def item(self, item_id: int):
+        """Return a node, connection or edge of this graph by its ID, or None if there is no such item."""
+        return self._items.get(item_id)
+
+    # Edge indexes =====================================================================================================
+    def _index(self, edge: Edge):
+        source = edge.source()
+        target = edge.target()
+        self._ends[edge] = (source, target)
+
+        if source is not None:
+            self._outgoing.setdefault(source.parentItem(), OrderedSet()).add(edge)
+        if target is not None:
+            self._incoming.setdefault(target.parentItem(), OrderedSet()).add(edge)
+
+        self._links.setdefault((source, target), OrderedSet()).add(edge)
+
+    def _unindex(self, edge: Edge):
+        source, target = self._ends.pop(edge)
+
+        if source is not None:
+            _discard_from(self._outgoing, source.parentItem(), edge)
+        if target is not None:
+            _discard_from(self._incoming, target.parentItem(), edge)
+
+        _discard_from(self._links, (source, target), edge)
+
+    def incomingEdges(self, node: Node) -> list:
+        """Return a list of edges in this graph that go to `node`."""
+        return list(self._incoming.get(node, ()))
+
+    def outgoingEdges(self, node: Node) -> list:
+        """Return a list of edges in this graph that go from `node`."""
+        return list(self._outgoing.get(node, ()))
+
+    def connectedEdges(self, node: Node) -> list:
+        """Return a list of edges in this graph that go to or from `node`."""
+        return list(self._incoming.get(node, OrderedSet()) | self._outgoing.get(node, OrderedSet()))
+
+    def edgesBetween(self, source: Output, target: Input) -> list:
+        """Return a list of edges in this graph that connect `source` to `target`."""
+        return list(self._links.get((source, target), ()))
+
     # Edge manipulation ================================================================================================
     def connect_nodes(self, source: Output, target: Input) -> Edge:
         """Connect an Output connection to an Input connection with an edge.
@@ -64,11 +160,13 @@ class Graph(GraphicsItemGroup):
         If output and input are connected more than once, only one edge is removed.
         Returns the edge that was removed, or None if no such edge was found.
         """
-        for edge in self.edges:
-            if edge.source() == source and edge.target() == target:
-                self.discard(edge)
-                return edge
-        return None
+        edges = self._links.get((source, target))
+        if not edges:
+            return None
+
+        edge = next(iter(edges))
+        self.discard(edge)
+        return edge
 
     # Selection ========================================================================================================
     def selectAll(self):
@@ -112,10 +210,9 @@ class Graph(GraphicsItemGroup):
         """
         result = self.selection()
 
-        for edge in self.edges:
-            if ((edge.sourceNode() is not None and edge.sourceNode().isSelected()) or 
-                (edge.targetNode() is not None and edge.targetNode().isSelected())):
-                result.add(edge)  
+        for node in list(result.nodes):
+            for edge in self.connectedEdges(node):
+                result.add(edge)
 
         return result
     
@@ -136,37 +233,41 @@ class Graph(GraphicsItemGroup):
         
         After calling this function, other.issubset(self) will return True.
         """
-        super().__ior__(other)
-        self.nodes |= other.nodes
-        self.edges |= other.edges
+        for item in other:
+            self.add(item)
 
     # Serialization ====================================================================================================
     def serialize(self) -> dict:
         data = {}
 
         # Serialize nodes ----------------------------------------------------------------------------------------------
-        nodes = list(self.nodes)
-        data["nodes"] = nodes
+        data["nodes"] = list(self.nodes)
 
         # Serialize edges ----------------------------------------------------------------------------------------------
+        # Edges refer to their connections by ID. Node and connection indices are saved as well, so that files can be
+        # opened by versions that do not know about IDs.
         data["edges"] = []
+        node_index = {node: i for i, node in enumerate(self.nodes)}
 
         for edge in self.edges:
             source_node = edge.sourceNode()
             target_node = edge.targetNode()
 
-            if source_node is None or target_node is None:
-                # Not serializing dangling nodes
+            if source_node not in node_index or target_node not in node_index:
+                # Not serializing dangling edges
                 continue
 
             edge_data = {
+                "id": edge.itemId(),
                 "source": {
-                    "node_index": nodes.index(source_node),
-                    "connection_index": source_node.outputs.index(edge.source())
+                    "id": edge.source().itemId(),
+                    "node_index": node_index[source_node],
+                    "connection_index": edge.source().index()
                 },
                 "target": {
-                    "node_index": nodes.index(target_node),
-                    "connection_index": target_node.inputs.index(edge.target())
+                    "id": edge.target().itemId(),
+                    "node_index": node_index[target_node],
+                    "connection_index": edge.target().index()
                 }
             }
 
@@ -179,22 +280,85 @@ class Graph(GraphicsItemGroup):
         """Deserialize this object from a dict of data.
         
         Edges are not serialized as objects. Instead, only their connections are remembered and reconstructed during the
-        deserialization.
+        deserialization. Connections are found by their ID. Files saved before item IDs were introduced only refer to
+        connections by node and connection indices, and are also supported.
         """
         obj = cls()
 
+        # Connections by the ID they were saved with, before adding nodes to the graph can change it
+        connections = {}
+        for node in data["nodes"]:
+            for connection in node.inputs + node.outputs:
+                connections[connection.itemId()] = connection
+
         # Deserialize nodes --------------------------------------------------------------------------------------------
         for node in data["nodes"]:
             obj.add(node)
 
         # Deserialize edges --------------------------------------------------------------------------------------------
         for edge_data in data["edges"]:
-            source_node = data["nodes"][edge_data["source"]["node_index"]]
-            target_node = data["nodes"][edge_data["target"]["node_index"]]
+            source = find_connection(data["nodes"], connections, edge_data["source"], "outputs")
+            target = find_connection(data["nodes"], connections, edge_data["target"], "inputs")
 
-            source = source_node.outputs[edge_data["source"]["connection_index"]]
-            target = target_node.inputs[edge_data["target"]["connection_index"]]
+            edge = Edge()
+            edge.setSource(source)
+            edge.setTarget(target)
+            edge.setItemId(edge_data.get("id"))
 
-            obj.connect_nodes(source, target)
+            obj.add(edge)
 
         return obj
+
+
+class GraphDelta:
+    """Changes made to a graph: nodes and edges that were added to it and removed from it.
+
+    An item that was added and then removed again (or the other way around) does not appear in the delta.
+    """
+    def __init__(self):
+        self.added_nodes = OrderedSet()
+        self.removed_nodes = OrderedSet()
+        self.added_edges = OrderedSet()
+        self.removed_edges = OrderedSet()
+
+    def _sets(self, item):
+        """Return a tuple (added, removed) of sets that `item` belongs in."""
+        if isinstance(item, Node):
+            return self.added_nodes, self.removed_nodes
+        if isinstance(item, Edge):
+            return self.added_edges, self.removed_edges
+
+        raise TypeError("GraphDelta accepts only Node and Edge objects, not " + type(item).__name__)
+
+    def recordAdded(self, item):
+        """Record that a node or edge was added to the graph."""
+        added, removed = self._sets(item)
+        if item in removed:
+            removed.discard(item)
+        else:
+            added.add(item)
+
+    def recordRemoved(self, item):
+        """Record that a node or edge was removed from the graph."""
+        added, removed = self._sets(item)
+        if item in added:
+            added.discard(item)
+        else:
+            removed.add(item)
+
+    def isEmpty(self) -> bool:
+        return not (self.added_nodes or self.removed_nodes or self.added_edges or self.removed_edges)
+
+    def __repr__(self):
+        return "GraphDelta(+{} nodes, -{} nodes, +{} edges, -{} edges)".format(
+            len(self.added_nodes), len(self.removed_nodes), len(self.added_edges), len(self.removed_edges)
+        )
+
+
+def _discard_from(index: dict, key, edge: Edge):
+    """Discard an edge from a set in an edge index, removing the set when it becomes empty."""
+    edges = index.get(key)
+    if edges is not None:
+        edges.discard(edge)
+        if not edges:
+            del index[key]
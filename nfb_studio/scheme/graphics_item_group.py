@@ -4,6 +4,8 @@ from collections.abc import MutableSet
 from PySide2.QtCore import QRectF, QPointF
 from PySide2.QtWidgets import QGraphicsItem
 
+from nfb_studio.util import OrderedSet
+
 
 class GraphicsItemGroup(MutableSet):
     """A simple collection of QGraphicsItems.  
@@ -14,7 +16,7 @@ class GraphicsItemGroup(MutableSet):
     def __init__(self):
         super().__init__()
 
-        self._data = set()
+        self._data = OrderedSet()
     
     # Implementations of abstract methods ==============================================================================
     def __contains__(self, item):
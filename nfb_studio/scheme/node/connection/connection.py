@@ -1,6 +1,8 @@
-from PySide2.QtCore import QRectF
+from PySide2.QtCore import Qt, QRectF, QPointF
 from PySide2.QtGui import QPainter
-from PySide2.QtWidgets import QGraphicsItem, QGraphicsLineItem
+from PySide2.QtWidgets import QGraphicsItem, QGraphicsLineItem, QGraphicsScene
+
+from nfb_studio.util import OrderedSet
 
 from ...text_line_item import TextLineItem
 from ...style import Style
@@ -13,6 +15,9 @@ class Connection(SchemeItem):
     """Connection is an input or output from a Node."""
     EdgeDragMimeType = Trigger.DragMimeType
 
+    text_align = Qt.AlignLeft
+    """Alignment of the text label relative to `textPos()`."""
+
     def __init__(self, text=None, datatype: DataType = None, parent: QGraphicsItem = None):
         super().__init__(parent)
 
@@ -20,15 +25,23 @@ class Connection(SchemeItem):
         self.setFlag(self.ItemIsSelectable)
         self.setFlag(self.ItemHasNoContents)  # Drawing occurs using child items
 
-        self.edges = set()
+        self.edges = OrderedSet()
         """Edges attached to this connection. To change this set use `Connection`'s methods: attach, detach, detachAll.
         """
 
-        self._text_item = TextLineItem(text or "Connection", self)
+        self._text = text or "Connection"
+        self._text_item = None
+        """Label that displays the text of this connection. Labels are only visible while Alt is held, so the item is
+        created on the first `showText` and released by the scheme some time after it was hidden.
+        """
         self._stem_item = QGraphicsLineItem(self)
 
         self._trigger_item = Trigger(self)
 
+        self._index = None
+        """Position of this connection in its node's inputs or outputs. This value is managed by Node."""
+        self._item_id = None
+        """Integer ID of this connection, unique in the graph that contains it. IDs are allocated by Graph."""
         self._datatype = datatype or DataType.Unknown
         self._is_multiple = False
         """Determines if the connection can have multiple edges coming out of it.  
@@ -39,7 +52,6 @@ class Connection(SchemeItem):
         """Connection is not selectable from outside sources. This flag is set by some internal methods to indicate that
         a selection is legitimate."""
 
-        self.hideText()
         self.styleChange()
         self.paletteChange()
 
@@ -60,14 +72,52 @@ class Connection(SchemeItem):
     
     # Operations =======================================================================================================
     def showText(self):
+        """Show the text label, creating it if needed."""
+        if self._text_item is None:
+            self._text_item = TextLineItem(self._text, self)
+            self._text_item.setAlignMode(self.text_align)
+            self._updateTextStyle()
+            self._updateTextPalette()
+
+            scene = self.scene()
+            if scene is not None and hasattr(scene, "_connectionTextCreated"):
+                scene._connectionTextCreated(self)
+
         self._text_item.setVisible(True)
 
     def hideText(self):
-        self._text_item.setVisible(False)
+        """Hide the text label. The label is kept until `releaseText` is called."""
+        if self._text_item is not None:
+            self._text_item.setVisible(False)
+
+    def isTextVisible(self):
+        return self._text_item is not None and self._text_item.isVisible()
+
+    def releaseText(self):
+        """Destroy the text label to free its memory. It will be created again on next `showText`."""
+        if self._text_item is None:
+            return
+
+        # Text label is not a part of the graph, so Scheme.removeItem is bypassed
+        if self._text_item.scene() is not None:
+            QGraphicsScene.removeItem(self._text_item.scene(), self._text_item)
+        else:
+            self._text_item.setParentItem(None)
+        self._text_item = None
 
     # Member access ====================================================================================================
     def text(self):
-        return self._text_item.text()
+        return self._text
+
+    def index(self):
+        """Return the position of this connection in its node's list of inputs or outputs, or None if the connection
+        does not belong to a node.
+        """
+        return self._index
+
+    def itemId(self):
+        """Return the integer ID of this connection, or None if its node was never added to a graph."""
+        return self._item_id
 
     def dataType(self):
         return self._datatype
@@ -76,7 +126,9 @@ class Connection(SchemeItem):
         return self._is_multiple
 
     def setText(self, text):
-        self._text_item.setText(text)
+        self._text = text
+        if self._text_item is not None:
+            self._text_item.setText(text)
 
     def setDataType(self, datatype):
         self._datatype = datatype
@@ -88,6 +140,9 @@ class Connection(SchemeItem):
     def setMultiple(self, multiple: bool):
         self._is_multiple = multiple
 
+    def setItemId(self, item_id):
+        self._item_id = item_id
+
     # Geometry and drawing =============================================================================================
     def stemRoot(self):
         """Return position of stem's root (where the stem connects to the node) in local inches."""
@@ -96,6 +151,10 @@ class Connection(SchemeItem):
     def stemTip(self):
         """Return position of stem's root (where the stem connects to the edge) in local inches."""
         raise NotImplementedError
+
+    def textPos(self) -> QPointF:
+        """Return position of the text label's origin in local coordinates."""
+        raise NotImplementedError
     
     def boundingRect(self):
         return QRectF()
@@ -106,22 +165,28 @@ class Connection(SchemeItem):
     # Style and palette ================================================================================================
     def styleChange(self):
         super().styleChange()
-        style = self.style()
-
-        self._text_item.setFont(style.font(Style.ConnectionTextFont))
-        self._text_item.setMaximumWidth(style.pixelMetric(Style.ConnectionTextLength))
+        self._stem_item.setPen(self.style().edgePen(self.palette()))
 
-        self._stem_item.setPen(style.edgePen(self.palette()))
+        if self._text_item is not None:
+            self._updateTextStyle()
     
     def paletteChange(self):
         super().paletteChange()
-        text_bg = self.palette().background().color()
-        text_bg.setAlpha(196)
+        self._stem_item.setPen(self.style().edgePen(self.palette()))
 
-        self._text_item.setBackgroundBrush(text_bg)
-        self._text_item.setBrush(self.palette().text())
+        if self._text_item is not None:
+            self._updateTextPalette()
 
-        self._stem_item.setPen(self.style().edgePen(self.palette()))
+    def _updateTextStyle(self):
+        style = self.style()
+
+        self._text_item.setFont(style.font(Style.ConnectionTextFont))
+        self._text_item.setMaximumWidth(style.pixelMetric(Style.ConnectionTextLength))
+        self._text_item.setPos(self.textPos())
+
+    def _updateTextPalette(self):
+        self._text_item.setBackgroundBrush(self.style().textBackgroundBrush(self.palette()))
+        self._text_item.setBrush(self.palette().text())
 
     # Events ===========================================================================================================
     def itemChange(self, change, value):
@@ -133,6 +198,14 @@ class Connection(SchemeItem):
         if change == self.ItemScenePositionHasChanged or change == self.ItemVisibleHasChanged:
             for edge in self.edges:
                 edge.adjust()
+        # ItemSceneHasChanged ------------------------------------------------------------------------------------------
+        if change == self.ItemSceneHasChanged:
+            # Connections that are added while the scheme shows connection text must show it as well
+            scene = self.scene()
+            if scene is not None and getattr(scene, "connectionTextVisible", lambda: False)():
+                self.showText()
+            elif self._text_item is not None and hasattr(scene, "_connectionTextCreated"):
+                scene._connectionTextCreated(self)
         # ItemSelectedChange -------------------------------------------------------------------------------------------
         if change == self.ItemSelectedChange:
             # Connection is not selectable from outside sources. Selection is approved only if the corresponding flag is
@@ -168,6 +241,7 @@ class Connection(SchemeItem):
     # Serialization ====================================================================================================
     def serialize(self) -> dict:
         return {
+            "id": self.itemId(),
             "text": self.text(),
             "datatype": self.dataType(),
             "is_multiple": self.isMultiple(),
@@ -176,6 +250,7 @@ class Connection(SchemeItem):
     @classmethod
     def deserialize(cls, data: dict):
         obj = cls()
+        obj.setItemId(data.get("id"))
         obj.setText(data["text"])
         obj.setDataType(data["datatype"])
         obj.setMultiple(data["is_multiple"])
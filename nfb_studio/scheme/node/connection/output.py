@@ -8,11 +8,11 @@ from .connection import Connection
 
 class Output(Connection):
     """A data output from a node."""
+    text_align = Qt.AlignLeft
     
     def __init__(self, text=None, datatype: DataType = None):
         super().__init__(text or "Output", datatype)
 
-        self._text_item.setAlignMode(Qt.AlignLeft)
         self._trigger_item.setPos(self.stemTip())
         
         self.setMultiple(True)
@@ -43,15 +43,18 @@ class Output(Connection):
     def styleChange(self):
         super().styleChange()
         self.prepareGeometryChange()
+
+        self._stem_item.setLine(QLineF(self.stemRoot(), self.stemTip()))
+
+    # Geometry and drawing =============================================================================================
+    def textPos(self):
         style = self.style()
 
         margin = style.pixelMetric(Style.ConnectionStemTextMargin)
-        metrics = QFontMetricsF(self._text_item.font())
+        metrics = QFontMetricsF(style.font(Style.ConnectionTextFont))
 
-        self._stem_item.setLine(QLineF(self.stemRoot(), self.stemTip()))
-        self._text_item.setPos(self.stemTip().x() + margin, metrics.capHeight() / 2)
+        return QPointF(self.stemTip().x() + margin, metrics.capHeight() / 2)
 
-    # Geometry and drawing =============================================================================================
     def stemRoot(self):
         """Return position of stem's root (where the stem connects to the node) in local coordinates."""
         return QPointF(0, 0)  # Stem root is located exactly at the origin
@@ -36,6 +36,9 @@ class Edge(SchemeItem):
         This variable represents current target coordinates in scene pixels.
         """
 
+        self._item_id = None
+        """Integer ID of this edge, unique in the graph that contains it. IDs are allocated by Graph."""
+
         self._path = QPainterPath()
         self._pen = QPen()
 
@@ -43,6 +46,10 @@ class Edge(SchemeItem):
         self.paletteChange()
 
     # Observer functions ===============================================================================================
+    def itemId(self):
+        """Return the integer ID of this edge, or None if it was never added to a graph."""
+        return self._item_id
+
     def sourceNode(self) -> Union[Node, None]:
         """Return a node from which the edge originates, if it exists.  
         If the edge has no source connection, it consequently has no source node.
@@ -98,6 +105,9 @@ class Edge(SchemeItem):
         return None
 
     # Setter functions =================================================================================================
+    def setItemId(self, item_id):
+        self._item_id = item_id
+
     def attach(self, connection: Connection):
         """Attach this edge to a connection.  
         This function is similar to setSource and setTarget, but determines which side to attach automatically.
@@ -245,8 +255,14 @@ class Edge(SchemeItem):
     # Utility functions ================================================================================================
     def adjust(self):
         """Adjust the edge's coordinates to match those of the input and output of nodes.  
-        Call this function if the node moved or source/target was changed.
+        Call this function if the node moved or source/target was changed. Inside a batch (see `Scheme.batch`), the
+        adjustment is deferred until the batch closes.
         """
+        scheme = self.scene()
+        if scheme is not None and scheme.isBatching():
+            scheme.deferEdgeAdjust(self)
+            return
+
         self.setPos(0, 0)  # Edge is always at position 0
         self.prepareGeometryChange()
         
@@ -279,12 +295,14 @@ class Edge(SchemeItem):
         if change == self.ItemSelectedChange:
             scheme = self.scene()
 
-            if len(scheme.selection().nodes) != 0:
+            if scheme.selectedNodeCount() != 0:
                 # If nodes are selected, edges are allowed to be selected only between two nodes. 
                 value = self._autoSelectValue()
         # ItemSelectedHasChanged ---------------------------------------------------------------------------------------
         # When a selection status has changed, propagate it to connections on both sides.
         elif change == self.ItemSelectedHasChanged:
+            self.scene()._itemSelectionChanged(self, value)
+
             if self.source() is not None and self.source().isSelected() != value:
                 self.source().autoSelectFromEdge()
 
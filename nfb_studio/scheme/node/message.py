@@ -26,6 +26,9 @@ class Message(SchemeItem):
     Messages can be of different severity. This base class is inherited by InfoMessage, WarningMessage and
     ErrorMessage.
     """
+    transient = False
+    """If True, the message reflects the current state of the editor and is not saved with its node."""
+
     def __init__(self, text=None, icon_filename=None, parent=None):
         super(Message, self).__init__(parent)
         self.setFlag(QGraphicsItem.ItemHasNoContents)
@@ -90,11 +93,8 @@ class Message(SchemeItem):
     
     def paletteChange(self):
         super().paletteChange()
-        text_bg = self.palette().background().color()
-        text_bg.setAlpha(196)
-
         self._text_item.setBrush(self.palette().text())
-        self._text_item.setBackgroundBrush(text_bg)
+        self._text_item.setBackgroundBrush(self.style().textBackgroundBrush(self.palette()))
 
     def boundingRect(self) -> QRectF:
         return QRectF()
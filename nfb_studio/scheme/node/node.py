@@ -1,3 +1,5 @@
+from weakref import WeakValueDictionary
+
 from PySide2.QtCore import QPointF, QSizeF, QRectF
 from PySide2.QtGui import QPainter, QPainterPath, QFontMetricsF
 from PySide2.QtWidgets import QGraphicsLineItem, QGraphicsPathItem
@@ -37,6 +39,12 @@ class Node(SchemeItem):
         self.messages = SortedList(key=lambda item: item.severity())
 
         self._config_widget = None
+        self._item_id = None
+        """Integer ID of this node, unique in the graph that contains it. IDs are allocated by Graph."""
+        self._graphs = WeakValueDictionary()
+        """Graphs that contain this node, by their id(). This dict is managed by Graph, and is used to give IDs to new
+        connections.
+        """
 
         # Set proper style and color for the item
         self.styleChange()
@@ -66,12 +74,17 @@ class Node(SchemeItem):
         self.inputs.insert(index, obj)
 
         obj.setParentItem(self)
+        for graph in self._graphs.values():
+            graph._register(obj)
 
         self._updateInputPositions()
 
     def removeInput(self, index):
         removed = self.inputs.pop(index)
         removed.setParentItem(None)
+        removed._index = None
+        for graph in self._graphs.values():
+            graph._unregister(removed)
 
         self._updateInputPositions()
 
@@ -85,12 +98,17 @@ class Node(SchemeItem):
         self.outputs.insert(index, obj)
 
         obj.setParentItem(self)
+        for graph in self._graphs.values():
+            graph._register(obj)
 
         self._updateOutputPositions()
 
     def removeOutput(self, index):
         removed = self.outputs.pop(index)
         removed.setParentItem(None)
+        removed._index = None
+        for graph in self._graphs.values():
+            graph._unregister(removed)
 
         self._updateOutputPositions()
 
@@ -121,6 +139,9 @@ class Node(SchemeItem):
     def setConfigWidget(self, w):
         self._config_widget = w
 
+    def setItemId(self, item_id):
+        self._item_id = item_id
+
     def size(self):
         return self._size
 
@@ -134,12 +155,17 @@ class Node(SchemeItem):
         """Return a widget for configuring this node, or None if it does not exist."""
         return self._config_widget
 
+    def itemId(self):
+        """Return the integer ID of this node, or None if it was never added to a graph."""
+        return self._item_id
+
     # Updating functions ===============================================================================================
     def _updateInputPositions(self):
         padding = self.style().pixelMetric(Style.NodeConnectionPadding)
 
         i = 0
         for item in self.inputs:
+            item._index = i
             item.setPos(0, padding * (2 * i + 1))
             i += 1
 
@@ -148,6 +174,7 @@ class Node(SchemeItem):
 
         i = 0
         for item in self.outputs:
+            item._index = i
             item.setPos(self.size().width(), padding * (2 * i + 1))
             i += 1
 
@@ -245,9 +272,11 @@ class Node(SchemeItem):
 
     def itemChange(self, change, value):
         if change == self.ItemSelectedHasChanged:
-            selection = self.scene().selection()
-            if len(selection.nodes) == 1:
-                for edge in selection.edges:
+            scheme = self.scene()
+            scheme._itemSelectionChanged(self, value)
+
+            if scheme.selectedNodeCount() == 1:
+                for edge in scheme.selectedEdges():
                     edge.autoSelect()
 
             # Update selection status for all connections
@@ -267,17 +296,19 @@ class Node(SchemeItem):
     # Serialization ====================================================================================================
     def serialize(self) -> dict:
         return {
+            "id": self.itemId(),
             "title": self.title(),
             "description": self.description(),
             "inputs": self.inputs,
             "outputs": self.outputs,
-            "messages": list(self.messages),
+            "messages": [message for message in self.messages if not message.transient],
             "position": inch(self.pos())
         }
 
     @classmethod
     def deserialize(cls, data: dict):
         obj = cls()
+        obj.setItemId(data.get("id"))
         obj.setTitle(data["title"])
         obj.setDescription(data["description"])
         obj.setPos(px(data["position"]))
@@ -7,7 +7,14 @@ from PySide2.QtGui import QBrush, QColor
 from nfb_studio.util import import_enum
 
 class Palette:
-    """A collection of colors for use in the scheme graphics items."""
+    """A collection of colors for use in the scheme graphics items.
+
+    Palettes are shared: a Scheme and all items in it use the same palette unless an item was given its own with
+    `SchemeItem.setPalette`. Each item draws with a color group that depends on its state (for example, Selected).
+    Instead of changing the current color group of a shared palette, items use `group()` to get a palette with the right
+    current color group that shares all brushes with the original one.
+    """
+    _default = None
     class ColorGroup(Enum):
         """An enumeration of possible color groups in this Palette. 
         
@@ -56,6 +63,29 @@ class Palette:
             self._brush[CG.Inactive][key] = QBrush(self._brush[CG.Active][key])
         
         self._current_color_group = CG.Active
+        self._groups = {}
+        """Palettes that share brushes with this one, but have a different current color group. See `group()`."""
+        self._revision = [0]
+        """Number of times brushes of this palette were changed. Shared with palettes from `group()`."""
+
+    @classmethod
+    def default(cls):
+        """Return the default palette, shared by all schemes and scheme items that were not given their own."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def copy(self):
+        """Return a copy of this palette that does not share brushes with it."""
+        obj = type(self).__new__(type(self))
+        obj._brush = {
+            group: {role: QBrush(brush) for role, brush in brushes.items()} for group, brushes in self._brush.items()
+        }
+        obj._current_color_group = self._current_color_group
+        obj._groups = {}
+        obj._revision = [0]
+
+        return obj
     
     # Current color group ----------------------------------------------------------------------------------------------
     def setCurrentColorGroup(self, cg: ColorGroup, /):
@@ -63,7 +93,32 @@ class Palette:
 
     def currentColorGroup(self) -> ColorGroup:
         return self._current_color_group
+
+    def group(self, cg: ColorGroup, /):
+        """Return a palette that shares brushes with this one, with `cg` as the current color group.
+        If `cg` is the current color group, returns this palette. Returned palettes are cached, so that an item can
+        switch between color groups without copying the palette.
+        """
+        if cg == self._current_color_group:
+            return self
+
+        if cg not in self._groups:
+            obj = type(self).__new__(type(self))
+            obj._brush = self._brush
+            obj._current_color_group = cg
+            obj._groups = self._groups
+            obj._revision = self._revision
+
+            self._groups[cg] = obj
+
+        return self._groups[cg]
     
+    def revision(self) -> int:
+        """Return a number that changes every time a brush of this palette is changed.
+        Can be used to tell if something derived from the palette's colors needs to be made again.
+        """
+        return self._revision[0]
+
     # Color & brush manipulation ---------------------------------------------------------------------------------------
     def brush(self, *args) -> QBrush:
         """Return the brush for the specified group and role.
@@ -110,6 +165,7 @@ class Palette:
         brush = args[-1]
 
         self._brush[group][role] = QBrush(brush)
+        self._revision[0] += 1
     
     def setColor(self, *args):
         """Set the brush to solid color for the specified group and role.
@@ -1,14 +1,18 @@
 """A data model for the nfb experiment's system of signals and their components."""
-from PySide2.QtCore import Qt, QPointF, QMimeData, Signal
+from contextlib import contextmanager
+
+from PySide2.QtCore import Qt, QPointF, QRectF, QMimeData, QTimer, Signal
 from PySide2.QtGui import QPainter, QKeySequence
 from PySide2.QtWidgets import QGraphicsScene, QGraphicsView, QGraphicsItem, QShortcut, QApplication
 
 from nfb_studio.serial import mime, hooks
+from nfb_studio.util import OrderedSet
 
-from .graph import Graph
+from .graph import Graph, GraphDelta
 from .node import Node, Edge, Input, Output, Connection
 from .style import Style
 from .palette import Palette
+from .scheme_item import SchemeItem
 
 class Scheme(QGraphicsScene):
     """A data model for the nfb experiment's system of signals and their components.
@@ -91,6 +95,7 @@ class Scheme(QGraphicsScene):
 
                 self.translate(translate.x(), translate.y())
                 self._pan_origin = event.pos()
+                self._showConnectionText()
                 return
             
             super().mouseMoveEvent(event)
@@ -103,10 +108,16 @@ class Scheme(QGraphicsScene):
             self.setTransformationAnchor(self.AnchorUnderMouse)
             self.scale(scale, scale)
             self.setTransformationAnchor(self.NoAnchor)
+            self._showConnectionText()
 
         def resizeEvent(self, event):
             super().resizeEvent(event)
             self._adjustSceneRect()
+            self._showConnectionText()
+
+        def visibleSceneRect(self):
+            """Return the rectangle of the scene that is currently visible in this view."""
+            return self.mapToScene(self.viewport().rect()).boundingRect()
 
         def _adjustSceneRect(self):
             """Adjust the scene rect displayed in the view.
@@ -121,12 +132,22 @@ class Scheme(QGraphicsScene):
 
             self.setSceneRect(rect.adjusted(-wsize.width(), -wsize.height(), wsize.width(), wsize.height()))
 
+        def _showConnectionText(self):
+            """If the scheme shows connection text, show it on connections that came into view."""
+            if self.scene() is not None and self.scene().connectionTextVisible():
+                self.scene().showConnectionText(self.visibleSceneRect())
+
     ClipboardMimeType = "application/x-nfb_studio-graph"
     """MIME type that this scene uses in copy-paste events."""
+
+    connection_text_release_interval = 10000
+    """Time in milliseconds after connection text was hidden, after which text labels of connections are destroyed."""
     
     graphChanged = Signal(object)
-    """Emitted when the graph inside the scene is changed in any way. Sends the object (Node or Edge) that was
-    added or removed.
+    """Emitted when the graph inside the scene is changed in any way. Sends a GraphDelta with nodes and edges that were
+    added and removed.  
+    Changes are coalesced: the signal is emitted once per event loop iteration, after all changes made during that
+    iteration. Call `flushGraphChanged` to emit it right away.
     """
 
     def __init__(self, parent=None):
@@ -144,13 +165,45 @@ class Scheme(QGraphicsScene):
         self._dragging_edge = None
         """A temporary edge that is being displayed when an edge is drawn by the user with drag and drop."""
 
+        # Batch support ------------------------------------------------------------------------------------------------
+        self._batch_depth = 0
+        """How many batches are currently open. Batches can be nested."""
+        self._batch_edges = OrderedSet()
+        """Edges that need their geometry adjusted when the current batch closes."""
+        self._batch_index_method = None
+        """Item index method of the scene before the batch was opened."""
+
+        # Change notifications -----------------------------------------------------------------------------------------
+        self._graph_delta = GraphDelta()
+        """Changes to the graph that were not yet sent with `graphChanged`."""
+        self._graph_changed_timer = QTimer(self)
+        self._graph_changed_timer.setSingleShot(True)
+        self._graph_changed_timer.setInterval(0)
+        self._graph_changed_timer.timeout.connect(self.flushGraphChanged)
+
+        # Selection tracking -------------------------------------------------------------------------------------------
+        self._selected_nodes = OrderedSet()
+        """Selected nodes of the graph. Kept up to date by nodes, so that they do not need to scan the whole graph."""
+        self._selected_edges = OrderedSet()
+        """Selected edges of the graph. Kept up to date by edges, so that they do not need to scan the whole graph."""
+
+        # Connection text ----------------------------------------------------------------------------------------------
+        self._connection_text_visible = False
+        """True while connection text is shown (while Alt is held)."""
+        self._text_connections = OrderedSet()
+        """Connections that currently have a text label. Labels are created by connections on demand."""
+        self._connection_text_timer = QTimer(self)
+        self._connection_text_timer.setSingleShot(True)
+        self._connection_text_timer.setInterval(self.connection_text_release_interval)
+        self._connection_text_timer.timeout.connect(self.releaseConnectionText)
+
         # Clipboard support --------------------------------------------------------------------------------------------
         self.paste_pos = QPointF()
         """Position where the center of the pasted object will be located."""
 
         # Style and palette --------------------------------------------------------------------------------------------
-        self._style = Style()
-        self._palette = Palette()
+        self._style = Style.default()
+        self._palette = Palette.default()
 
         self.styleChange()
         self.paletteChange()
@@ -171,7 +224,10 @@ class Scheme(QGraphicsScene):
         """
         self.graph.add(item)
         super().addItem(item)
-        self.graphChanged.emit(item)
+        self._graphChanged(item, added=True)
+
+        if item.isSelected():
+            self._itemSelectionChanged(item, True)
 
     def removeItem(self, item: QGraphicsItem):
         """Add an item to the scene.
@@ -183,16 +239,12 @@ class Scheme(QGraphicsScene):
         # Remove a Node ------------------------------------------------------------------------------------------------
         if isinstance(item, Node):
             # Remove connected edges first
-            to_remove = []
-            for edge in self.graph.edges:
-                if edge.sourceNode() is item or edge.targetNode() is item:
-                    to_remove.append(edge)
-            
-            for edge in to_remove:
+            for edge in self.graph.connectedEdges(item):
                 self.removeItem(edge)
         
         self.graph.remove(item)
-        self.graphChanged.emit(item)
+        self._graphChanged(item, added=False)
+        self._itemSelectionChanged(item, False)
 
     def connect_nodes(self, source: Output, target: Input):
         """Connect an Output connection to an Input connection with an edge.
@@ -201,7 +253,7 @@ class Scheme(QGraphicsScene):
         """
         edge = self.graph.connect_nodes(source, target)
         super().addItem(edge)
-        self.graphChanged.emit(edge)
+        self._graphChanged(edge, added=True)
 
         return edge
 
@@ -214,7 +266,7 @@ class Scheme(QGraphicsScene):
         edge = self.graph.disconnect_nodes(source, target)
         if edge is not None:
             super().removeItem(edge)
-            self.graphChanged.emit(edge)
+            self._graphChanged(edge, added=False)
 
         return edge
 
@@ -223,16 +275,91 @@ class Scheme(QGraphicsScene):
         
         `other` represents a subgraph of the scheme graph that is to be extracted.
         """
-        for edge in other.edges:
-            self.removeItem(edge)
+        with self.batch():
+            for edge in other.edges:
+                self.removeItem(edge)
 
-        for node in other.nodes:
-            self.removeItem(node)
+            for node in other.nodes:
+                self.removeItem(node)
 
     def clear(self):
-        """Clear the scheme."""
-        super().clear()
+        """Clear the scheme.
+        Removal of all nodes and edges is sent with `graphChanged` right away, before the items are deleted. Tracked
+        selection, deferred edge adjustments and connection text labels are forgotten along with the items.
+        """
+        for edge in self.graph.edges:
+            self._graphChanged(edge, added=False)
+        for node in self.graph.nodes:
+            self._graphChanged(node, added=False)
         self.graph.clear()
+        self.flushGraphChanged()
+
+        self._selected_nodes.clear()
+        self._selected_edges.clear()
+        self._batch_edges.clear()
+
+        self._connection_text_visible = False
+        self._connection_text_timer.stop()
+        self._text_connections.clear()
+
+        super().clear()
+
+    # Batches ==========================================================================================================
+    @contextmanager
+    def batch(self):
+        """Group many changes to the scheme together.
+
+        Inside a `with scheme.batch():` block, the scene does not maintain its item index and edges do not recompute
+        their geometry. When the outermost batch closes, the index is rebuilt and every affected edge is adjusted once.
+        Use this when adding or removing many items at once.
+        """
+        if self._batch_depth == 0:
+            self._batch_index_method = self.itemIndexMethod()
+            self.setItemIndexMethod(self.NoIndex)
+        self._batch_depth += 1
+
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
+            if self._batch_depth == 0:
+                edges = self._batch_edges
+                self._batch_edges = OrderedSet()
+                for edge in edges:
+                    if edge.scene() is self:
+                        edge.adjust()
+
+                self.setItemIndexMethod(self._batch_index_method)
+
+    def isBatching(self) -> bool:
+        """Return True if changes to the scheme are currently grouped in a batch."""
+        return self._batch_depth > 0
+
+    def deferEdgeAdjust(self, edge: Edge):
+        """Adjust geometry of an edge when the current batch closes."""
+        self._batch_edges.add(edge)
+
+    # Change notifications =============================================================================================
+    def _graphChanged(self, item, added: bool):
+        """Record a change to the graph, to be sent with `graphChanged` in the next event loop iteration."""
+        if added:
+            self._graph_delta.recordAdded(item)
+        else:
+            self._graph_delta.recordRemoved(item)
+
+        if not self._graph_changed_timer.isActive():
+            self._graph_changed_timer.start()
+
+    def flushGraphChanged(self):
+        """Emit `graphChanged` with all changes that were not yet sent, if there are any."""
+        self._graph_changed_timer.stop()
+
+        delta = self._graph_delta
+        self._graph_delta = GraphDelta()
+
+        if not delta.isEmpty():
+            self.graphChanged.emit(delta)
 
     # Selection ========================================================================================================
     def selectAll(self):
@@ -240,6 +367,28 @@ class Scheme(QGraphicsScene):
 
     def selection(self) -> Graph:
         return self.graph.selection()
+
+    def selectedNodeCount(self) -> int:
+        """Return the number of selected nodes. Unlike `selection()`, takes constant time."""
+        return len(self._selected_nodes)
+
+    def selectedEdges(self) -> list:
+        """Return a list of selected edges. Unlike `selection()`, does not scan the whole graph."""
+        return list(self._selected_edges)
+
+    def _itemSelectionChanged(self, item, selected: bool):
+        """Update tracked selection after a node or edge of the graph was selected or deselected."""
+        if isinstance(item, Node):
+            items = self._selected_nodes
+        elif isinstance(item, Edge):
+            items = self._selected_edges
+        else:
+            return
+
+        if selected and item in self.graph:
+            items.add(item)
+        else:
+            items.discard(item)
     
     def clipboardSelection(self) -> Graph:
         return self.graph.clipboardSelection()
@@ -275,16 +424,18 @@ class Scheme(QGraphicsScene):
 
         if package.hasFormat(self.ClipboardMimeType):
             graph = mime.load(package, self.ClipboardMimeType, hooks=hooks.qt)
-            
-            for node in graph.nodes:
-                self.addItem(node)
-            for edge in graph.edges:
-                self.addItem(edge)           
 
-            self.clearSelection()  # Clear old selection
-            graph.selectAll()  # Create new selection (pasted items)
+            with self.batch():
+                for node in graph.nodes:
+                    self.addItem(node)
+                for edge in graph.edges:
+                    self.addItem(edge)
+
+                self.clearSelection()  # Clear old selection
+                graph.selectAll()  # Create new selection (pasted items)
+
+                graph.moveCenter(self.paste_pos)
 
-            graph.moveCenter(self.paste_pos)
             self.advancePastePos()
 
     def deleteEvent(self):
@@ -309,16 +460,26 @@ class Scheme(QGraphicsScene):
         return self._style
 
     def setStyle(self, style):
+        """Set the style of this scheme, which is shared by all items in it that were not given their own."""
         self._style = style
         self.styleChange()
 
+        for item in self.items():
+            if isinstance(item, SchemeItem) and item._style is None:
+                item.styleChange()
+
     def schemePalette(self):
         return self._palette
     
     def setPalette(self, palette):
+        """Set the palette of this scheme, which is shared by all items in it that were not given their own."""
         self._palette = palette
         self.paletteChange()
 
+        for item in self.items():
+            if isinstance(item, SchemeItem) and item._palette is None:
+                item.paletteChange()
+
     # Edge drawing =====================================================================================================
     def hasEdgeDrag(self) -> bool:
         """Returns True if an edge is currently being drawn via drag and drop."""
@@ -393,12 +554,60 @@ class Scheme(QGraphicsScene):
         else:
             self._custom_drop_events[fmt] = event
 
+    # Connection text ==================================================================================================
+    def connectionTextVisible(self) -> bool:
+        """Return True if connection text is shown in this scheme."""
+        return self._connection_text_visible
+
+    def setConnectionTextVisible(self, visible: bool):
+        """Show or hide text of all connections in the scheme.
+
+        Text labels are only created for connections that are visible in one of the views (views create the rest when
+        they are panned or zoomed). Hidden labels are destroyed after `connection_text_release_interval`.
+        """
+        if visible == self._connection_text_visible:
+            return
+        self._connection_text_visible = visible
+
+        if visible:
+            self._connection_text_timer.stop()
+            for view in self.views():
+                self.showConnectionText(view.visibleSceneRect())
+        else:
+            for connection in self._text_connections:
+                connection.hideText()
+            self._connection_text_timer.start()
+
+    def showConnectionText(self, rect: QRectF):
+        """Show text of connections of nodes that are located inside `rect`."""
+        nodes = OrderedSet()
+        for item in self.items(rect):
+            top_level_item = item.topLevelItem()
+            if isinstance(top_level_item, Node):
+                nodes.add(top_level_item)
+
+        for node in nodes:
+            node.showConnectionText()
+
+    def releaseConnectionText(self):
+        """Destroy text labels of connections that are not shown."""
+        for connection in list(self._text_connections):
+            if connection.scene() is self and connection.isTextVisible():
+                continue
+
+            self._text_connections.discard(connection)
+            if connection.scene() is self:
+                connection.releaseText()
+
+    def _connectionTextCreated(self, connection: Connection):
+        """Called by a connection in this scheme when it gets a text label."""
+        self._text_connections.add(connection)
+
     # Key presses ======================================================================================================
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Alt:
             event.accept()
-            for node in self.graph.nodes:
-                node.showConnectionText()
+            self.setConnectionTextVisible(True)
             return
         
         super().keyPressEvent(event)
@@ -406,8 +615,7 @@ class Scheme(QGraphicsScene):
     def keyReleaseEvent(self, event):
         if event.key() == Qt.Key_Alt:
             event.accept()
-            for node in self.graph.nodes:
-                node.hideConnectionText()
+            self.setConnectionTextVisible(False)
             return
 
         super().keyReleaseEvent(event)
@@ -425,10 +633,11 @@ class Scheme(QGraphicsScene):
         obj.graph = Graph.deserialize(data)
 
         # Bring the scene up to speed ----------------------------------------------------------------------------------
-        for node in obj.graph.nodes:
-            super(Scheme, obj).addItem(node)
+        with obj.batch():
+            for node in obj.graph.nodes:
+                super(Scheme, obj).addItem(node)
 
-        for edge in obj.graph.edges:
-            super(Scheme, obj).addItem(edge)
+            for edge in obj.graph.edges:
+                super(Scheme, obj).addItem(edge)
         
         return obj
@@ -5,40 +5,87 @@ from .style import Style
 from .palette import Palette
 
 class SchemeItem(QGraphicsItem):
-    """A QGraphicsItem that has a style and a palette."""
+    """A QGraphicsItem that has a style and a palette.
+
+    By default, an item uses the style and palette of the scheme it is in, or the default ones if it is not in a scheme.
+    These are shared between all items, and should not be modified through an item. To give an item a different style
+    or palette, use `setStyle` or `setPalette`.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self._style = Style()
-        self._palette = Palette()
+        self._style = None
+        """Style of this item, or None if it uses a shared style."""
+        self._palette = None
+        """Palette of this item, or None if it uses a shared palette."""
+        self._color_group = Palette.Active
+        """Color group of the palette that this item is drawn with."""
+
+        self._previous_scheme_style = None
+        self._previous_scheme_palette = None
 
     def setStyle(self, style: Style):
+        """Set this item's own style. If `style` is None, the item goes back to using a shared style."""
         self._style = style
         self.styleChange()
-    
+
     def style(self) -> Style:
-        return self._style
-    
+        if self._style is not None:
+            return self._style
+        return self._schemeStyle()
+
     def setPalette(self, palette: Palette):
+        """Set this item's own palette. If `palette` is None, the item goes back to using a shared palette."""
         self._palette = palette
         self.paletteChange()
-    
+
     def palette(self) -> Palette:
-        return self._palette
-    
+        """Return the palette of this item, with the color group of this item's state as the current one."""
+        if self._palette is not None:
+            return self._palette.group(self._color_group)
+        return self._schemePalette().group(self._color_group)
+
     def styleChange(self):
         pass
 
     def paletteChange(self):
         pass
 
+    def _schemeStyle(self) -> Style:
+        """Return the style of the scheme that this item is in, or the default style."""
+        scene = self.scene()
+        if scene is not None and hasattr(scene, "schemeStyle"):
+            return scene.schemeStyle()
+        return Style.default()
+
+    def _schemePalette(self) -> Palette:
+        """Return the palette of the scheme that this item is in, or the default palette."""
+        scene = self.scene()
+        if scene is not None and hasattr(scene, "schemePalette"):
+            return scene.schemePalette()
+        return Palette.default()
+
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
         if change == QGraphicsItem.ItemSelectedHasChanged:
             if value:
-                self._palette.setCurrentColorGroup(Palette.Selected)
+                self._color_group = Palette.Selected
             else:
-                self._palette.setCurrentColorGroup(Palette.Active)
+                self._color_group = Palette.Active
             self.paletteChange()
 
+        elif change == QGraphicsItem.ItemSceneChange:
+            self._previous_scheme_style = self._schemeStyle()
+            self._previous_scheme_palette = self._schemePalette()
+
+        elif change == QGraphicsItem.ItemSceneHasChanged:
+            # Items that use the style or palette of their scheme need to be updated if the new one is different
+            if self._style is None and self._schemeStyle() is not self._previous_scheme_style:
+                self.styleChange()
+            if self._palette is None and self._schemePalette() is not self._previous_scheme_palette:
+                self.paletteChange()
+
+            self._previous_scheme_style = None
+            self._previous_scheme_palette = None
+
         return super().itemChange(change, value)
@@ -1,8 +1,9 @@
 """A collection of properties for drawing scheme items."""
 from enum import Enum, auto
+from weakref import WeakKeyDictionary
 
 from PySide2.QtCore import Qt
-from PySide2.QtGui import QPen, QFont
+from PySide2.QtGui import QPen, QFont, QBrush
 
 from nfb_studio.util import import_enum
 
@@ -11,7 +12,11 @@ from .unitconv import inches_to_pixels as px
 
 
 class Style:
-    """A collection of sizes and fonts, as well as a default palette that is used to draw the items in the scheme."""
+    """A collection of sizes and fonts, as well as a default palette that is used to draw the items in the scheme.
+    Styles are shared: a Scheme and all items in it use the same style unless an item was given its own with
+    `SchemeItem.setStyle`.
+    """
+    _default = None
 
     class SizeMetric(Enum):
         """Various available size metrics.
@@ -134,18 +139,60 @@ class Style:
         self._edge_pen = QPen()
         self._edge_pen.setCapStyle(Qt.PenCapStyle.FlatCap)
         self._edge_pen.setWidthF(self.pixelMetric(SM.EdgeWidth))
+
+        self._palette_cache = WeakKeyDictionary()
+        """Pens and brushes made for each palette. Maps a palette to a tuple (palette revision, dict of pens and
+        brushes). Palettes from `Palette.group()` are separate keys, so each color group has its own pens and brushes.
+        """
     
-    def framePen(self, palette: Palette) -> QPen:
-        result = QPen(self._frame_pen)
-        result.setColor(palette.color(Palette.Frame))
+    @classmethod
+    def default(cls):
+        """Return the default style, shared by all schemes and scheme items that were not given their own."""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
 
-        return result
+    def framePen(self, palette: Palette) -> QPen:
+        """Return the pen for node frames, in colors of the current color group of `palette`.
+        The pen is shared and must not be modified.
+        """
+        return self._cached(palette)["frame_pen"]
     
     def edgePen(self, palette: Palette) -> QPen:
-        result = QPen(self._edge_pen)
-        result.setColor(palette.color(Palette.Edge))
+        """Return the pen for edges, in colors of the current color group of `palette`.
+        The pen is shared and must not be modified.
+        """
+        return self._cached(palette)["edge_pen"]
+
+    def textBackgroundBrush(self, palette: Palette) -> QBrush:
+        """Return the translucent brush that is drawn behind text outside of nodes, in colors of the current color group
+        of `palette`.
+        The brush is shared and must not be modified.
+        """
+        return self._cached(palette)["text_background_brush"]
+
+    def _cached(self, palette: Palette) -> dict:
+        """Return a dict of pens and brushes for `palette`, making them if the palette is new or was changed."""
+        entry = self._palette_cache.get(palette)
+
+        if entry is None or entry[0] != palette.revision():
+            frame_pen = QPen(self._frame_pen)
+            frame_pen.setColor(palette.color(Palette.Frame))
+
+            edge_pen = QPen(self._edge_pen)
+            edge_pen.setColor(palette.color(Palette.Edge))
+
+            text_background = palette.background().color()
+            text_background.setAlpha(196)
+
+            entry = (palette.revision(), {
+                "frame_pen": frame_pen,
+                "edge_pen": edge_pen,
+                "text_background_brush": QBrush(text_background)
+            })
+            self._palette_cache[palette] = entry
 
-        return result
+        return entry[1]
 
     def inchMetric(self, metric: SizeMetric, /):
         return self._inch_metric[metric]
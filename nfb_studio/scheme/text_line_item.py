@@ -1,8 +1,55 @@
+from functools import lru_cache
+
 from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QFont, QFontMetricsF, QBrush, QPainter
 from PySide2.QtWidgets import QGraphicsItem, QAbstractGraphicsShapeItem, QGraphicsRectItem
 
-from .unitconv import inches_to_pixels as px
+from .unitconv import inches_to_pixels as px, dpi
+
+_font_metrics = {}
+"""Font metrics for fonts used in text layouts. Maps (QFont.key(), dpi) to QFontMetricsF.
+Metrics depend on the dpi of the screen, so they are measured again after the dpi changes.
+"""
+
+
+def _textLayout(font: QFont, text: str, max_width, elide_mode):
+    """Return a tuple (elided text, bounding rect) for one line of text.
+    The bounding rect has its origin at the left side of the baseline. It must not be modified, as layouts are shared
+    between all text items.
+    This function is for internal use within this file.
+    """
+    key = (font.key(), dpi())
+    if key not in _font_metrics:
+        _font_metrics[key] = QFontMetricsF(font)
+
+    return _cachedTextLayout(key, text, max_width, elide_mode)
+
+
+@lru_cache(maxsize=4096)
+def _cachedTextLayout(metrics_key, text, max_width, elide_mode):
+    """Compute a text layout for `_textLayout`. `metrics_key` is a key of `_font_metrics`, which includes the dpi.
+    This function is for internal use within this file.
+    """
+    metrics = _font_metrics[metrics_key]
+
+    # Get bounding rectangle for full text
+    bounding_rect = metrics.boundingRect(text)
+
+    # Constrain by maximum width
+    if max_width is not None:
+        bounding_rect.setWidth(max_width)
+
+    # Compute elided text
+    elided_text = metrics.elidedText(text, elide_mode, bounding_rect.width())
+
+    # Get bounding rectangle for elided text
+    bounding_rect = metrics.boundingRect(elided_text)
+    # It seems that for small characters like "..." the bounding rect returned is too small. Adjust it by a small
+    # value.
+    metrics_correction = px(1/72)
+    bounding_rect.adjust(-metrics_correction, 0, metrics_correction, 0)
+
+    return elided_text, bounding_rect
 
 
 class TextLineItem(QAbstractGraphicsShapeItem):
@@ -97,25 +144,12 @@ class TextLineItem(QAbstractGraphicsShapeItem):
         return self.background.brush()
 
     def adjust(self):
-        """Adjust the item's geometry in response to changes."""
-        metrics = QFontMetricsF(self.font())
-
-        # Get bounding rectangle for full text
-        self._bounding_rect = metrics.boundingRect(self.text())
-
-        # Constrain by maximum width
-        if self.maximumWidth() is not None:
-            self._bounding_rect.setWidth(self.maximumWidth())
-
-        # Compute elided text
-        self._elided_text = metrics.elidedText(self.text(), self.elideMode(), self.boundingRect().width())
-
-        # Get bounding rectangle for elided text
-        self._bounding_rect = metrics.boundingRect(self.elidedText())
-        # It seems that for small characters like "..." the bounding rect returned is too small. Adjust it by a small
-        # value.
-        metrics_correction = px(1/72)
-        self._bounding_rect.adjust(-metrics_correction, 0, metrics_correction, 0)
+        """Adjust the item's geometry in response to changes.
+        Text layouts are cached and shared between all text items, so items with the same font and text are only
+        measured once.
+        """
+        self._elided_text, bounding_rect = _textLayout(self.font(), self.text(), self.maximumWidth(), self.elideMode())
+        self._bounding_rect = QRectF(bounding_rect)
 
         # Move origin point according to the alignment
         if self.alignMode() & Qt.AlignLeft:
@@ -1,49 +1,113 @@
 """Converts units in inches to units in pixels using logical dpi of the application."""
-from typing import Union
+from typing import Union, Iterable
 from PySide2.QtCore import QPoint, QPointF, QSize, QSizeF, QRect, QRectF
 from PySide2.QtWidgets import QApplication, QWidget
 
+_dpi = None
+"""Cached logical dpi of the application, or None if it needs to be measured."""
+_watched_app = None
+"""Application whose screens are watched for dpi changes."""
+
 
 def dpi():
-    """Return this application's logical dpi"""
+    """Return this application's logical dpi.
+    The dpi is measured once and cached until the primary screen or its logical dpi changes.
+    """
+    global _dpi
+
+    if _dpi is not None:
+        return _dpi
+
     # Check if the application has been created. If the application has not been created, dpi cannot be measured.
-    if QApplication.instance() is None:
+    app = QApplication.instance()
+    if app is None:
         raise RuntimeError("dpi(): Must construct a QApplication before measuring dpi")
 
-    return QWidget().logicalDpiX()
+    _watch(app)
+    _dpi = QWidget().logicalDpiX()
+    return _dpi
+
+
+def invalidate_dpi():
+    """Forget the cached dpi, so that it is measured again on next call to `dpi()`."""
+    global _dpi
+    _dpi = None
+
+
+def _watch(app: QApplication):
+    """Invalidate cached dpi when the primary screen of `app` changes, or when its logical dpi changes."""
+    global _watched_app
+
+    if _watched_app is app:
+        return
+
+    _watched_app = app
+    app.primaryScreenChanged.connect(_onPrimaryScreenChanged)
+    _onPrimaryScreenChanged(app.primaryScreen())
+
+
+def _onPrimaryScreenChanged(screen):
+    invalidate_dpi()
+
+    if screen is not None:
+        screen.logicalDotsPerInchChanged.connect(invalidate_dpi)
 
 
 def inches_to_pixels(value: Union[int, float, QPoint, QPointF, QSize, QSizeF, QRect, QRectF]):
     """Convert a value in inches to a value in pixels.
     Supports values: plain numbers, QPoint, QPointF, QSize, QSizeF, QRect, QRectF.
     """
+    return _multiply(value, dpi())
+
+
+def pixels_to_inches(value):
+    """Convert a value in pixels to a value in inches."""
+    return _divide(value, dpi())
+
+
+def inches_to_pixels_all(values: Iterable) -> list:
+    """Convert many values in inches to values in pixels. Returns a list.
+    Supports the same values as `inches_to_pixels`. Dpi is only looked up once for all values.
+    """
+    factor = dpi()
+    return [_multiply(value, factor) for value in values]
+
+
+def pixels_to_inches_all(values: Iterable) -> list:
+    """Convert many values in pixels to values in inches. Returns a list.
+    Supports the same values as `pixels_to_inches`. Dpi is only looked up once for all values.
+    """
+    factor = dpi()
+    return [_divide(value, factor) for value in values]
+
+
+def _multiply(value, factor):
     if type(value) is QRect:
         return QRect(
-            value.topLeft() * dpi(),
-            value.bottomRight() * dpi()
+            value.topLeft() * factor,
+            value.bottomRight() * factor
         )
 
     if type(value) is QRectF:
         return QRectF(
-            value.topLeft() * dpi(),
-            value.bottomRight() * dpi()
+            value.topLeft() * factor,
+            value.bottomRight() * factor
         )
 
-    return value * dpi()
+    return value * factor
 
 
-def pixels_to_inches(value):
-    """Convert a value in pixels to a value in inches."""
+def _divide(value, factor):
     if type(value) is QRect:
         return QRect(
-            value.topLeft() / dpi(),
-            value.bottomRight() / dpi()
+            value.topLeft() / factor,
+            value.bottomRight() / factor
         )
 
     if type(value) is QRectF:
         return QRectF(
-            value.topLeft() / dpi(),
-            value.bottomRight() / dpi()
+            value.topLeft() / factor,
+            value.bottomRight() / factor
         )
 
-    return value / dpi()
+    return value / factor
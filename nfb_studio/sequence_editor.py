@@ -1,156 +1,159 @@
 from PySide2.QtCore import Qt
-from PySide2.QtWidgets import QButtonGroup, QRadioButton, QWidget, QVBoxLayout, QDockWidget, QScrollArea, QLabel, QSizePolicy
-from .scheme import SchemeEditor
-from .scheme.graph import Graph
+from PySide2.QtWidgets import QWidget, QVBoxLayout, QDockWidget, QLabel, QGraphicsScene
+from .scheme import SchemeEditor, ErrorMessage
+from .sequence_index import SequenceIndex
+from .sequence_list import SequenceList
+
+
+class CycleMessage(ErrorMessage):
+    """Error message that is shown on nodes that are part of a cycle.
+    It is recomputed whenever the scheme changes, so it is never saved.
+    """
+    transient = True
+
+    def __init__(self, parent=None):
+        super().__init__("Part of a cycle in the sequence", parent)
 
 
 class SequenceEditor(SchemeEditor):
+    selector_limit = 1000
+    """Maximum number of sequences listed in the sequence selector."""
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._sequences = []
-        """All sequences as a list of tuples (seq_as_graph, seq_as_list, radio_button)"""
+        self._index = SequenceIndex(limit=self.selector_limit)
+
+        self.sequence_list = SequenceList(self)
+        """All listed sequences, with the active one."""
 
         self.selector_placeholder = QLabel("(none)")
         self.selector_placeholder.setAlignment(Qt.AlignCenter)
 
-        self.selector = None
-        self.selector_button_group = None
+        self.selector = self.sequence_list.getView()
+        self.selector.clicked.connect(lambda index: self.selectSequence(self.sequences()[index.row()]))
+
+        self.selector_overflow = QLabel()
+        self.selector_overflow.setAlignment(Qt.AlignCenter)
+        self.selector_overflow.hide()
+
+        selector_widget = QWidget()
+        layout = QVBoxLayout()
+        layout.addWidget(self.selector_placeholder)
+        layout.addWidget(self.selector)
+        layout.addWidget(self.selector_overflow)
+        selector_widget.setLayout(layout)
 
-        self.selector_scroll_area = QScrollArea()
         self.selector_dock = QDockWidget("Active Sequence", self)
-        self.selector_dock.setWidget(self.selector_scroll_area)
+        self.selector_dock.setWidget(selector_widget)
         self.selector_dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
         self.selector_dock.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable)
         self.addDockWidget(Qt.LeftDockWidgetArea, self.selector_dock)
 
     def setScheme(self, scheme):
         super().setScheme(scheme)
+        self._index.setGraph(scheme.graph)
         self.scheme().graphChanged.connect(self._updateSelector)
         self._updateSelector()
 
     def sequences(self):
-        """Return a list of tuples (sequence_as_graph, sequence_as_list, sequence_button)."""
-        return self._sequences
+        """Return a list of listed sequences, each one a tuple of nodes."""
+        return self.sequence_list.sequences()
     
     def selectedSequence(self):
-        """Return a tuple (sequence_as_graph, sequence_as_list, sequence_button) of the selected sequence."""
-        checked = [s for s in self.sequences() if s[2].isChecked()]
-        
-        assert len(checked) <= 1
-        if len(checked) == 1:
-            return checked[0]
-        return None
+        """Return the active sequence as a tuple of nodes, or None if there are no sequences."""
+        return self.sequence_list.activeSequence()
 
-    def _updateSelector(self):
-        sequences = list(self._possibleSequences())
-        
-        # Build a new widget with all the new options
-        selector = QWidget()
-        layout = QVBoxLayout()
-        layout.setSizeConstraint(layout.SetMinAndMaxSize)
-        layout.addWidget(self.selector_placeholder)
-        selector.setLayout(layout)
-        self.selector_scroll_area.setWidget(selector)
-        self.selector_button_group = QButtonGroup()
-        self.selector = selector
+    def setSelectedSequence(self, sequence):
+        """Make `sequence`, a tuple of nodes from `sequences()`, the active sequence."""
+        self.sequence_list.setActiveRow(self.sequences().index(sequence))
+
+    def selectSequence(self, sequence):
+        """Select nodes of a sequence and edges between them in the scheme."""
+        scheme = self.scheme()
+        scheme.clearSelection()
+
+        for node, next_node in zip(sequence, sequence[1:]):
+            node.setSelected(True)
+
+            for edge in scheme.graph.outgoingEdges(node):
+                if edge.targetNode() is next_node:
+                    edge.setSelected(True)
+
+        sequence[-1].setSelected(True)
+
+    def _updateSelector(self, delta=None):
+        """Update the sequence selector.
+        Connected to `graphChanged` of the scheme, which sends a GraphDelta as `delta`. Sequences are taken from a
+        SequenceIndex, which only enumerates again the parts of the scheme that were changed.
+        """
+        selected = self.selectedSequence()
+
+        if delta is None:
+            self._index.clear()
+        else:
+            self._index.update(delta)
+
+        sequences = self._index.sequences()
+        self.sequence_list.setSequences(sequences)
+        self._updateCycleMessages(self._index.cycles())
+
+        hidden_count = self._index.count() - len(sequences)
+        self.selector_overflow.setText("({} more sequences not listed)".format(hidden_count))
+        self.selector_overflow.setVisible(hidden_count > 0)
         
         if len(sequences) == 0:
             self.selector_placeholder.show()
+            self.selector.hide()
             return
         self.selector_placeholder.hide()
+        self.selector.show()
 
-        # Some black magic because of problems with scopes
-        def selectSequence(seq):
-            self.scheme().clearSelection()
-            seq[0].selectAll()
+        # Determine which sequence should be active considering previous selection
+        self.sequence_list.setActiveRow(self._followingRow(selected))
 
-        def makeSelectSequence(seq):
-            return lambda: selectSequence(seq)
-        # End of black magic
+    def _updateCycleMessages(self, cycles):
+        """Show an error message on every node that is part of a cycle, and remove it from nodes that no longer are."""
+        cycle_nodes = {node for cycle in cycles for node in cycle}
 
-        self._sequences = []
-        for sgraph, slist in sequences:
-            label = " → ".join([node.title() for node in slist])
+        for node in self.scheme().graph.nodes:
+            messages = [message for message in node.messages if isinstance(message, CycleMessage)]
 
-            button = QRadioButton(label)
-            button.clicked.connect(makeSelectSequence((sgraph, slist)))
+            if node in cycle_nodes:
+                if len(messages) == 0:
+                    node.addMessage(CycleMessage())
+                continue
 
-            self.selector_button_group.addButton(button)
-            layout.addWidget(button)
-            self._sequences.append((sgraph, slist, button))
-        
-        # Now that the new widget was built, determine which point should be selected considering previous selection
-        selected = self.selectedSequence()
+            for message in messages:
+                node.removeMessage(node.messages.index(message))
 
+                # Messages are not a part of the graph, so Scheme.removeItem is bypassed
+                if message.scene() is not None:
+                    QGraphicsScene.removeItem(message.scene(), message)
+
+    def _followingRow(self, selected):
+        """Return the row of the sequence that should become active after `selected` was the active sequence."""
         if selected is None:
             # If no previous selection, select the first one
-            self._sequences[0][2].setChecked(True)
-            return
+            return 0
 
         candidates = []
-        for sgraph, slist, button in self._sequences:
-            # Analyze every new option
-            if selected[0] <= sgraph:
+        for row, sequence in enumerate(self.sequences()):
+            # Analyze every new option. Subset tests compare bitsets of node IDs.
+            if selected.issubset(sequence):
                 # If old selection is a subset of a new option, that means a new node was attached and current selection
                 # should be expanded
-                button.setChecked(True)
-                return
+                return row
             
-            if sgraph <= selected[0]:
+            if sequence.issubset(selected):
                 # This option is a subset of previous option, which means that something was deleted. If an edge was
                 # removed, there may be other parts of previous options, add them all to candidates for new selection.
-                candidates.append((sgraph, slist, button))
-
-        if len(candidates) == 0:
-            # If there are no candidates, select the first option.
-            self._sequences[0][2].setChecked(True)
-            return
+                candidates.append((sequence, row))
 
-        for node in selected[1]:
+        for node in selected:
             # For each node in order in prev. selection, see if any candidates have it. Select the first mathcing one.
-            for sgraph, slist, button in candidates:
-                if node in sgraph:
-                    button.setChecked(True)
-                    return
-
-    def _possibleSequences(self):
-        """Return a list of tuples, where each tuple represents a possible experiment sequence.
-        Tuple contains 2 items: a graph-view of the sequence, and a list of nodes of that sequence in order.
-        """
-        g = self.scheme().graph
-
-        for node in g.nodes:
-            if len(node.inputs) == 0 or len(list(node.inputs[0].edges)) == 0:
-                for sequence in self._possibleSequencesFrom(node):
-                    yield sequence
+            for sequence, row in candidates:
+                if sequence.contains(node):
+                    return row
 
-    def _possibleSequencesFrom(self, node):
-        """Return a list of tuples, where each tuple represents a possible experiment sequence starting from this node.
-        Tuple contains 2 items: a graph-view of the sequence, and a list of nodes of that sequence in order.
-        """
-        has_sequences = False
-
-        for out in node.outputs:
-            for edge in out.edges:
-                connected = edge.targetNode()
-
-                if connected is None:
-                    # Filter for edges with no target nodes. These are usually fake edges that the user drags.
-                    # When they drop and become real, they will have a node.
-                    continue
-
-                for sequence_graph, sequence_list in self._possibleSequencesFrom(connected):
-                    sequence_graph.add(node)
-                    sequence_graph.add(edge)
-                    sequence_list.insert(0, node)
-                    
-                    yield (sequence_graph, sequence_list)
-                    has_sequences = True
-        
-        if not has_sequences:
-            # If no sequences could be built, this node is the final node.
-            # In this case, just yield itself.
-            result = (Graph(), list())
-            result[0].add(node)
-            result[1].append(node)
-            yield result
+        # If there are no candidates, select the first option.
+        return 0
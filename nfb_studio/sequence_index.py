@@ -0,0 +1,261 @@
+"""Index of possible experiment sequences in a sequence scheme."""
+from .scheme.graph import Graph, GraphDelta
+
+
+class SequenceIndex:
+    """All possible experiment sequences in a graph of sequence nodes.
+
+    A sequence is a path that starts at a node without incoming edges and follows outgoing edges until it reaches a node
+    without outgoing edges.
+    Sequences that start at each node are memoized, unless a cycle goes through the node. A sequence is stored as a
+    linked tuple `(node, rest)`, where `rest` is the sequence that continues from the next node, or None. This way
+    sequences that end the same way share their tails. When the graph changes, only memoized sequences of changed nodes
+    and nodes upstream of them are forgotten.
+
+    Branching sequences can produce exponentially many paths, so at most `limit` sequences are enumerated from each
+    node. The total number of sequences is still counted.
+    """
+    def __init__(self, graph: Graph = None, limit=1000):
+        self._graph = graph
+        self._limit = limit
+
+        self._suffixes = {}
+        """Sequences that start at a node, as linked tuples. Maps a node to a tuple of at most `limit` sequences."""
+        self._counts = {}
+        """Number of sequences that start at a node. Maps a node to an int."""
+        self._parents = {}
+        """Nodes whose memoized sequences go through a node. Maps a node to a set of nodes."""
+        self._edge_sources = {}
+        """Source nodes of edges that were followed, in case an edge is detached before it is reported as removed."""
+        self._cycles = {}
+        """Cycles found while walking the graph. Maps a node to a list of cycles (tuples of nodes) closed by its
+        edges."""
+
+    def graph(self) -> Graph:
+        return self._graph
+
+    def setGraph(self, graph: Graph):
+        self._graph = graph
+        self.clear()
+
+    def limit(self):
+        return self._limit
+
+    def clear(self):
+        """Forget all memoized sequences."""
+        self._suffixes.clear()
+        self._counts.clear()
+        self._parents.clear()
+        self._edge_sources.clear()
+        self._cycles.clear()
+
+    def update(self, delta: GraphDelta):
+        """Forget memoized sequences that are affected by changes to the graph."""
+        dirty = list(delta.added_nodes) + list(delta.removed_nodes)
+
+        for edge in delta.added_edges:
+            dirty.append(edge.sourceNode())
+        for edge in delta.removed_edges:
+            dirty.append(self._edge_sources.pop(edge, None) or edge.sourceNode())
+
+        # Forget memoized sequences of changed nodes and every node upstream of them. Nodes inside a cycle may have no
+        # memoized sequences of their own, while nodes upstream of them do, so the walk does not stop at such nodes.
+        seen = set()
+        while dirty:
+            node = dirty.pop()
+            if node is None or node in seen:
+                continue
+            seen.add(node)
+
+            self._suffixes.pop(node, None)
+            self._counts.pop(node, None)
+            self._cycles.pop(node, None)
+            dirty.extend(self._parents.pop(node, ()))
+
+    # Sequences ========================================================================================================
+    def roots(self) -> list:
+        """Return a list of nodes that sequences start from."""
+        return [node for node in self._graph.nodes if len(self._graph.incomingEdges(node)) == 0]
+
+    def children(self, node) -> list:
+        """Return a list of nodes that follow `node` in sequences."""
+        result = []
+
+        for edge in self._graph.outgoingEdges(node):
+            child = edge.targetNode()
+            if child is not None:
+                self._edge_sources[edge] = node
+                result.append(child)
+
+        return result
+
+    def sequencesFrom(self, node) -> tuple:
+        """Return a tuple of at most `limit` sequences that start at `node`, as linked tuples."""
+        if node in self._suffixes:
+            return self._suffixes[node]
+
+        return self._walk(node)[0]
+
+    def _walk(self, start):
+        """Memoize sequences that start at `start` and at every node after it.
+        Nodes are walked depth-first with an explicit stack, so long sequences do not hit the recursion limit. Every
+        node is walked once, so a sequence of n nodes takes O(n) time. An edge to a node that is already on the stack
+        closes a cycle. Such edges are not followed, and the cycle is recorded under the node that the edge goes from.
+
+        If an edge from a node or from nodes after it to this node or a node further up the stack was cut, the sequences
+        of that node depend on where the walk entered the cycle. They are passed up the stack, but not memoized.
+        Returns a tuple (sequences, count) for `start`.
+        """
+        stack = [_Frame(start, self.children(start), 0)]
+        depth = {start: 0}  # Position of each node on the stack
+
+        while stack:
+            frame = stack[-1]
+
+            if frame.next < len(frame.children):
+                child = frame.children[frame.next]
+                frame.next += 1
+                self._parents.setdefault(child, set()).add(frame.node)
+
+                if child in self._suffixes:
+                    self._extend(frame, self._suffixes[child], self._counts[child])
+                elif child in depth:
+                    frame.cut = min(frame.cut, depth[child])
+
+                    cycle = tuple(f.node for f in stack[depth[child]:])
+                    cycles = self._cycles.setdefault(frame.node, [])
+                    if cycle not in cycles:
+                        cycles.append(cycle)
+                else:
+                    depth[child] = len(stack)
+                    stack.append(_Frame(child, self.children(child), len(stack)))
+                continue
+
+            # All children of this node were walked
+            stack.pop()
+            del depth[frame.node]
+
+            if frame.count == 0:
+                frame.suffixes.append((frame.node, None))
+                frame.count = 1
+
+            suffixes = tuple(frame.suffixes)
+            if frame.cut > frame.depth:
+                # No cycle goes through this node, so these sequences are the same wherever the walk came from
+                self._suffixes[frame.node] = suffixes
+                self._counts[frame.node] = frame.count
+
+            if stack:
+                parent = stack[-1]
+                parent.cut = min(parent.cut, frame.cut)
+                self._extend(parent, suffixes, frame.count)
+
+        return suffixes, frame.count
+
+    def _extend(self, frame, suffixes: tuple, count: int):
+        """Add sequences of a child node to sequences of the node in `frame`."""
+        for rest in suffixes:
+            if self._limit is not None and len(frame.suffixes) >= self._limit:
+                break
+            frame.suffixes.append((frame.node, rest))
+
+        frame.count += count
+
+    def sequences(self) -> list:
+        """Return a list of at most `limit` sequences in the graph, as Sequence objects."""
+        result = []
+
+        for root in self.roots():
+            for sequence in self.sequencesFrom(root):
+                if self._limit is not None and len(result) >= self._limit:
+                    return result
+                result.append(unlink(sequence))
+
+        return result
+
+    def count(self) -> int:
+        """Return the total number of sequences in the graph, including those beyond `limit`."""
+        total = 0
+
+        for root in self.roots():
+            self.sequencesFrom(root)
+            total += self._counts[root]
+
+        return total
+
+    def cycles(self) -> list:
+        """Return a list of cycles in the graph, each one a tuple of nodes.
+        Sequences cannot contain cycles. When a cycle is found, the edge that closes it is not followed.
+        """
+        for node in self._graph.nodes:
+            # Nodes that are not reachable from roots can only be reached from a cycle
+            if node not in self._suffixes:
+                self._walk(node)
+
+        # The same cycle can be found from different nodes, starting at a different node each time
+        result = {}
+        for cycles in self._cycles.values():
+            for cycle in cycles:
+                first = min(range(len(cycle)), key=lambda i: cycle[i].itemId())
+                result.setdefault(cycle[first:] + cycle[:first], None)
+
+        return list(result)
+
+
+class _Frame:
+    """A node on the stack of SequenceIndex._walk, with sequences that were found from it so far."""
+    __slots__ = ("node", "children", "depth", "next", "suffixes", "count", "cut")
+
+    def __init__(self, node, children, depth):
+        self.node = node
+        self.children = children
+        self.depth = depth
+        """Position of this frame on the stack."""
+        self.next = 0
+        """Index of the next child to walk."""
+        self.suffixes = []
+        self.count = 0
+        self.cut = depth + 1
+        """Lowest stack position that an edge from this node or nodes after it went to, closing a cycle. If it is not
+        greater than `depth`, a cycle goes through this node."""
+
+
+class Sequence(tuple):
+    """A tuple of nodes of an experiment sequence, in order.
+    Also carries `mask`, a bitset of item IDs of its nodes. Since item IDs are small integers, subset tests and
+    membership tests between sequences are integer operations instead of iterating over nodes:
+    ```python
+    a.issubset(b)     # a.mask & ~b.mask == 0
+    b.contains(node)  # b.mask >> node.itemId() & 1
+    ```
+    """
+    def __new__(cls, nodes=()):
+        obj = super().__new__(cls, nodes)
+
+        # Bits are set in a bytearray and converted once, since OR-ing them into an int one by one takes quadratic time
+        ids = [node.itemId() for node in obj]
+        bits = bytearray(max(ids, default=0) // 8 + 1)
+        for i in ids:
+            bits[i >> 3] |= 1 << (i & 7)
+
+        obj.mask = int.from_bytes(bits, "little")
+        return obj
+
+    def issubset(self, other) -> bool:
+        """Return True if every node of this sequence is also in `other`."""
+        return self.mask & ~other.mask == 0
+
+    def contains(self, node) -> bool:
+        """Return True if `node` is in this sequence."""
+        return self.mask >> node.itemId() & 1 == 1
+
+
+def unlink(sequence) -> Sequence:
+    """Convert a sequence, stored as a linked tuple `(node, rest)`, into a Sequence."""
+    result = []
+
+    while sequence is not None:
+        node, sequence = sequence
+        result.append(node)
+
+    return Sequence(result)
@@ -0,0 +1,104 @@
+from PySide2.QtCore import Qt, QAbstractListModel, QModelIndex, Signal
+from PySide2.QtWidgets import QListView
+
+
+class SequenceList(QAbstractListModel):
+    """A list of possible experiment sequences, one of which is active.
+    Each sequence is a tuple of nodes. Rows are labelled with the titles of their nodes, which are only joined into a
+    label when a view asks for a row, so a view only pays for the rows that it shows.
+    """
+
+    activeChanged = Signal(int)
+    """Emitted when a different sequence is made active. Sends the row of the new active sequence, or -1."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._sequences = []
+        self._active = -1
+        self._labels = {}
+        """Cached row labels. Maps a row to a string."""
+
+    def getView(self):
+        """Get a new QListView suitable for displaying the sequence list."""
+        v = QListView()
+        v.setModel(self)
+
+        v.setSelectionMode(v.NoSelection)
+        v.setUniformItemSizes(True)
+        v.clicked.connect(lambda index: self.setActiveRow(index.row()))
+
+        return v
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._sequences)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        i = index.row()
+
+        if role == Qt.DisplayRole:
+            if i not in self._labels:
+                self._labels[i] = " → ".join([node.title() for node in self._sequences[i]])
+            return self._labels[i]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if i == self._active else Qt.Unchecked
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole):
+        if role == Qt.CheckStateRole and value == Qt.Checked:
+            self.setActiveRow(index.row())
+            return True
+        return False
+
+    def flags(self, index: QModelIndex):
+        default_flags = super().flags(index)
+
+        if index.isValid():
+            return default_flags | Qt.ItemIsUserCheckable
+        return default_flags
+
+    # Sequences ========================================================================================================
+    def sequences(self) -> list:
+        return self._sequences
+
+    def setSequences(self, sequences):
+        """Replace all sequences in the list. No sequence is active afterwards."""
+        self.beginResetModel()
+        self._sequences = list(sequences)
+        self._active = -1
+        self._labels.clear()
+        self.endResetModel()
+
+    def activeRow(self) -> int:
+        """Return the row of the active sequence, or -1 if no sequence is active."""
+        return self._active
+
+    def setActiveRow(self, row: int):
+        if row == self._active:
+            return
+
+        previous = self._active
+        self._active = row
+
+        for i in (previous, row):
+            if 0 <= i < len(self._sequences):
+                self.dataChanged.emit(self.index(i), self.index(i), [Qt.CheckStateRole])
+
+        self.activeChanged.emit(row)
+
+    def activeSequence(self):
+        """Return the active sequence, or None if no sequence is active."""
+        if self._active == -1:
+            return None
+        return self._sequences[self._active]
+
+    def updateTitles(self):
+        """Update row labels after titles of nodes have changed.
+        Rows are updated in place, so the active sequence and the scroll position of views are kept.
+        """
+        self._labels.clear()
+
+        if len(self._sequences) > 0:
+            self.dataChanged.emit(self.index(0), self.index(len(self._sequences) - 1), [Qt.DisplayRole])
@@ -90,8 +90,16 @@ In this example, the encoder and decoder will be able to serialize both `MyClass
     dicts, strings, lists, and numbers. The keys should be strings, but values can be instances of any class, as long as
     that class is serializeable.
 
+Decoders resolve class names from the metadata using a `registry.ClassRegistry`. The resolved classes are cached, and a
+registry can restrict decoding to classes from trusted modules:
+```python
+registry = ClassRegistry(modules=["my_package"])
+decoder = JSONDecoder(registry=registry)  # Decoding a class from another package raises ImportError
+```
+
 .. warning::
     In order for the decoder to know which dicts should be deserialized as which class instances, the encoder adds a
     metadata field to the serialized dictionary called `__class__`. Therefore this dict key is reserved.
 """
 from .hooks import Hooks
+from .registry import ClassRegistry
@@ -1,22 +1,19 @@
 """Backend class managing decoding raw dicts of objects to proper dicts of objects."""
 from typing import Union
-from importlib import import_module
-from inspect import isclass
-from functools import reduce
 
 from ..hooks import Hooks
-
-
-def deepgetattr(obj, attr):
-    """Recurses through an attribute chain to get the ultimate value."""
-    return reduce(getattr, attr.split('.'), obj)
+from ..registry import ClassRegistry, default_registry, deepgetattr
 
 
 class BaseDecoder:
     """Backend class managing decoding raw dicts of objects to proper dicts of objects."""
 
-    def __init__(self, *, hooks: Union[dict, tuple, Hooks] = None):
+    def __init__(self, *, hooks: Union[dict, tuple, Hooks] = None, registry: ClassRegistry = None):
         self.hooks = hooks
+        self.registry = registry or default_registry
+        """Registry that resolves class names from metadata. By default, a registry shared by all decoders is used."""
+        self._classes = None
+        """Resolved class table of a document with interned metadata, as a list of (cls, deserializer) tuples."""
 
     def decode(self, data):
         if isinstance(data, dict):
@@ -36,6 +33,9 @@ class BaseDecoder:
         """Decode a dict object.
         If dict has metadata, this function will call decode_custom after decoding the internal values.
         """
+        if "__header__" in data and "__root__" in data and len(data) == 2:
+            return self.decode_interned(data)
+
         result = {}
         for key, value in data.items():
             result[key] = self.decode(value)
@@ -46,32 +46,55 @@ class BaseDecoder:
         
         return result
 
+    def decode_interned(self, data):
+        """Decode a document with interned metadata, produced by JSONEncoder with `intern_metadata=True`.
+        The document has the layout `{"__header__": {"__classes__": [[module, qualname], ...]}, "__root__": obj}`.
+        """
+        previous_classes = self._classes
+        self._classes = [
+            self.registry.resolve(module_path, class_name)
+            for module_path, class_name in data["__header__"]["__classes__"]
+        ]
+
+        try:
+            return self.decode(data["__root__"])
+        finally:
+            self._classes = previous_classes
+
     def decode_custom(self, data):
-        # The following code is adapted from django.utils.module_loading module.
-        module_path = data["__class__"]["__module__"]
-        class_name = data["__class__"]["__qualname__"]
+        metadata = data["__class__"]
 
-        module = import_module(module_path)
+        if type(metadata) is int:
+            if self._classes is None:
+                raise ValueError("object refers to class {} but the document has no class table".format(metadata))
 
-        # Get the class that needs to be instantiated
-        try:
-            cls = deepgetattr(module, class_name)
-        except AttributeError:
-            message = "module \"{}\" does not define a \"{}\" class".format(module_path, class_name)
-            raise ImportError(message)
+            if not 0 <= metadata < len(self._classes):
+                raise ValueError(
+                    "object refers to class {} but the class table has {} classes".format(metadata, len(self._classes))
+                )
+
+            cls, deserializer = self._classes[metadata]
+            return self._decode_custom(cls, deserializer, data)
 
-        # Verify that cls is in fact a class
-        if not isclass(cls):
-            raise TypeError("{}.{} is not a class".format(module_path, class_name))
+        module_path = metadata["__module__"]
+        class_name = metadata["__qualname__"]
 
+        cls, deserializer = self.registry.resolve(module_path, class_name)
+
+        return self._decode_custom(cls, deserializer, data)
+
+    def _decode_custom(self, cls, deserializer, data):
+        """Decode data into an instance of an already resolved class `cls`.
+        `deserializer` is the function returned by the registry together with `cls`.
+        """
         # Load the json data into the object
         if cls in self.hooks:
             return self.hooks[cls](data)
-        if hasattr(cls, "deserialize") and callable(cls.deserialize):
-            return cls.deserialize(data)
+        if deserializer is not None:
+            return deserializer(data)
         
         message = "{}.{} does not have a callable \"deserialize\" attribute" \
-            .format(module_path, class_name)
+            .format(cls.__module__, cls.__qualname__)
         raise AttributeError(message)
 
     @property
@@ -83,6 +106,6 @@ class BaseDecoder:
         if isinstance(value, dict):
             self._hooks = value
         elif isinstance(value, tuple):  # hooks.Hooks is also a tuple
-            self._hooks = value[0]  # Only serialization functions
+            self._hooks = value[1]  # Only deserialization functions
         else:
             self._hooks = {}
@@ -1,31 +1,27 @@
 from typing import Union
+from functools import partial
 
 from ..hooks import Hooks
+from ..registry import ClassRegistry, default_registry
 
 
 class BaseEncoder:
-    def __init__(self, *, hooks: Union[dict, tuple, Hooks] = None, metadata=True, unknown_objects="error"):
+    def __init__(self, *, hooks: Union[dict, tuple, Hooks] = None, metadata=True, unknown_objects="error",
+                 registry: ClassRegistry = None):
         self.hooks = hooks        
         self.metadata = metadata
         self.unknown_objects = unknown_objects
+        self.registry = registry or default_registry
+        """Registry that provides class names for the metadata. By default, each class is written under its own name."""
 
     def encode(self, obj, /):
-        # Encode known objects
-        if self.encode_function(obj) is not None:
-            # If an object has an encode function, prioritize this encoding function above all
-            return self.encode_custom(obj)
-        if type(obj) in {int, float, str, bool, type(None)}:
-            return obj
-        if type(obj) in {list, tuple, set}:
-            return self.encode_list_like(obj)
-        if type(obj) == dict:
-            return self.encode_dict_like(obj)
-        
-        # If the object could not be encoded, do as indicated in self.unknown_objects
-        if self.unknown_objects == "as-is":
-            return obj
-        if self.unknown_objects == "error":
-            raise TypeError("object of type \"{}\" cannot be encoded".format(type(obj).__qualname__))
+        # Look up how objects of this exact type are encoded. The lookup is resolved once per type and then cached.
+        try:
+            handler = self._dispatch[type(obj)]
+        except KeyError:
+            handler = self._resolve(type(obj))
+
+        return handler(obj)
 
     def encode_list_like(self, obj: Union[list, tuple, set]):
         result = []
@@ -48,6 +44,18 @@ class BaseEncoder:
         func = self.encode_function(obj)
         assert func is not None
         
+        return self._encode_custom(func, obj)
+
+    def encode_unknown(self, obj):
+        """Encode an object that has no encode function and is not a primitive, list-like or dict-like object."""
+        # If the object could not be encoded, do as indicated in self.unknown_objects
+        if self.unknown_objects == "as-is":
+            return obj
+        if self.unknown_objects == "error":
+            raise TypeError("object of type \"{}\" cannot be encoded".format(type(obj).__qualname__))
+
+    def _encode_custom(self, func, obj):
+        """Encode obj using an already known encode function `func`."""
         result = func(obj)
         result = self.encode(result)
         
@@ -65,17 +73,57 @@ class BaseEncoder:
             self.write_metadata(obj, result)
         
         return result
+
+    @staticmethod
+    def _encode_primitive(obj):
+        return obj
     
     def encode_function(self, obj, /):
         """Find a custom encode function for obj, or return None if that function does not exist."""
-        if type(obj) in self.hooks:
-            return self.hooks[type(obj)]
+        return self._encode_function(type(obj))
+
+    def _encode_function(self, cls):
+        """Find a custom encode function for objects of type cls, or return None if that function does not exist."""
+        if cls in self.hooks:
+            return self.hooks[cls]
         
-        if hasattr(obj, "serialize") and callable(obj.serialize):
-            return type(obj).serialize
+        serialize = getattr(cls, "serialize", None)
+        if serialize is not None and callable(serialize):
+            return serialize
         
         return None
 
+    def _resolve(self, cls):
+        """Determine how objects of type cls are encoded and store the result in the dispatch table.
+
+        Returns a function that accepts an object of type cls and returns its encoded value.
+        """
+        func = self._encode_function(cls)
+
+        if func is not None:
+            # If an object has an encode function, prioritize this encoding function above all
+            handler = partial(self._encode_custom, func)
+        elif cls in {int, float, str, bool, type(None)}:
+            handler = self._encode_primitive
+        elif cls in {list, tuple, set}:
+            handler = self.encode_list_like
+        elif cls is dict:
+            handler = self.encode_dict_like
+        else:
+            handler = self.encode_unknown
+
+        self._dispatch[cls] = handler
+        return handler
+
+    def clear_cache(self):
+        """Forget how each type is encoded.
+
+        The encoder resolves the encoding method for each type once, and caches it. The cache is cleared automatically
+        when `hooks` is reassigned. Call this method if the hooks dict was modified in-place, or if a class gained or
+        lost its `serialize` method after it was first encoded.
+        """
+        self._dispatch = {}
+
     def write_metadata(self, obj, data: dict) -> dict:
         """Write metadata that is required to reassemble the object, encoded by BaseEncoder.
 
@@ -94,9 +142,10 @@ class BaseEncoder:
             )
 
         # Add meta information necessary to decode the object later
+        module_path, class_name = self.registry.name(type(obj))
         data["__class__"] = {
-            "__module__": obj.__class__.__module__,
-            "__qualname__": obj.__class__.__qualname__
+            "__module__": module_path,
+            "__qualname__": class_name
         }
 
         return data
@@ -114,6 +163,8 @@ class BaseEncoder:
         else:
             self._hooks = {}
 
+        self.clear_cache()
+
     @property
     def unknown_objects(self):
         return self._unknown_objects
@@ -0,0 +1,46 @@
+"""Serialization support for the compact binary format.
+
+The binary format is an alternative to json for large files. Class names and repeated strings are written once per
+document, and numbers take as few bytes as possible. See `format` for the description of the format.
+"""
+from typing import Union
+
+from ..hooks import Hooks
+from .format import MAGIC
+from .encoder import BinaryEncoder
+from .decoder import BinaryDecoder
+
+_cached_encoder = BinaryEncoder()
+_cached_decoder = BinaryDecoder()
+
+def dumps(obj, *, encoder=None, hooks: Union[dict, tuple, Hooks] = None) -> bytes:
+    if encoder is not None:
+        pass
+    elif hooks is not None:
+        encoder = BinaryEncoder(hooks=hooks)
+    else:
+        encoder = _cached_encoder
+    
+    return encoder.encode(obj)
+
+def dump(obj, fp, *, encoder=None, hooks: Union[dict, tuple, Hooks] = None):
+    """Encode `obj` and write it to a binary file object `fp`."""
+    fp.write(dumps(obj, encoder=encoder, hooks=hooks))
+
+def loads(b, *, decoder=None, hooks: Union[dict, tuple, Hooks] = None):
+    if decoder is not None:
+        pass
+    elif hooks is not None:
+        decoder = BinaryDecoder(hooks=hooks)
+    else:
+        decoder = _cached_decoder
+    
+    return decoder.decode(b)
+
+def load(fp, *, decoder=None, hooks: Union[dict, tuple, Hooks] = None):
+    """Decode an object from a binary file object `fp`."""
+    return loads(fp.read(), decoder=decoder, hooks=hooks)
+
+def is_binary(b) -> bool:
+    """Return True if bytes `b` start with the magic bytes of the binary format."""
+    return bytes(b[:len(MAGIC)]) == MAGIC
@@ -0,0 +1,204 @@
+"""An object-aware decoder from the compact binary format."""
+from nfb_studio.util import expose_property
+
+from ..base import BaseDecoder
+from .format import (MAGIC, VERSION, NONE, FALSE, TRUE, INT, FLOAT, STR, STR_REF, LIST, DICT, OBJECT, FLOAT_STRUCT,
+                     unzigzag)
+
+
+class BinaryDecoder:
+    """Decoder that deserializes objects from the compact binary format.
+
+    Objects are constructed while the data is being read. Each class from the class table is resolved once per document,
+    using the registry of the underlying BaseDecoder.
+    """
+    def __init__(self, **kw):
+        self.base_decoder = BaseDecoder(**kw)
+
+    def decode(self, data: bytes):
+        data = memoryview(data)
+
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("data is not in the binary format")
+        if len(data) <= len(MAGIC) + 1:
+            raise ValueError("unexpected end of data: the document is empty")
+
+        version = data[len(MAGIC)]
+        if version != VERSION:
+            raise ValueError("unsupported binary format version {}".format(version))
+
+        reader = _Reader(self.base_decoder, data, len(MAGIC) + 1)
+        result = reader.read()
+
+        if reader.pos != len(data):
+            raise ValueError("extra data after the end of the document")
+
+        return result
+
+expose_property(BinaryDecoder, "base_decoder", "hooks")
+expose_property(BinaryDecoder, "base_decoder", "registry")
+
+
+class _Reader:
+    """State of a single decoding: the input, the current position, and the string and class tables.
+
+    Every read is checked against the end of the input and every table index against the size of its table, so that
+    truncated or corrupt input raises a ValueError.
+    """
+    def __init__(self, base_decoder: BaseDecoder, data: memoryview, pos: int):
+        self.base_decoder = base_decoder
+        self.data = data
+        self.pos = pos
+        self.end = len(data)
+
+        self.strings = []
+        self.classes = []
+        """List of tuples (metadata, cls, deserializer). `metadata` is the `__class__` dict, shared by all objects."""
+
+    def read(self):
+        data = self.data
+        pos = self.pos
+        if pos + 1 >= self.end:
+            if pos >= self.end:
+                self.truncated()
+            # Only tags without a payload can be the last byte
+            return self.read_last()
+
+        tag = data[pos]
+
+        # Most values are strings from the string table and small numbers, with a single-byte varint
+        if tag == STR_REF and data[pos + 1] < 0x80:
+            self.pos = pos + 2
+            return self.string(data[pos + 1], pos)
+        if tag == INT and data[pos + 1] < 0x80:
+            self.pos = pos + 2
+            return unzigzag(data[pos + 1])
+
+        self.pos = pos + 1
+
+        if tag == STR_REF:
+            return self.string(self.read_varint(), pos)
+        if tag == STR:
+            size = self.read_varint()
+            if self.pos + size > self.end:
+                self.truncated()
+
+            value = str(data[self.pos:self.pos + size], "utf-8")
+            self.pos += size
+
+            self.strings.append(value)
+            return value
+        if tag == OBJECT:
+            return self.read_object()
+        if tag == INT:
+            return unzigzag(self.read_varint())
+        if tag == FLOAT:
+            if self.pos + FLOAT_STRUCT.size > self.end:
+                self.truncated()
+
+            value = FLOAT_STRUCT.unpack_from(data, self.pos)[0]
+            self.pos += FLOAT_STRUCT.size
+            return value
+        if tag == LIST:
+            read = self.read
+            return [read() for _ in range(self.read_varint())]
+        if tag == DICT:
+            read = self.read
+            result = {}
+            for _ in range(self.read_varint()):
+                key_pos = self.pos
+                key = read()
+                value = read()
+                try:
+                    result[key] = value
+                except TypeError:
+                    raise ValueError("invalid dictionary key at position {}".format(key_pos)) from None
+            return result
+        if tag == NONE:
+            return None
+        if tag == TRUE:
+            return True
+        if tag == FALSE:
+            return False
+
+        raise ValueError("invalid tag {} at position {}".format(tag, pos))
+
+    def read_last(self):
+        """Read a value from the last byte of the input."""
+        tag = self.data[self.pos]
+        self.pos += 1
+
+        if tag == NONE:
+            return None
+        if tag == TRUE:
+            return True
+        if tag == FALSE:
+            return False
+        if tag in (INT, FLOAT, STR, STR_REF, LIST, DICT, OBJECT):
+            self.truncated()
+
+        raise ValueError("invalid tag {} at position {}".format(tag, self.pos - 1))
+
+    def read_varint(self) -> int:
+        data = self.data
+        pos = self.pos
+        end = self.end
+        result = 0
+        shift = 0
+
+        while True:
+            if pos >= end:
+                self.truncated()
+            byte = data[pos]
+            pos += 1
+
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+
+        self.pos = pos
+        return result
+
+    def string(self, index: int, pos: int) -> str:
+        """Return a string from the string table. `pos` is the position of the reference, for error messages."""
+        if index >= len(self.strings):
+            raise ValueError("invalid string reference {} at position {}".format(index, pos))
+        return self.strings[index]
+
+    def truncated(self):
+        raise ValueError("unexpected end of data at position {}: the document is truncated".format(self.end))
+
+    def read_object(self):
+        pos = self.pos - 1
+        index = self.read_varint()
+
+        if index > len(self.classes):
+            raise ValueError("invalid class reference {} at position {}".format(index, pos))
+
+        if index == len(self.classes):
+            module_path = self.read()
+            class_name = self.read()
+            if type(module_path) is not str or type(class_name) is not str:
+                raise ValueError("invalid class name at position {}".format(pos))
+
+            cls, deserializer = self.base_decoder.registry.resolve(module_path, class_name)
+            metadata = {"__module__": module_path, "__qualname__": class_name}
+
+            self.classes.append((metadata, cls, deserializer))
+        
+        metadata, cls, deserializer = self.classes[index]
+
+        read = self.read
+        data = {}
+        for _ in range(self.read_varint()):
+            key_pos = self.pos
+            key = read()
+            value = read()
+            try:
+                data[key] = value
+            except TypeError:
+                raise ValueError("invalid field name at position {}".format(key_pos)) from None
+        data["__class__"] = metadata
+
+        return self.base_decoder._decode_custom(cls, deserializer, data)
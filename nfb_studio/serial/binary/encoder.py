@@ -0,0 +1,118 @@
+"""An object-aware encoder into the compact binary format."""
+from nfb_studio.util import expose_property
+
+from ..base import BaseEncoder
+from .format import (MAGIC, VERSION, NONE, FALSE, TRUE, INT, FLOAT, STR, STR_REF, LIST, DICT, OBJECT, FLOAT_STRUCT,
+                     write_varint, zigzag)
+
+
+class BinaryEncoder:
+    """Encoder that serializes objects into the compact binary format.
+
+    Objects are first converted into dicts, lists and primitives with a BaseEncoder, same as in other encoders. Instead
+    of writing the `__class__` metadata into every object, the binary format keeps a table of classes and writes an
+    index in that table. Strings are written once and referred to by index afterwards. See `format` for details.
+
+    Unlike JSON, the binary format keeps dict keys of any primitive type, not only strings.
+    """
+    def __init__(self, **kw):
+        kw["unknown_objects"] = "error"
+        self.base_encoder = BaseEncoder(**kw)
+
+    def encode(self, obj) -> bytes:
+        data = self.base_encoder.encode(obj)
+
+        writer = _Writer()
+        writer.buffer += MAGIC
+        writer.buffer.append(VERSION)
+        writer.write(data)
+
+        return bytes(writer.buffer)
+
+expose_property(BinaryEncoder, "base_encoder", "hooks")
+expose_property(BinaryEncoder, "base_encoder", "metadata")
+expose_property(BinaryEncoder, "base_encoder", "registry")
+
+
+class _Writer:
+    """State of a single encoding: the output buffer, and the string and class tables."""
+    def __init__(self):
+        self.buffer = bytearray()
+        self.strings = {}
+        """Maps strings that were already written to their index in the string table."""
+        self.classes = {}
+        """Maps (module, qualname) pairs that were already written to their index in the class table."""
+
+    def write(self, value):
+        buffer = self.buffer
+        cls = type(value)
+
+        if cls is str:
+            self.write_str(value)
+        elif cls is dict:
+            metadata = value.get("__class__")
+            if type(metadata) is dict and len(metadata) == 2 and "__module__" in metadata and "__qualname__" in metadata:
+                self.write_object(metadata["__module__"], metadata["__qualname__"], value)
+            else:
+                buffer.append(DICT)
+                write_varint(buffer, len(value))
+                for key, item in value.items():
+                    self.write(key)
+                    self.write(item)
+        elif cls is list:
+            buffer.append(LIST)
+            write_varint(buffer, len(value))
+            for item in value:
+                self.write(item)
+        elif value is None:
+            buffer.append(NONE)
+        elif value is True:
+            buffer.append(TRUE)
+        elif value is False:
+            buffer.append(FALSE)
+        elif cls is int:
+            buffer.append(INT)
+            write_varint(buffer, zigzag(value))
+        elif cls is float:
+            buffer.append(FLOAT)
+            buffer += FLOAT_STRUCT.pack(value)
+        else:
+            raise TypeError("object of type \"{}\" cannot be encoded".format(cls.__qualname__))
+
+    def write_str(self, value: str):
+        buffer = self.buffer
+        index = self.strings.get(value)
+
+        if index is not None:
+            buffer.append(STR_REF)
+            write_varint(buffer, index)
+        else:
+            self.strings[value] = len(self.strings)
+
+            encoded = value.encode("utf-8")
+            buffer.append(STR)
+            write_varint(buffer, len(encoded))
+            buffer += encoded
+
+    def write_object(self, module_path: str, class_name: str, data: dict):
+        buffer = self.buffer
+        buffer.append(OBJECT)
+
+        key = (module_path, class_name)
+        index = self.classes.get(key)
+
+        if index is not None:
+            write_varint(buffer, index)
+        else:
+            index = len(self.classes)
+            self.classes[key] = index
+
+            write_varint(buffer, index)
+            self.write_str(module_path)
+            self.write_str(class_name)
+
+        write_varint(buffer, len(data) - 1)  # Without the metadata
+        for key, item in data.items():
+            if key != "__class__":
+                self.write(key)
+                self.write(item)
@@ -0,0 +1,59 @@
+"""Constants and primitives of the binary format.
+
+A binary document starts with the `MAGIC` bytes, followed by a single byte with the format `VERSION`, followed by one
+encoded value. Each value starts with a one-byte tag:
+
+| Tag        | Followed by                                                                                          |
+|------------|------------------------------------------------------------------------------------------------------|
+| NONE       | nothing                                                                                              |
+| FALSE      | nothing                                                                                              |
+| TRUE       | nothing                                                                                              |
+| INT        | a zigzag-encoded varint                                                                              |
+| FLOAT      | 8 bytes, a little-endian IEEE 754 double                                                             |
+| STR        | a varint length and that many bytes of UTF-8. The string is appended to the string table             |
+| STR_REF    | a varint index in the string table                                                                   |
+| LIST       | a varint item count and that many values                                                             |
+| DICT       | a varint item count and that many key-value pairs of values                                          |
+| OBJECT     | a varint index in the class table, a varint field count, and that many key-value pairs of values     |
+
+Both tables start empty and are filled in the order of the document. An OBJECT whose class index is equal to the size of
+the class table defines a new class: the index is followed by two string values, the module and the qualified name of
+the class.
+"""
+from struct import Struct
+
+MAGIC = b"NFBX"
+"""Bytes, with which every binary document starts."""
+VERSION = 1
+"""Version of the format, written after the magic bytes."""
+
+NONE = 0
+FALSE = 1
+TRUE = 2
+INT = 3
+FLOAT = 4
+STR = 5
+STR_REF = 6
+LIST = 7
+DICT = 8
+OBJECT = 9
+
+FLOAT_STRUCT = Struct("<d")
+
+
+def write_varint(buffer: bytearray, value: int):
+    """Append a non-negative int to `buffer`, 7 bits per byte, least significant group first."""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def zigzag(value: int) -> int:
+    """Map a signed int to a non-negative int, so that numbers with a small absolute value have short varints."""
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value: int) -> int:
+    """Inverse of `zigzag`."""
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
@@ -2,12 +2,84 @@
 
 Internally, all serialization algorithms are based on json. See top-level documentation for usage examples.
 
+Functions `dumps`, `loads`, `dump` and `load` mimic the functions from the json module, but use object-aware encoders and
+decoders from this module. `dump` writes to the file while the object is being encoded, so the full text is never held
+in memory.
+
 See Also
 --------
 encoder.JSONEncoder : An object-aware JSON encoder.
 decoder.JSONDecoder : An object-aware JSON decoder.
 """
-from json import load, loads, dump, dumps
+import json
+from typing import Union
 
+from ..hooks import Hooks
 from .encoder import JSONEncoder
 from .decoder import JSONDecoder
+
+_cached_encoder = JSONEncoder()
+_cached_decoder = JSONDecoder()
+
+_write_size = 64 * 1024
+"""Approximate number of characters that `dump` collects before writing them to the file."""
+
+def dumps(obj, *, encoder=None, hooks: Union[dict, tuple, Hooks] = None):
+    if encoder is not None:
+        pass
+    elif hooks is not None:
+        encoder = JSONEncoder(hooks=hooks)
+    else:
+        encoder = _cached_encoder
+    
+    return encoder.encode(obj)
+
+def dump(obj, fp, *, encoder=None, hooks: Union[dict, tuple, Hooks] = None):
+    """Encode `obj` and write it to a text file object `fp`.
+    The text is written in pieces as it is being encoded. Small pieces, produced by the encoder, are joined into larger
+    ones, so that `fp.write` is called once per several kilobytes of text.
+    """
+    if encoder is not None:
+        pass
+    elif hooks is not None:
+        encoder = JSONEncoder(hooks=hooks)
+    else:
+        encoder = _cached_encoder
+
+    buffer = []
+    size = 0
+
+    for chunk in encoder.iterencode(obj):
+        buffer.append(chunk)
+        size += len(chunk)
+
+        if size >= _write_size:
+            fp.write("".join(buffer))
+            buffer.clear()
+            size = 0
+
+    if buffer:
+        fp.write("".join(buffer))
+
+def loads(s, *, decoder=None, hooks: Union[dict, tuple, Hooks] = None):
+    """Decode an object from a string.
+    `s` can also be bytes or bytearray, in which case its encoding (UTF-8, UTF-16 or UTF-32) is detected automatically.
+    """
+    if decoder is not None:
+        pass
+    elif hooks is not None:
+        decoder = JSONDecoder(hooks=hooks)
+    else:
+        decoder = _cached_decoder
+
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode(json.detect_encoding(s), "surrogatepass")
+    
+    return decoder.decode(s)
+
+def load(fp, *, decoder=None, hooks: Union[dict, tuple, Hooks] = None):
+    """Decode an object from a text or binary file object `fp`.
+    The json module can only parse a complete document, so the contents of the file are read at once. Custom objects are
+    constructed while the text is being parsed, and no intermediate tree of dicts is created.
+    """
+    return loads(fp.read(), decoder=decoder, hooks=hooks)
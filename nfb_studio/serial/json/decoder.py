@@ -1,10 +1,17 @@
 """An object-aware JSON decoder."""
+import re
 import json
-from importlib import import_module
-from inspect import isclass
 from typing import Union
 
 from ..hooks import Hooks
+from ..registry import ClassRegistry, default_registry
+
+_HEADER = re.compile(r'\{[ \t\n\r]*"__header__"[ \t\n\r]*:[ \t\n\r]*')
+"""Start of a document with interned metadata, up to the value of `__header__`."""
+_ROOT = re.compile(r'[ \t\n\r]*,[ \t\n\r]*"__root__"[ \t\n\r]*:[ \t\n\r]*')
+"""Part of a document with interned metadata between the header and the value of `__root__`."""
+_END = re.compile(r'[ \t\n\r]*\}')
+"""End of a document with interned metadata, after the value of `__root__`."""
 
 
 class JSONDecoder(json.JSONDecoder):
@@ -24,6 +31,11 @@ class JSONDecoder(json.JSONDecoder):
 
     JSONDecoder does not accept an `object_hook` or `object_pairs_hook` parameter from JSONDecoder.
 
+    Documents, written by JSONEncoder with `intern_metadata=True`, are also supported. Such a document is an object
+    with two keys: `__header__`, which contains the class table, followed by `__root__`. The class table is only read
+    from the header of the top-level object. Because the class table is remembered during decoding, a single
+    JSONDecoder object should not decode several documents at the same time.
+
     .. note::
         If the metadata `__class__` field does not exist, the decoder leaves the dictionary as-is. If the field exists
         but was corrupted in some way, an exception will be raised.
@@ -32,8 +44,8 @@ class JSONDecoder(json.JSONDecoder):
     --------
     nfb_studio.serialize.encoder.JSONEncoder : An object-aware JSON encoder.
     """
-    def __init__(self, *, hooks: Union[dict, tuple, Hooks] = None, parse_float=None, parse_int=None,
-                 parse_constant=None, strict=True, **kw):
+    def __init__(self, *, hooks: Union[dict, tuple, Hooks] = None, registry: ClassRegistry = None, parse_float=None,
+                 parse_int=None, parse_constant=None, strict=True, **kw):
         """Constructs the JSONDecoder object.
         
         Mostly inherits JSONDecoder parameters from the standard json module, except for `object_hook` and
@@ -44,6 +56,10 @@ class JSONDecoder(json.JSONDecoder):
         hooks : dict, tuple, or Hooks object (default: None)
             A dict, mapping types to functions that can be used to deserialize them in the format
             `def foo(obj, data: dict)`, a tuple containing such dict as its element 1, or a `hooks.Hooks` object;
+        registry : ClassRegistry (default: None)
+            A registry that resolves class names from the metadata into classes. If None, a registry shared by all
+            decoders is used, which can import classes from any module. Pass a registry with a restricted set of
+            modules to decode untrusted data;
         parse_float : callable (default: None)
             If specified, will be called with the string of every JSON float to be decoded. By default, this is
             equivalent to float(num_str). This can be used to use another datatype or parser for JSON floats
@@ -65,6 +81,10 @@ class JSONDecoder(json.JSONDecoder):
         else:
             self.hooks = {}
 
+        self.registry = registry or default_registry
+        self._classes = None
+        """Resolved class table of the document that is being decoded, as a list of (cls, deserializer) tuples."""
+
         # Object hook used to handle custom deserialization
         def object_hook(data: dict):
             """An object hook for the JSONDecoder.
@@ -77,7 +97,8 @@ class JSONDecoder(json.JSONDecoder):
             Raises
             ------
             ImportError
-                If no class specified by the encoder exists in the module specified by the encoder.
+                If no class specified by the encoder exists in the module specified by the encoder;
+                If the module specified by the encoder is not allowed by the registry.
             TypeError
                 If an attribute specified by the encoder exists in the specified module, but it's not a class;
                 If the specified class exists but is not default-constructible;
@@ -90,28 +111,33 @@ class JSONDecoder(json.JSONDecoder):
                 return data
 
             # This looks like json notation of a python object. Create it and deserialize json into it.
-            # The following code is adapted from django.utils.module_loading module.
-            module_path = data["__class__"]["__module__"]
-            class_name = data["__class__"]["__qualname__"]
+            metadata = data["__class__"]
+
+            if type(metadata) is int:
+                if self._classes is None:
+                    raise ValueError("object refers to class {} but the document has no class table".format(metadata))
 
-            module = import_module(module_path)
+                if not 0 <= metadata < len(self._classes):
+                    raise ValueError(
+                        "object refers to class {} but the class table has {} classes".format(
+                            metadata, len(self._classes)
+                        )
+                    )
 
-            # Get the class that needs to be instantiated --------------------------------------------------------------
-            try:
-                cls = getattr(module, class_name)
-            except AttributeError:
-                message = "module \"{}\" does not define a \"{}\" class".format(module_path, class_name)
-                raise ImportError(message)
+                cls, deserializer = self._classes[metadata]
+                module_path = cls.__module__
+                class_name = cls.__qualname__
+            else:
+                module_path = metadata["__module__"]
+                class_name = metadata["__qualname__"]
 
-            # Verify that cls is in fact a class -----------------------------------------------------------------------
-            if not isclass(cls):
-                raise TypeError("{}.{} is not a class".format(module_path, class_name))
+                cls, deserializer = self.registry.resolve(module_path, class_name)
 
             # Load the json data into the object -----------------------------------------------------------------------
             if cls in self.hooks:
                 return self.hooks[cls](data)
-            if hasattr(cls, "deserialize") and callable(cls.deserialize):
-                return cls.deserialize(data)
+            if deserializer is not None:
+                return deserializer(data)
             
             message = "an instance of {}.{} does not have a callable \"deserialize\" attribute" \
                 .format(module_path, class_name)
@@ -124,3 +150,44 @@ class JSONDecoder(json.JSONDecoder):
             parse_constant=parse_constant,
             strict=strict
         )
+
+    def decode(self, s, *args, **kw):
+        """Return the Python representation of `s` (a str instance containing a JSON document)."""
+        self._classes = None
+        try:
+            return super().decode(s, *args, **kw)
+        finally:
+            self._classes = None
+
+    def raw_decode(self, s, idx=0):
+        """Decode a JSON document from `s`, starting at `idx`, and return a tuple (object, end index).
+        If the document has interned metadata, its class table is read from the header, and the decoded root object is
+        returned.
+        """
+        match = _HEADER.match(s, idx)
+        if match is None:
+            return super().raw_decode(s, idx)
+
+        header, end = super().raw_decode(s, match.end())
+        self._classes = self._resolve_class_table(header)
+
+        match = _ROOT.match(s, end)
+        if match is None:
+            raise json.JSONDecodeError("Expecting \"__root__\" after the document header", s, end)
+
+        root, end = super().raw_decode(s, match.end())
+
+        match = _END.match(s, end)
+        if match is None:
+            raise json.JSONDecodeError("Expecting '}' after the document root", s, end)
+
+        return root, match.end()
+
+    def _resolve_class_table(self, header):
+        """Resolve the class table in the header of a document with interned metadata."""
+        classes = header.get("__classes__") if type(header) is dict else None
+
+        if type(classes) is not list or not all(type(item) is list and len(item) == 2 for item in classes):
+            raise ValueError("document header does not contain a valid class table")
+
+        return [self.registry.resolve(module_path, class_name) for module_path, class_name in classes]
@@ -1,15 +1,20 @@
 """An object-aware JSON encoder."""
 import json
+from functools import partial
 from warnings import warn
 from typing import Union
 
 from ..hooks import Hooks
+from ..base import BaseEncoder
+from ..registry import ClassRegistry, default_registry
 
 
-def _write_metadata(obj, data: dict) -> dict:
+def _write_metadata(obj, data: dict, name: tuple, class_index: int = None) -> dict:
     """Write metadata that is required to reassemble the object, encoded by JSONEncoder.
 
-    An internal function that adds the `__class__` metadata field to the serialized data.
+    An internal function that adds the `__class__` metadata field to the serialized data. `name` is a tuple
+    `(module, qualname)` of the object's class. If `class_index` is not None, the field contains that index in the class
+    table instead of the module and the name of the class.
 
     Returns
     -------
@@ -24,14 +29,79 @@ def _write_metadata(obj, data: dict) -> dict:
         )
 
     # Add meta information necessary to decode the object later
-    data["__class__"] = {
-        "__module__": obj.__class__.__module__,
-        "__qualname__": obj.__class__.__qualname__
-    }
+    if class_index is not None:
+        data["__class__"] = class_index
+    else:
+        data["__class__"] = {
+            "__module__": name[0],
+            "__qualname__": name[1]
+        }
 
     return data
 
 
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+"""Types that are written to json as-is. Checked in-line, to skip a call to `encode` for most values."""
+
+
+class _JSONLoweringEncoder(BaseEncoder):
+    """Encoder that converts objects into dicts, lists and primitives exactly the way JSONEncoder would see them.
+
+    Types that the json module can write by itself take precedence over hooks and `serialize` methods, same as in
+    `json.JSONEncoder.default`: subclasses of str, int and float are kept as-is, subclasses of list and tuple become
+    lists, and subclasses of dict become dicts. Dict keys are left for the json module to check.
+
+    If `intern_metadata` is True, metadata of each object is an index in the `classes` table, which is filled during
+    encoding.
+    """
+    def __init__(self, **kw):
+        super().__init__(**kw)
+
+        self.intern_metadata = False
+        self.classes = {}
+        """Maps (module, qualname) pairs of encoded classes to their index in the class table."""
+
+    def class_table(self) -> list:
+        """Return the class table as a list of [module, qualname] pairs, in the order of their indices."""
+        return [list(key) for key in self.classes]
+
+    def encode_list_like(self, obj):
+        encode = self.encode
+        return [item if type(item) in _PRIMITIVE_TYPES else encode(item) for item in obj]
+
+    def encode_dict_like(self, obj):
+        encode = self.encode
+        return {key: value if type(value) in _PRIMITIVE_TYPES else encode(value) for key, value in obj.items()}
+
+    def write_metadata(self, obj, data: dict) -> dict:
+        name = self.registry.name(type(obj))
+
+        if not self.intern_metadata:
+            return _write_metadata(obj, data, name)
+
+        index = self.classes.setdefault(name, len(self.classes))
+
+        return _write_metadata(obj, data, name, index)
+
+    def _resolve(self, cls):
+        if cls is type(None) or issubclass(cls, (str, int, float)):
+            handler = self._encode_primitive
+        elif issubclass(cls, (list, tuple)):
+            handler = self.encode_list_like
+        elif issubclass(cls, dict):
+            handler = self.encode_dict_like
+        else:
+            func = self._encode_function(cls)
+
+            if func is not None:
+                handler = partial(self._encode_custom, func)
+            else:
+                handler = self.encode_unknown
+
+        self._dispatch[cls] = handler
+        return handler
+
+
 class JSONEncoder(json.JSONEncoder):
     """JSON encoder that provides tools to serialize custom objects.
 
@@ -46,6 +116,15 @@ class JSONEncoder(json.JSONEncoder):
     that object's place in json.
     Functions in the `hooks` parameter take precedence over member functions.
 
+    By default, custom objects are serialized as the json module finds them, through the `default` method. With
+    `single_pass=True` the encoder first converts the whole object into dicts, lists and primitives, and then writes
+    the result in one pass. The output is the same, but the json module does not have to call back into Python for
+    every custom object, and can use its C accelerator when `indent` is None.
+
+    With `intern_metadata=True` the module and the name of each class are written once, in a class table at the top of
+    the document, and each object refers to its class by an index in that table. The document then has the layout
+    `{"__header__": {"__classes__": [[module, qualname], ...]}, "__root__": obj}`. JSONDecoder reads both layouts.
+
     .. warning::
         JSONEncoder adds a field to the dict, produced from the object, called `__class__`. This field is used in the
         JSONDecoder to create an instance of the class, where json data is then deserialized.
@@ -58,6 +137,9 @@ class JSONEncoder(json.JSONEncoder):
     def __init__(self, *,
                  hooks: Union[dict, tuple, Hooks] = None,
                  metadata=True,
+                 registry: ClassRegistry = None,
+                 single_pass=False,
+                 intern_metadata=False,
                  skipkeys=False,
                  ensure_ascii=False,
                  check_circular=True,
@@ -80,6 +162,17 @@ class JSONEncoder(json.JSONEncoder):
             If True, each custom object is serialized with an additional metadata field called `__class__`. This field
             is used in the JSONDecoder to create an instance of the class, where json data is then deserialized. If
             False, this field is skipped, but the decoder will not be able to deserialize custom objects.
+        registry : ClassRegistry (default: None)
+            A registry that provides class names for the metadata. Classes that were registered under the name of
+            another class are written under that name. If None, each class is written under its own name.
+        single_pass : bool (default: False)
+            If True, the object is converted into dicts, lists and primitives before it is written, instead of
+            serializing custom objects one by one as the json module encounters them. The output is identical. Circular
+            references between custom objects raise RecursionError instead of ValueError.
+        intern_metadata : bool (default: False)
+            If True, metadata of each custom object is an index in a class table, written at the top of the document.
+            This makes the output much smaller, but it can only be decoded by a JSONDecoder from a version of this
+            module that supports the interned layout. Implies `single_pass`.
         skipkeys : bool (default: False)
             If False, then it is a TypeError to attempt encoding of keys that are not str, int, float or None. If
             skipkeys is True, such items are simply skipped.
@@ -125,19 +218,41 @@ class JSONEncoder(json.JSONEncoder):
             self.hooks = {}
         
         self.metadata = metadata
+        self.registry = registry or default_registry
+        self.single_pass = single_pass
+        self.intern_metadata = intern_metadata
+
+        self._lowering = _JSONLoweringEncoder(hooks=self.hooks, metadata=self.metadata, registry=self.registry)
+
+    def iterencode(self, o, _one_shot=False):
+        """Encode the given object, and yield each string representation as available."""
+        if self.single_pass or self.intern_metadata:
+            if self._lowering.hooks is not self.hooks:
+                self._lowering.hooks = self.hooks
+            self._lowering.metadata = self.metadata
+            self._lowering.registry = self.registry
+            self._lowering.intern_metadata = self.intern_metadata
+            self._lowering.classes = {}
+
+            o = self._lowering.encode(o)
+
+            if self.metadata and self.intern_metadata:
+                o = {"__header__": {"__classes__": self._lowering.class_table()}, "__root__": o}
+
+        return super().iterencode(o, _one_shot)
 
     def default(self, o):
         """Implementation of `JSONEncoder`'s `default` method that enables the serialization logic."""
         if type(o) in self.hooks:
             data = self.hooks[type(o)](o)
             if self.metadata:
-                _write_metadata(o, data)
+                _write_metadata(o, data, self.registry.name(type(o)))
             return data
 
         if hasattr(o, "serialize") and callable(o.serialize):
             data = o.serialize()
             if self.metadata:
-                _write_metadata(o, data)
+                _write_metadata(o, data, self.registry.name(type(o)))
             return data
 
         return super().default(o)
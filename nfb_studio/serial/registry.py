@@ -0,0 +1,184 @@
+"""Resolution of classes, named in the serialization metadata.
+
+When decoding, each custom object is identified by the module and the qualified name of its class. A `ClassRegistry`
+turns these names into the class and its deserialization function. Results are cached, so that a file with thousands of
+objects of the same class performs the import and the attribute lookup only once.
+
+A registry can also serve as an allow-list: classes can be registered in advance, and importing modules can be limited
+to a set of trusted packages. This way decoding an untrusted file never imports arbitrary modules.
+
+A class can also be registered under the name of another class. Such a class is created when an object of the other
+class is decoded, and encoders that use the registry write it under that name.
+"""
+from collections import OrderedDict
+from functools import reduce
+from importlib import import_module
+from inspect import isclass
+from typing import Iterable, Union
+
+
+def deepgetattr(obj, attr):
+    """Recurses through an attribute chain to get the ultimate value."""
+    return reduce(getattr, attr.split('.'), obj)
+
+
+class ClassRegistry:
+    """Resolves `(module, qualname)` pairs to `(cls, deserializer)` pairs and caches the results.
+
+    `deserializer` is a function that accepts a dict of data and returns an instance of `cls`. It is either a function
+    that was registered together with the class, or the class's own `deserialize` method. If neither exists,
+    `deserializer` is None.
+
+    Decoders use a shared default registry, `default_registry`, that can import classes from any module. To restrict
+    decoding to a known set of classes, create a registry with the `modules` parameter and pass it to the decoder.
+
+    Example
+    -------
+    ```python
+    registry = ClassRegistry(hooks.qt.deserialize, modules=["my_package"])
+    decoder = JSONDecoder(hooks=hooks.qt, registry=registry)
+    ```
+    """
+    def __init__(self, classes: Union[Iterable, dict] = (), *, modules: Iterable[str] = None, maxsize=256):
+        """Constructs a ClassRegistry.
+
+        Parameters
+        ----------
+        classes : iterable or dict (default: ())
+            Classes that are known in advance. Registered classes are always resolved, even if their module is not
+            allowed. If a dict is passed, it maps classes to their deserialization functions (for example, the
+            `deserialize` half of a `hooks.Hooks` object).
+        modules : iterable of str, or None (default: None)
+            Names of modules and packages from which classes can be imported. Submodules of a package are also
+            allowed. If None, classes can be imported from any module.
+        maxsize : int (default: 256)
+            Maximum number of cached classes that were not registered in advance. When this number is exceeded, the
+            least recently used class is forgotten.
+        """
+        self.modules = None if modules is None else tuple(modules)
+        self.maxsize = maxsize
+
+        self._registered = {}
+        """Classes, registered in advance. Maps (module, qualname) to (cls, deserializer)."""
+        self._names = {}
+        """Classes, registered under a name that is not their own. Maps cls to (module, qualname)."""
+        self._cache = OrderedDict()
+        """Recently resolved classes. Maps (module, qualname) to (cls, deserializer)."""
+
+        if isinstance(classes, dict):
+            for cls, deserializer in classes.items():
+                self.register(cls, deserializer)
+        else:
+            for cls in classes:
+                self.register(cls)
+
+    def register(self, cls, deserializer=None, *, name: tuple = None):
+        """Register a class, optionally with a function that deserializes it.
+
+        If `deserializer` is None, the class's own `deserialize` method is used. If `name` is a tuple
+        `(module, qualname)`, the class is registered under that name instead of its own: objects with this name in the
+        metadata are decoded as `cls`, and objects of type `cls` are encoded with this name.
+        """
+        if not isclass(cls):
+            raise TypeError("{} is not a class".format(cls))
+
+        if name is None:
+            name = (cls.__module__, cls.__qualname__)
+        else:
+            name = tuple(name)
+            self._names[cls] = name
+
+        self._registered[name] = (cls, deserializer or self._deserializer(cls))
+
+    def name(self, cls) -> tuple:
+        """Return a tuple `(module, qualname)` that is written in the metadata of objects of type `cls`.
+        This is the name that the class was registered under, or the class's own name.
+        """
+        try:
+            return self._names[cls]
+        except KeyError:
+            return (cls.__module__, cls.__qualname__)
+
+    def is_allowed_module(self, module_path: str) -> bool:
+        """Return True if classes from module `module_path` can be imported by this registry."""
+        if self.modules is None:
+            return True
+
+        for allowed in self.modules:
+            if module_path == allowed or module_path.startswith(allowed + "."):
+                return True
+
+        return False
+
+    def resolve(self, module_path: str, class_name: str) -> tuple:
+        """Return a tuple `(cls, deserializer)` for a class with name `class_name` from module `module_path`.
+
+        Raises
+        ------
+        ImportError
+            If the module is not allowed by this registry, or no class specified by the encoder exists in the module.
+        TypeError
+            If an attribute specified by the encoder exists in the specified module, but it's not a class.
+        """
+        key = (module_path, class_name)
+
+        if key in self._registered:
+            return self._registered[key]
+
+        try:
+            result = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            self._cache.move_to_end(key)
+            return result
+
+        result = self._import(module_path, class_name)
+
+        self._cache[key] = result
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+        return result
+
+    def clear(self):
+        """Forget all cached classes. Registered classes are kept."""
+        self._cache.clear()
+
+    def _import(self, module_path, class_name):
+        """Import a class and find its deserializer, without using the cache."""
+        # The following code is adapted from django.utils.module_loading module.
+        if not self.is_allowed_module(module_path):
+            raise ImportError("module \"{}\" is not allowed to be imported".format(module_path))
+
+        module = import_module(module_path)
+
+        # Get the class that needs to be instantiated
+        try:
+            cls = deepgetattr(module, class_name)
+        except AttributeError:
+            message = "module \"{}\" does not define a \"{}\" class".format(module_path, class_name)
+            raise ImportError(message)
+
+        # Verify that cls is in fact a class
+        if not isclass(cls):
+            raise TypeError("{}.{} is not a class".format(module_path, class_name))
+
+        # An allowed module can refer to a class from some other module. That class must be allowed as well.
+        if not self.is_allowed_module(cls.__module__):
+            raise ImportError("module \"{}\" is not allowed to be imported".format(cls.__module__))
+
+        return (cls, self._deserializer(cls))
+
+    @staticmethod
+    def _deserializer(cls):
+        """Return cls's own deserialize method, or None if it does not exist."""
+        deserialize = getattr(cls, "deserialize", None)
+        if deserialize is not None and callable(deserialize):
+            return deserialize
+
+        return None
+
+
+default_registry = ClassRegistry()
+"""Registry, shared by all decoders that were not given a registry explicitly."""
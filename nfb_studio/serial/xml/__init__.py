@@ -5,7 +5,7 @@ import xmltodict as xd
 
 from ..hooks import Hooks
 from .encoder import XMLEncoder
-from .decoder import XMLDecoder
+from .decoder import XMLDecoder, element_to_dict
 
 _cached_encoder = XMLEncoder()
 _cached_decoder = XMLDecoder()
@@ -20,6 +20,17 @@ def dumps(obj, *, encoder=None, hooks: Union[dict, tuple, Hooks] = None):
     
     return encoder.encode(obj)
 
+def dump(obj, fp, *, encoder=None, hooks: Union[dict, tuple, Hooks] = None):
+    """Encode `obj` and write it to a text file object `fp`, in a single pass and without building the full text."""
+    if encoder is not None:
+        pass
+    elif hooks is not None:
+        encoder = XMLEncoder(hooks=hooks)
+    else:
+        encoder = _cached_encoder
+    
+    encoder.dump(obj, fp)
+
 def loads(s, *, decoder=None, hooks: Union[dict, tuple, Hooks] = None):
     if decoder is not None:
         pass
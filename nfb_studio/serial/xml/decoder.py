@@ -1,9 +1,49 @@
 """An object-aware XML decoder."""
 from typing import Union
+from xml.etree.ElementTree import Element
 import xmltodict as xd
 from ..base import BaseDecoder
 
 
+def element_to_dict(element: Element, force_list=(), attr_prefix="@", cdata_key="#text"):
+    """Convert an ElementTree element into the value that xmltodict would produce for it.
+
+    Text is stripped of whitespace, and empty text becomes None. An element with only text becomes a string, and an
+    element with children or attributes becomes a dict. Children with a repeating tag, or with a tag in `force_list`,
+    are collected into lists.
+
+    This function allows parsing large documents incrementally (for example, with ElementTree.iterparse) and still
+    getting the same data for each small part of the document as XMLDecoder would produce.
+    """
+    text = "".join([element.text or ""] + [child.tail or "" for child in element]).strip() or None
+
+    if len(element) == 0 and not element.attrib:
+        return text
+
+    result = {}
+
+    for key, value in element.attrib.items():
+        result[attr_prefix + key] = value
+
+    for child in element:
+        value = element_to_dict(child, force_list, attr_prefix, cdata_key)
+
+        if child.tag in result:
+            if isinstance(result[child.tag], list):
+                result[child.tag].append(value)
+            else:
+                result[child.tag] = [result[child.tag], value]
+        elif child.tag in force_list:
+            result[child.tag] = [value]
+        else:
+            result[child.tag] = value
+
+    if text is not None:
+        result[cdata_key] = text
+
+    return result
+
+
 class XMLDecoder:
     def __init__(self, decode_attributes=True, force_list=None, **kw):
         self.base_decoder = BaseDecoder(**kw)
@@ -6,6 +6,7 @@ import xmltodict as xd
 from nfb_studio.util import expose_property
 
 from ..base import BaseEncoder
+from .writer import XMLWriter
 from json import dumps
 
 
@@ -40,16 +41,25 @@ class XMLEncoder:
     def _prepare_data(self, obj):
         """Prepare data for conversion by xmltodict. For example, replace all non-string keys with strings, otherwise
         xmltodict dies if in a list there is a dict with non-string keys.
+        Versions of xmltodict differ in how they write empty lists and None attributes, so these are replaced here: an
+        empty list produces no elements and a None attribute is written as an empty string.
         """
         if isinstance(obj, dict):
             keys = list(obj.keys())
 
             for key in keys:
-                self._prepare_data(obj[key])
+                value = obj[key]
+                self._prepare_data(value)
 
-                if not isinstance(key, str):
-                    obj[str(key)] = obj[key]
+                if isinstance(key, str) and key.startswith(self.attr_prefix):
+                    if value is None:
+                        obj[key] = ""
+                elif key != self.cdata_key and isinstance(value, list) and len(value) == 0:
                     obj.pop(key)
+                    continue
+
+                if not isinstance(key, str):
+                    obj[str(key)] = obj.pop(key)
         elif isinstance(obj, list):
             for item in obj:
                 self._prepare_data(item)
@@ -74,5 +84,13 @@ class XMLEncoder:
 
         return data_xml
 
+    def dump(self, obj, fp):
+        """Encode `obj` and write it to a text file object `fp`.
+        The result is the same as the result of `encode`, but it is produced in a single pass over `obj` and written to
+        the file while it is being encoded.
+        """
+        XMLWriter(self, fp).write_document(obj)
+
 expose_property(XMLEncoder, "base_encoder", "hooks")
 expose_property(XMLEncoder, "base_encoder", "metadata")
+expose_property(XMLEncoder, "base_encoder", "registry")
@@ -0,0 +1,224 @@
+"""A single-pass streaming XML writer.
+
+XMLEncoder.encode converts an object into dicts and lists, converts metadata and dict keys in two more passes, and then
+passes the result to `xmltodict.unparse`. XMLWriter does the same work in one walk over the object: each object is
+serialized right before it is written, and the text is written to a file object as it is produced. The output is the
+same as the output of XMLEncoder.encode. XML namespaces are not supported.
+"""
+from xml.sax.saxutils import escape, quoteattr
+
+
+class XMLWriter:
+    """Writes objects as XML to a text file object, using the settings of an XMLEncoder."""
+
+    flush_size = 1024
+    """Number of pieces of text, usually single elements, that the writer collects before writing them to the file."""
+
+    def __init__(self, encoder, fp):
+        self.encoder = encoder
+        self.fp = fp
+
+        self._buffer = []
+        self._dispatch = {}
+        """Maps types to a pair (kind, function), where function is the custom encode function, or None."""
+
+    def write_document(self, obj):
+        """Write an XML document with the object `obj` as its contents.
+        `obj` must serialize into a dict with exactly one key, which becomes the root element.
+        """
+        data = self._lower(obj)
+        if not isinstance(data, dict):
+            raise ValueError("Document must be a dict.")
+
+        data = self._prepare(data)
+        if len(data) != 1:
+            raise ValueError("Document must have exactly one root.")
+
+        self._buffer.append("<?xml version=\"1.0\" encoding=\"{}\"?>\n".format(self.encoder.encoding))
+
+        for key, value in data.items():
+            self._emit(key, self._lower(value), 0)
+
+        self.flush()
+
+    def flush(self):
+        """Write the collected text to the file."""
+        if self._buffer:
+            self.fp.write("".join(self._buffer))
+            self._buffer.clear()
+
+    def _kind(self, cls):
+        """Determine how objects of type cls are encoded by the base encoder.
+        Returns a pair (kind, function), where kind is one of "custom", "primitive", "list", "dict" or "unknown".
+        """
+        try:
+            return self._dispatch[cls]
+        except KeyError:
+            pass
+
+        func = self.encoder.base_encoder._encode_function(cls)
+
+        if func is not None:
+            result = ("custom", func)
+        elif cls in {int, float, str, bool, type(None)}:
+            result = ("primitive", None)
+        elif cls in {list, tuple, set}:
+            result = ("list", None)
+        elif cls is dict:
+            result = ("dict", None)
+        else:
+            result = ("unknown", None)
+
+        self._dispatch[cls] = result
+        return result
+
+    def _lower(self, obj):
+        """Encode `obj` one level deep, the same way the base encoder does.
+        Custom objects are serialized, lists and dicts are copied, but the items of lists and the values of dicts are
+        left as-is. Dict keys are encoded.
+        """
+        kind, func = self._kind(type(obj))
+
+        if kind == "primitive":
+            return obj
+        if kind == "dict":
+            encode = self.encoder.base_encoder.encode
+            return {key if type(key) is str else encode(key): value for key, value in obj.items()}
+        if kind == "list":
+            return list(obj)
+        if kind == "custom":
+            base_encoder = self.encoder.base_encoder
+            result = self._lower(func(obj))
+
+            if base_encoder.metadata and not isinstance(result, dict):
+                raise ValueError(
+                    "serialized value of type \"{}\" is not a dict, metadata cannot be written".format(
+                        type(obj).__qualname__
+                    )
+                )
+
+            if base_encoder.metadata:
+                base_encoder.write_metadata(obj, result)
+
+            return result
+
+        return self.encoder.base_encoder.encode_unknown(obj)
+
+    def _encode_fully(self, obj):
+        """Encode `obj` completely, the same way XMLEncoder does before passing the data to xmltodict."""
+        encoder = self.encoder
+        data = encoder.base_encoder.encode(obj)
+
+        if encoder.metadata:
+            encoder._convert_metadata(data)
+        encoder._prepare_data(data)
+
+        return data
+
+    def _prepare(self, data: dict) -> dict:
+        """Convert metadata to attributes and dict keys to strings, the same way XMLEncoder does for a single dict."""
+        encoder = self.encoder
+
+        if encoder.metadata and "__class__" in data:
+            metadata = data["__class__"]
+            data[encoder.attr_prefix + "__class__.__qualname__"] = metadata["__qualname__"]
+            data[encoder.attr_prefix + "__class__.__module__"] = metadata["__module__"]
+            data.pop("__class__")
+
+        # Non-string keys are converted to strings and moved to the end of the dict
+        for key in [key for key in data if not isinstance(key, str)]:
+            data[str(key)] = data.pop(key)
+
+        return data
+
+    def _emit(self, key, value, depth):
+        """Write `value` as an element (or several elements, if `value` is a list) with the tag `key`.
+        `value` must already be encoded one level deep with `_lower`. Mirrors `xmltodict._emit` with `pretty=True`.
+        """
+        encoder = self.encoder
+        attr_prefix = encoder.attr_prefix
+        cdata_key = encoder.cdata_key
+        newl = encoder.separator
+        write = self._buffer.append
+
+        indent = encoder.indent
+        if isinstance(indent, int):
+            indent = " " * indent
+        prefix = depth * indent
+        suffix = newl if depth else ""
+
+        if "<" in key or ">" in key:
+            raise ValueError("Invalid element name: \"<\" or \">\" not allowed")
+
+        if type(value) is list:
+            values = [self._lower(item) for item in value]
+        else:
+            values = [value]
+
+        for index, v in enumerate(values):
+            if depth == 0 and index > 0:
+                raise ValueError("document with multiple roots")
+
+            if v is None:
+                v = {}
+            elif isinstance(v, bool):
+                v = "true" if v else "false"
+            elif type(v) is list:
+                # A list inside a list is written as text
+                v = str(self._encode_fully(v))
+            elif not isinstance(v, (dict, str)):
+                v = str(v)
+
+            if isinstance(v, str):
+                # Element with text only, the most common case
+                write(prefix + "<" + key + ">" + escape(v) + "</" + key + ">" + suffix)
+                continue
+
+            cdata = None
+            attrs = []
+            children = []
+
+            for ik, iv in self._prepare(v).items():
+                if ik == cdata_key:
+                    cdata = iv
+                    continue
+                if ik.startswith(attr_prefix):
+                    if iv is None:
+                        iv = ""
+                    elif not isinstance(iv, str):
+                        iv = str(self._encode_fully(iv))
+
+                    attr_name = ik[len(attr_prefix):]
+                    if "<" in attr_name or ">" in attr_name:
+                        raise ValueError("Invalid attribute name: \"<\" or \">\" not allowed")
+
+                    attrs.append(" {}={}".format(attr_name, quoteattr(iv)))
+                    continue
+
+                iv = self._lower(iv)
+                if type(iv) is list and len(iv) == 0:
+                    # Empty lists produce no elements
+                    continue
+                children.append((ik, iv))
+
+            text = ""
+            if cdata is not None:
+                cdata = self._lower(cdata)
+                if cdata:
+                    if not isinstance(cdata, str):
+                        cdata = str(cdata, encoder.encoding)
+                    text = escape(cdata)
+
+            start = prefix + "<" + key + "".join(attrs) + ">"
+            end = "</" + key + ">" + suffix
+
+            if children:
+                write(start + newl)
+                for child_key, child_value in children:
+                    self._emit(child_key, child_value, depth + 1)
+                write(text + prefix + end)
+            else:
+                write(start + text + end)
+
+        if len(self._buffer) >= self.flush_size:
+            self.flush()
@@ -1,14 +1,12 @@
 """NFB main source signal."""
 from PySide2.QtWidgets import QWidget, QComboBox, QLabel, QFormLayout, QLineEdit, QCheckBox, QDoubleSpinBox, QHBoxLayout
 
-from ..scheme import Node, Input, Output, DataType
+from ..model import BandpassFilterModel
 from .signal_node import SignalNode
-from .spatial_filter import SpatialFilter
 
 
 class BandpassFilter(SignalNode):
-    input_type = SpatialFilter.output_type
-    output_type = DataType(102)
+    model_class = BandpassFilterModel
 
     class Config(SignalNode.Config):
         """Config widget displayed for BandpassFilter."""
@@ -116,56 +114,21 @@ class BandpassFilter(SignalNode):
             else:
                 self.lower_bound.setMaximum(250)
 
-    default_lower_bound = 0
-    default_upper_bound = 250
-
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-
-        self.setTitle("Bandpass Filter")
-        self.addInput(Input("Input", self.input_type))
-        self.addOutput(Output("Output", self.output_type))
-
-        self._lower_bound = self.default_lower_bound
-        self._upper_bound = self.default_upper_bound
-        self._adjust()
-    
     def lowerBound(self):
-        return self._lower_bound
-    
+        return self._model.lowerBound()
+
     def upperBound(self):
-        return self._upper_bound
-    
+        return self._model.upperBound()
+
     def setLowerBound(self, value, /):
-        self._lower_bound = value
+        self._model.setLowerBound(value)
         self._adjust()
-    
+
     def setUpperBound(self, value, /):
-        self._upper_bound = value
+        self._model.setUpperBound(value)
         self._adjust()
 
-    def _adjust(self):
-        """Adjust visuals in response to changes."""
-        self.updateView()
-
-        lower_bound = self.lowerBound()
-        if self.lowerBound() is None:
-            lower_bound = ""
-
-        upper_bound = self.upperBound()
-        if self.upperBound() is None:
-            upper_bound = ""
-
-        self.setDescription(
-            "Range: {}~{} Hz".format(lower_bound, upper_bound)
-        )
-
     # Serialization ====================================================================================================
-    def add_nfb_export_data(self, signal: dict):
-        """Add this node's data to the dict representation of the signal."""
-        signal["fBandpassLowHz"] = self.lowerBound()
-        signal["fBandpassHighHz"] = self.upperBound()
-    
     def serialize(self) -> dict:
         data = super().serialize()
 
@@ -1,13 +1,12 @@
 """NFB main source signal."""
 from PySide2.QtWidgets import QWidget, QFormLayout, QLineEdit
 
-from ..scheme import Node, Input, Output, DataType
+from ..model import CompositeSignalExportModel
 from .signal_node import SignalNode
-from .derived_signal_export import DerivedSignalExport
 
 
 class CompositeSignalExport(SignalNode):
-    input_type = DerivedSignalExport.output_type
+    model_class = CompositeSignalExportModel
 
     class Config(SignalNode.Config):
         """Config widget displayed for LSLInput."""
@@ -50,48 +49,21 @@ class CompositeSignalExport(SignalNode):
             self.signal_name.blockSignals(False)
             self.expression.blockSignals(False)
 
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-
-        self.setTitle("Composite Signal Export")
-        i = Input("Input", self.input_type)
-        i.setMultiple(True)
-        self.addInput(i)
-
-        self._signal_name = "Signal"
-        self._expression = ""
-        self._adjust()
-
     def signalName(self) -> str:
-        return self._signal_name
+        return self._model.signalName()
 
     def expression(self) -> str:
-        return self._expression
+        return self._model.expression()
 
     def setSignalName(self, name: str, /):
-        self._signal_name = name
+        self._model.setSignalName(name)
         self._adjust()
     
     def setExpression(self, eq: str, /):
-        self._expression = eq
+        self._model.setExpression(eq)
         self._adjust()
 
-    def _adjust(self):
-        """Adjust visuals in response to changes."""
-        self.updateView()
-
-        self.setDescription("{} =\n{}".format(
-                self.signalName(),
-                self.expression(),
-            )
-        )
-
     # Serialization ====================================================================================================
-    def add_nfb_export_data(self, signal: dict):
-        """Add this node's data to the dict representation of the signal."""
-        signal["sSignalName"] = self.signalName()
-        signal["sExpression"] = self.expression()
-    
     def serialize(self) -> dict:
         data = super().serialize()
 
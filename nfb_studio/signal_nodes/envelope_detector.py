@@ -1,15 +1,12 @@
 """NFB main source signal."""
 from PySide2.QtWidgets import QWidget, QComboBox, QLabel, QFormLayout, QLineEdit, QDoubleSpinBox
 
-from ..scheme import Node, Input, Output, DataType
+from ..model import EnvelopeDetectorModel
 from .signal_node import SignalNode
-from .spatial_filter import SpatialFilter
-from .bandpass_filter import BandpassFilter
 
 
 class EnvelopeDetector(SignalNode):
-    input_type = DataType(103, convertible_from=[SpatialFilter.output_type, BandpassFilter.output_type])
-    output_type = DataType(104)
+    model_class = EnvelopeDetectorModel
 
     class Config(SignalNode.Config):
         """Config widget displayed for LSLInput."""
@@ -61,51 +58,21 @@ class EnvelopeDetector(SignalNode):
             self.smoothing_factor.blockSignals(False)
             self.method.blockSignals(False)
 
-    default_smoothing_factor = 0.0  # TODO: Is this the correct default value?
-    default_method = "Rectification"
-
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-
-        self.setTitle("Envelope Detector")
-        self.addInput(Input("Input", self.input_type))
-        self.addOutput(Output("Output", self.output_type))
-
-        self._smoothing_factor = self.default_smoothing_factor
-        self._method = self.default_method
-        self._adjust()
-
     def smoothingFactor(self) -> float:
-        return self._smoothing_factor
-    
+        return self._model.smoothingFactor()
+
     def setSmoothingFactor(self, factor: float, /):
-        self._smoothing_factor = factor
+        self._model.setSmoothingFactor(factor)
         self._adjust()
-    
+
     def method(self) -> str:
-        return self._method
-    
+        return self._model.method()
+
     def setMethod(self, method: str, /):
-        self._method = method
+        self._model.setMethod(method)
         self._adjust()
 
-    def _adjust(self):
-        """Adjust visuals in response to changes."""
-        self.updateView()
-
-        self.setDescription(
-            "Smoothing Factor: x{}\nMethod: {}".format(
-                self.smoothingFactor(),
-                self.method()
-            )
-        )
-
     # Serialization ====================================================================================================
-    def add_nfb_export_data(self, signal: dict):
-        """Add this node's data to the dict representation of the signal."""
-        signal["fSmoothingFactor"] = self.smoothingFactor()
-        signal["method"] = self.method()
-    
     def serialize(self) -> dict:
         data = super().serialize()
 
@@ -2,25 +2,13 @@
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QWidget, QComboBox, QLabel, QFormLayout, QFrame
 
-from ..scheme import Node, Output, DataType
+from ..model import LSLInputModel
 from .signal_node import SignalNode
 
 
-class LSLDataSource:
-    def __init__(self, name=None, channel_count=None, frequency=None):
-        self.name = name
-        self.channel_count = channel_count
-        self.frequency = frequency
-
-
 class LSLInput(SignalNode):
     """NFB main source signal."""
-    data_sources = [
-        LSLDataSource("NVX136_Data", 32, 500),
-        LSLDataSource("Mitsar", 30, 250),
-    ]
-
-    output_type = DataType(100)
+    model_class = LSLInputModel
 
     class Config(SignalNode.Config):
         """Config widget displayed for LSLInput."""
@@ -28,7 +16,7 @@ class LSLInput(SignalNode):
             super().__init__(parent=parent)
 
             self.data_source = QComboBox()
-            for source in LSLInput.data_sources:
+            for source in LSLInputModel.data_sources:
                 self.data_source.addItem(source.name)
             self.data_source.currentTextChanged.connect(self._adjust)
 
@@ -57,7 +45,7 @@ class LSLInput(SignalNode):
             self.updateModel()
 
             # Find the data_source with the selected name
-            for data_source in LSLInput.data_sources:
+            for data_source in LSLInputModel.data_sources:
                 if data_source.name == self.data_source.currentText():
                     break
             else:
@@ -83,41 +71,14 @@ class LSLInput(SignalNode):
             self.data_source.setCurrentText(n.dataSource())
             self.data_source.blockSignals(False)
 
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-
-        self.setTitle("LSL Input")
-        self.addOutput(Output("LSL data stream", self.output_type))
-        
-        self._data_source = self.data_sources[0].name
-        self._adjust()
-
     def dataSource(self):
-        return self._data_source
+        return self._model.dataSource()
     
     def setDataSource(self, source: str, /):
-        # TODO: Perform a check that this data source exists
-        self._data_source = source
+        self._model.setDataSource(source)
         self._adjust()
 
-    def _adjust(self):
-        """Adjust visuals in response to changes."""
-        self.updateView()
-
-        ds = [x for x in self.data_sources if x.name == self.dataSource()][0]
-        self.setDescription(
-            "{}\n{} channels\n{} Hz".format(
-                ds.name,
-                ds.channel_count,
-                ds.frequency,
-            )
-        )
-
     # Serialization ====================================================================================================
-    def add_nfb_export_data(self, signal: dict):
-        """Add this node's data to the dict representation of the signal."""
-        pass
-    
     def serialize(self) -> dict:
         data = super().serialize()
 
@@ -2,6 +2,7 @@
 from PySide2.QtWidgets import QWidget, QComboBox, QLabel, QFormLayout, QLineEdit, QCheckBox, QDoubleSpinBox, QHBoxLayout
 
 from ..scheme import Node, Input, Output, DataType
+from ..model import SignalNodeModel
 
 
 class SignalNode(Node):
@@ -34,9 +35,37 @@ class SignalNode(Node):
             pass
 
 
+    model_class = SignalNodeModel
+    """Type of the model that keeps the parameters of this node."""
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
-        
+
+        # The model provides the title, the connections and the parameters of a new node
+        self._model = self.model_class()
+        self.setTitle(self._model.title())
+
+        for model in self._model.inputs:
+            input = Input(model.text(), model.dataType())
+            input.setMultiple(model.isMultiple())
+            self.addInput(input)
+
+        for model in self._model.outputs:
+            output = Output(model.text(), model.dataType())
+            output.setMultiple(model.isMultiple())
+            self.addOutput(output)
+
+        self._adjust()
+
+    def model(self):
+        """Return the model that keeps the parameters of this node."""
+        return self._model
+
+    def _adjust(self):
+        """Adjust visuals in response to changes."""
+        self.updateView()
+        self.setDescription(self._model.description())
+
     def configWidget(self):
         w = super().configWidget()
 
@@ -1,14 +1,12 @@
 """NFB main source signal."""
 from PySide2.QtWidgets import QWidget, QComboBox, QLabel, QFormLayout, QLineEdit
 
-from ..scheme import Node, Input, Output, DataType
+from ..model import SpatialFilterModel
 from .signal_node import SignalNode
-from .lsl_input import LSLInput
 
 
 class SpatialFilter(SignalNode):
-    input_type = LSLInput.output_type
-    output_type = DataType(101)
+    model_class = SpatialFilterModel
 
     class Config(SignalNode.Config):
         """Config widget displayed for LSLInput."""
@@ -39,39 +37,14 @@ class SpatialFilter(SignalNode):
             self.matrix_path.setText(n.matrixPath())
             self.matrix_path.blockSignals(False)
 
-    default_matrix_path = ""
-
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-
-        self.setTitle("Spatial Filter")
-        self.addInput(Input("Input", self.input_type))
-        self.addOutput(Output("Output", self.output_type))
-
-        self._matrix_path = self.default_matrix_path
-        self._adjust()
-
     def matrixPath(self) -> str:
-        return self._matrix_path
+        return self._model.matrixPath()
     
     def setMatrixPath(self, matrix_path: str, /):
-        self._matrix_path = matrix_path
+        self._model.setMatrixPath(matrix_path)
         self._adjust()
 
-    def _adjust(self):
-        """Adjust visuals in response to changes."""
-        self.updateView()
-
-        if self.matrixPath() == "":
-            self.setDescription("No Matrix")
-        else:
-            self.setDescription(self.matrixPath())
-
     # Serialization ====================================================================================================
-    def add_nfb_export_data(self, signal: dict):
-        """Add this node's data to the dict representation of the signal."""
-        signal["SpatialFilterMatrix"] = self.matrixPath()
-    
     def serialize(self) -> dict:
         data = super().serialize()
 
@@ -2,20 +2,12 @@
 import sys
 from PySide2.QtWidgets import QWidget, QComboBox, QLabel, QFormLayout, QLineEdit, QDoubleSpinBox
 
-from ..scheme import Node, Input, Output, DataType
+from ..model import StandardiseModel
 from .signal_node import SignalNode
-from .spatial_filter import SpatialFilter
-from .bandpass_filter import BandpassFilter
-from .envelope_detector import EnvelopeDetector
 
 
 class Standardise(SignalNode):
-    input_type = DataType(105, convertible_from=[
-        SpatialFilter.output_type,
-        BandpassFilter.output_type,
-        EnvelopeDetector.output_type,
-    ])
-    output_type = DataType(106)
+    model_class = StandardiseModel
 
     class Config(SignalNode.Config):
         """Config widget displayed for LSLInput."""
@@ -62,51 +54,21 @@ class Standardise(SignalNode):
             self.average.blockSignals(False)
             self.standard_deviation.blockSignals(False)
 
-    default_average = 0
-    default_standard_deviation = 1
-
-    def __init__(self, parent=None):
-        super().__init__(parent=parent)
-        
-        self.setTitle("Standardise")
-        self.addInput(Input("Input", self.input_type))
-        self.addOutput(Output("Output", self.output_type))
-
-        self._average = self.default_average
-        self._standard_deviation = self.default_standard_deviation
-        self._adjust()
-    
     def average(self):
-        return self._average
-    
+        return self._model.average()
+
     def standardDeviation(self):
-        return self._standard_deviation
-    
+        return self._model.standardDeviation()
+
     def setAverage(self, value, /):
-        self._average = value
+        self._model.setAverage(value)
         self._adjust()
-    
+
     def setStandardDeviation(self, value, /):
-        self._standard_deviation = value
+        self._model.setStandardDeviation(value)
         self._adjust()
 
-    def _adjust(self):
-        """Adjust visuals in response to changes."""
-        self.updateView()
-
-        self.setDescription(
-            "Average: x{}\nStd. Dev.: {}".format(
-                self.average(),
-                self.standardDeviation()
-            )
-        )
-
     # Serialization ====================================================================================================
-    def add_nfb_export_data(self, signal: dict):
-        """Add this node's data to the dict representation of the signal."""
-        signal["fAverage"] = self.average()
-        signal["fStdDev"] = self.standardDeviation()
-    
     def serialize(self) -> dict:
         data = super().serialize()
 
@@ -1,5 +1,21 @@
-"""A collection of general-purpose classes and functions that do not relate to NFB studio directly."""
+"""A collection of general-purpose classes and functions that do not relate to NFB studio directly.
+
+Widgets are imported when they are first accessed, so that the rest of this package can be used without QtWidgets.
+"""
 from .enum_manip import import_enum
 from .expose_property import expose_property
-from .stacked_dict_widget import StackedDictWidget
-from .file_select import FileSelect
\ No newline at end of file
+from .ordered_set import OrderedSet
+
+_widgets = {
+    "StackedDictWidget": ".stacked_dict_widget",
+    "FileSelect": ".file_select",
+}
+"""Widgets of this package. Maps a widget name to the module it is defined in."""
+
+
+def __getattr__(name):
+    if name in _widgets:
+        from importlib import import_module
+        return getattr(import_module(_widgets[name], __name__), name)
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -0,0 +1,61 @@
+from collections.abc import MutableSet
+
+
+class OrderedSet(MutableSet):
+    """A set that remembers the order in which items were added.
+    Iterating over an OrderedSet yields items in insertion order, so anything built from its contents (such as a saved
+    file) does not depend on memory addresses of the items. Items are stored as keys of a dict, which makes
+    membership tests, additions and removals O(1), same as in a regular set.
+
+    Example
+    -------
+    ```python
+    s = OrderedSet([3, 1, 2])
+    s.add(1)      # already present, position does not change
+    s.add(0)
+    list(s)       # [3, 1, 2, 0]
+    s.discard(1)
+    list(s)       # [3, 2, 0]
+    ```
+    """
+    def __init__(self, iterable=()):
+        self._data = dict.fromkeys(iterable)
+
+    # Implementations of abstract methods ==============================================================================
+    def __contains__(self, item):
+        return item in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __reversed__(self):
+        return reversed(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def add(self, item):
+        self._data[item] = None
+
+    def discard(self, item):
+        self._data.pop(item, None)
+
+    # Overrides of mixin methods =======================================================================================
+    def clear(self):
+        self._data.clear()
+
+    def pop(self):
+        """Remove and return the most recently added item."""
+        if not self._data:
+            raise KeyError("pop from an empty OrderedSet")
+        return self._data.popitem()[0]
+
+    def update(self, *iterables):
+        for iterable in iterables:
+            self._data.update(dict.fromkeys(iterable))
+
+    def copy(self):
+        return type(self)(self)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, list(self._data))
@@ -1,5 +1,9 @@
 import unittest
-from .serial import TestBaseEncoder, TestBaseDecoder, TestXMLEncoder
+from .serial import (TestBaseEncoder, TestBaseDecoder, TestXMLEncoder, TestJSONEncoder, TestJSONDecoder,
+                     TestClassRegistry, TestBinary, TestElementToDict)
+from .util import TestOrderedSet
+from .model import TestSchemeModel, TestModelImports
+from .sequence_index import TestSequenceIndex
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,2 @@
+from .scheme import TestSchemeModel
+from .imports import TestModelImports
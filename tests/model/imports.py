@@ -0,0 +1,51 @@
+import os
+import sys
+import subprocess
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+
+class TestModelImports(TestCase):
+    def loaded_modules(self, code):
+        """Run `code` in a new interpreter and return a list of modules that were loaded."""
+        code += "\nimport sys; print('\\n'.join(sys.modules))"
+        result = subprocess.run(
+            [sys.executable, "-c", code], stdout=subprocess.PIPE, check=True, universal_newlines=True
+        )
+        return result.stdout.split()
+
+    def test_model_is_gui_free(self):
+        modules = self.loaded_modules("import nfb_studio.model")
+
+        self.assertNotIn("PySide2.QtWidgets", modules)
+        self.assertNotIn("nfb_studio.scheme", modules)
+
+    def test_convert_is_gui_free(self):
+        with TemporaryDirectory() as directory:
+            source = os.path.join(directory, "experiment.nfbex")
+            exported = os.path.join(directory, "experiment.xml")
+            imported = os.path.join(directory, "imported.nfbex")
+
+            code = "\n".join([
+                "from nfb_studio.experiment import Experiment",
+                "from nfb_studio.convert import convert_file",
+                "with open({!r}, 'w') as file: Experiment().dump(file)".format(source),
+                "convert_file({!r}, {!r})".format(source, exported),
+                "convert_file({!r}, {!r})".format(exported, imported),
+            ])
+            modules = self.loaded_modules(code)
+
+            self.assertTrue(os.path.exists(imported))
+
+        self.assertNotIn("PySide2.QtWidgets", modules)
+        self.assertNotIn("PySide2.QtSvg", modules)
+        self.assertNotIn("nfb_studio.scheme", modules)
+        self.assertNotIn("nfb_studio.experiment_view", modules)
+
+    def test_saved_names(self):
+        from importlib import import_module
+        from nfb_studio.experiment import _saved_names
+
+        for model_cls, (module, qualname) in _saved_names.items():
+            cls = getattr(import_module(module), qualname)
+            self.assertEqual((cls.__module__, cls.__qualname__), (module, qualname))
@@ -0,0 +1,97 @@
+from unittest import TestCase
+
+from nfb_studio.model import SchemeModel, OutputModel, LSLInputModel, SpatialFilterModel
+
+
+class TestSchemeModel(TestCase):
+    def make_scheme(self):
+        scheme = SchemeModel()
+        source = LSLInputModel()
+        target = SpatialFilterModel()
+
+        scheme.addNode(source)
+        scheme.addNode(target)
+        scheme.connect_nodes(source.outputs[0], target.inputs[0])
+
+        return scheme
+
+    def test_ids(self):
+        scheme = self.make_scheme()
+        source, target = scheme.nodes
+        edge = scheme.edges[0]
+
+        items = [source, source.outputs[0], target, target.inputs[0], target.outputs[0], edge]
+        ids = [item.itemId() for item in items]
+
+        self.assertEqual(len(set(ids)), len(items))
+        for item in items:
+            self.assertIs(scheme.item(item.itemId()), item)
+
+    def test_id_collision(self):
+        scheme = self.make_scheme()
+        node = SpatialFilterModel()
+        node.setItemId(scheme.nodes[0].itemId())
+
+        scheme.addNode(node)
+        self.assertNotEqual(node.itemId(), scheme.nodes[0].itemId())
+        self.assertIs(scheme.item(scheme.nodes[0].itemId()), scheme.nodes[0])
+
+    def test_serialize(self):
+        scheme = self.make_scheme()
+        data = scheme.serialize()
+        edge = scheme.edges[0]
+
+        # Node and connection indices are saved along with IDs, so that versions without IDs can open the file
+        self.assertEqual(data["edges"], [{
+            "id": edge.itemId(),
+            "source": {"id": edge.source().itemId(), "node_index": 0, "connection_index": 0},
+            "target": {"id": edge.target().itemId(), "node_index": 1, "connection_index": 0},
+        }])
+
+        loaded = SchemeModel.deserialize(data)
+        self.assertEqual(len(loaded.edges), 1)
+        self.assertIs(loaded.edges[0].source(), scheme.nodes[0].outputs[0])
+        self.assertIs(loaded.edges[0].target(), scheme.nodes[1].inputs[0])
+        self.assertEqual(loaded.edges[0].itemId(), edge.itemId())
+
+    def test_deserialize_indices(self):
+        """Schemes saved before item IDs refer to connections by node and connection indices."""
+        source = LSLInputModel()
+        target = SpatialFilterModel()
+        data = {
+            "nodes": [source, target],
+            "edges": [{
+                "source": {"node_index": 0, "connection_index": 0},
+                "target": {"node_index": 1, "connection_index": 0},
+            }]
+        }
+
+        loaded = SchemeModel.deserialize(data)
+        self.assertIs(loaded.edges[0].source(), source.outputs[0])
+        self.assertIs(loaded.edges[0].target(), target.inputs[0])
+        self.assertIsNotNone(loaded.edges[0].itemId())
+
+    def test_deserialize_ids(self):
+        """Schemes can refer to connections by ID only."""
+        scheme = self.make_scheme()
+        source, target = scheme.nodes
+        data = {
+            "nodes": [source, target],
+            "edges": [{"id": 7, "source": source.outputs[0].itemId(), "target": target.inputs[0].itemId()}]
+        }
+
+        loaded = SchemeModel.deserialize(data)
+        self.assertIs(loaded.edges[0].source(), source.outputs[0])
+        self.assertIs(loaded.edges[0].target(), target.inputs[0])
+
+    def test_connection_added_later(self):
+        scheme = self.make_scheme()
+        node = scheme.nodes[1]
+
+        output = OutputModel()
+        node.addOutput(output)
+        self.assertIsNotNone(output.itemId())
+        self.assertIs(scheme.item(output.itemId()), output)
+
+        removed = node.removeOutput(node.outputs.index(output))
+        self.assertIsNone(scheme.item(removed.itemId()))
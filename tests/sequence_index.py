@@ -0,0 +1,118 @@
+from unittest import TestCase
+
+from nfb_studio.sequence_index import SequenceIndex, unlink
+from nfb_studio.scheme.graph import GraphDelta
+
+
+class SimpleNode:
+    def __init__(self, name, item_id):
+        self.name = name
+        self._item_id = item_id
+
+    def itemId(self):
+        return self._item_id
+
+
+class SimpleEdge:
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+
+    def sourceNode(self):
+        return self.source
+
+    def targetNode(self):
+        return self.target
+
+
+class SimpleGraph:
+    """The part of Graph that SequenceIndex uses, without graphics items. Nodes are named by single letters."""
+    def __init__(self, names: str):
+        self.nodes = [SimpleNode(name, i) for i, name in enumerate(names)]
+        self.edges = []
+
+    def node(self, name):
+        return next(node for node in self.nodes if node.name == name)
+
+    def connect(self, source, target):
+        edge = SimpleEdge(self.node(source), self.node(target))
+        self.edges.append(edge)
+        return edge
+
+    def incomingEdges(self, node):
+        return [edge for edge in self.edges if edge.target is node]
+
+    def outgoingEdges(self, node):
+        return [edge for edge in self.edges if edge.source is node]
+
+
+def names(sequences) -> list:
+    """Return a sorted list of sequences, each one as a string of node names."""
+    return sorted("".join(node.name for node in sequence) for sequence in sequences)
+
+
+class TestSequenceIndex(TestCase):
+    def test_branches(self):
+        graph = SimpleGraph("ABCD")
+        graph.connect("A", "B")
+        graph.connect("A", "C")
+        graph.connect("B", "D")
+        graph.connect("C", "D")
+
+        index = SequenceIndex(graph)
+        self.assertEqual(names(index.sequences()), ["ABD", "ACD"])
+        self.assertEqual(index.count(), 2)
+        self.assertEqual(index.cycles(), [])
+
+    def test_limit(self):
+        graph = SimpleGraph("ABC")
+        graph.connect("A", "B")
+        graph.connect("A", "C")
+
+        index = SequenceIndex(graph, limit=1)
+        self.assertEqual(len(index.sequences()), 1)
+        self.assertEqual(index.count(), 2)
+
+    def test_update(self):
+        graph = SimpleGraph("ABC")
+        graph.connect("A", "B")
+
+        index = SequenceIndex(graph)
+        self.assertEqual(names(index.sequences()), ["AB", "C"])
+
+        delta = GraphDelta()
+        delta.added_edges.add(graph.connect("B", "C"))
+        index.update(delta)
+        self.assertEqual(names(index.sequences()), ["ABC"])
+
+    def test_cycle_entered_from_another_node(self):
+        """Sequences of nodes in a cycle do not depend on the node where the cycle was first entered."""
+        graph = SimpleGraph("ABR")
+        graph.connect("A", "B")
+        graph.connect("B", "A")
+
+        index = SequenceIndex(graph)
+        self.assertEqual(names(map(unlink, index.sequencesFrom(graph.node("A")))), ["AB"])
+
+        delta = GraphDelta()
+        delta.added_edges.add(graph.connect("R", "B"))
+        index.update(delta)
+
+        self.assertEqual(names(index.sequences()), ["RBA"])
+        self.assertEqual(names(index.cycles()), ["AB"])
+
+    def test_cycle_removed(self):
+        graph = SimpleGraph("AB")
+        graph.connect("A", "B")
+        back_edge = graph.connect("B", "A")
+
+        index = SequenceIndex(graph)
+        self.assertEqual(names(index.cycles()), ["AB"])
+
+        graph.edges.remove(back_edge)
+        delta = GraphDelta()
+        delta.removed_edges.add(back_edge)
+        index.update(delta)
+
+        self.assertEqual(names(index.sequences()), ["AB"])
+        self.assertEqual(index.cycles(), [])
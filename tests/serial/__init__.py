@@ -1,3 +1,8 @@
 from .base_encoder import TestBaseEncoder
 from .base_decoder import TestBaseDecoder
 from .xml_encoder import TestXMLEncoder
+from .json_encoder import TestJSONEncoder
+from .json_decoder import TestJSONDecoder
+from .registry import TestClassRegistry
+from .binary import TestBinary
+from .xml_decoder import TestElementToDict
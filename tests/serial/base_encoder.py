@@ -125,3 +125,26 @@ class TestBaseEncoder(TestCase):
         expected_result = {"data": 0}
 
         self.assertEqual(e.encode(obj), expected_result)
+
+    def test_encoder_hooks_reassigned(self):
+        def hook(obj):
+            result = obj.serialize()
+            result["extra"] = None
+            return result
+
+        e = base.BaseEncoder()
+        obj = ExampleClass()
+        self.assertEqual(e.encode(obj), self.expected_result)
+
+        # Encoding methods are cached per type, reassigning hooks must discard the cache
+        e.hooks = {ExampleClass.Nested: hook}
+
+        expected_result = deepcopy(self.expected_result)
+        expected_result["nested"]["extra"] = None
+        expected_result["dict_var"]["nested"]["extra"] = None
+        expected_result["list_var"][1]["extra"] = None
+
+        self.assertEqual(e.encode(obj), expected_result)
+
+        e.hooks = None
+        self.assertEqual(e.encode(obj), self.expected_result)
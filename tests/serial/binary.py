@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from nfb_studio.serial import binary
+
+from .example_class import ExampleClass
+
+
+class TestBinary(TestCase):
+    def test_primitives(self):
+        obj = [None, True, False, 0, -1, 300, -2**70, 0.69, -1e300, "", "string", "юникод", [], {}, {1: "a", None: 2.5}]
+
+        self.assertEqual(binary.loads(binary.dumps(obj)), obj)
+
+    def test_objects(self):
+        obj = {"first": ExampleClass(), "second": ExampleClass()}
+
+        self.assertEqual(binary.loads(binary.dumps(obj)), obj)
+
+    def test_tables(self):
+        data = binary.dumps([ExampleClass()])
+        self.assertEqual(data.count(b"tests.serial.example_class"), 1)
+        self.assertEqual(data.count(b"ExampleClass.Nested"), 1)
+        self.assertEqual(data.count(b"string_var"), 1)
+
+    def test_no_metadata(self):
+        encoder = binary.BinaryEncoder(metadata=False)
+        expected_result = {"nested": ExampleClass.Nested().serialize()}
+        expected_result["nested"]["tuple_var"] = [1, 2, 3]
+        expected_result["nested"]["set_var"] = [1, 2, 3]
+
+        self.assertEqual(binary.loads(binary.dumps({"nested": ExampleClass.Nested()}, encoder=encoder)),
+                         expected_result)
+
+    def test_invalid_data(self):
+        with self.assertRaises(ValueError):
+            binary.loads(b"{}")
+
+        data = binary.dumps([1, 2, 3])
+        with self.assertRaises(ValueError):
+            binary.loads(data + b"\x00")
+
+    def test_truncated_data(self):
+        data = binary.dumps([ExampleClass(), {"a": 1.5, "b": "string"}, 300])
+
+        for size in range(len(data)):
+            with self.assertRaises(ValueError):
+                binary.loads(data[:size])
+
+        with self.assertRaisesRegex(ValueError, "truncated"):
+            binary.loads(data[:-1])
+
+    def test_corrupt_data(self):
+        # Reference to a string that is not in the string table
+        data = binary.dumps(["string", "string"])
+        self.assertEqual(data[-2:], bytes([binary.format.STR_REF, 0]))
+        with self.assertRaisesRegex(ValueError, "string reference"):
+            binary.loads(data[:-1] + b"\x05")
+
+        # Reference to a class that is not in the class table
+        data = binary.dumps(ExampleClass.Nested())
+        header = len(binary.format.MAGIC) + 1
+        self.assertEqual(data[header:header + 2], bytes([binary.format.OBJECT, 0]))
+        with self.assertRaisesRegex(ValueError, "class reference"):
+            binary.loads(data[:header + 1] + b"\x01" + data[header + 2:])
+
+        # Unknown tag
+        with self.assertRaisesRegex(ValueError, "invalid tag"):
+            binary.loads(data[:header] + b"\xff")
+
+        # Unhashable dictionary key
+        with self.assertRaisesRegex(ValueError, "dictionary key"):
+            binary.loads(binary.dumps({1: 2}).replace(bytes([binary.format.INT, 2]), bytes([binary.format.LIST, 0]), 1))
@@ -0,0 +1,91 @@
+import json as std_json
+from unittest import TestCase
+
+from nfb_studio.serial import json, base
+
+
+class Vector:
+    def __init__(self, x=0, y=0):
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other):
+        return type(other) is Vector and (self.x, self.y) == (other.x, other.y)
+
+    def serialize(self):
+        return {"x": self.x, "y": self.y}
+
+    @classmethod
+    def deserialize(cls, data):
+        return cls(data["x"], data["y"])
+
+
+class Polygon:
+    def __init__(self, points=()):
+        self.points = list(points)
+
+    def __eq__(self, other):
+        return type(other) is Polygon and self.points == other.points
+
+    def serialize(self):
+        return {"points": self.points}
+
+    @classmethod
+    def deserialize(cls, data):
+        return cls(data["points"])
+
+
+class TestJSONDecoder(TestCase):
+    obj = {
+        "polygons": [Polygon([Vector(0, 0), Vector(1, 0), Vector(0, 1)]), Polygon()],
+        "origin": Vector(),
+        "name": "shapes",
+    }
+
+    def test_decoder(self):
+        data = json.JSONEncoder().encode(self.obj)
+        self.assertEqual(json.JSONDecoder().decode(data), self.obj)
+
+    def test_interned(self):
+        data = json.JSONEncoder(intern_metadata=True).encode(self.obj)
+
+        self.assertEqual(data.count(Vector.__qualname__), 1)
+        self.assertNotIn("__module__", data)
+        self.assertEqual(json.JSONDecoder().decode(data), self.obj)
+
+    def test_interned_base_decoder(self):
+        data = std_json.loads(json.JSONEncoder(intern_metadata=True).encode(self.obj))
+
+        self.assertEqual(base.BaseDecoder().decode(data), self.obj)
+
+    def test_interned_without_table(self):
+        data = '{"__class__": 0, "x": 1, "y": 2}'
+
+        with self.assertRaises(ValueError):
+            json.JSONDecoder().decode(data)
+
+    def test_interned_bad_class_index(self):
+        data = '{"__header__": {"__classes__": []}, "__root__": {"__class__": 3}}'
+
+        with self.assertRaises(ValueError):
+            json.JSONDecoder().decode(data)
+        with self.assertRaises(ValueError):
+            base.BaseDecoder().decode(std_json.loads(data))
+
+    def test_interned_bad_class_table(self):
+        for header in ('{}', '{"__classes__": 1}', '{"__classes__": [["module"]]}', '[]'):
+            data = '{"__header__": ' + header + ', "__root__": 1}'
+
+            with self.assertRaises(ValueError):
+                json.JSONDecoder().decode(data)
+
+    def test_interned_header_only_at_top_level(self):
+        # A class table inside the document is ordinary data, and does not define classes
+        table = [[Vector.__module__, Vector.__qualname__]]
+        data = std_json.dumps({"table": {"__classes__": table}, "vector": {"__class__": 0, "x": 1, "y": 2}})
+
+        with self.assertRaises(ValueError):
+            json.JSONDecoder().decode(data)
+
+        nested = {"document": {"__header__": {"__classes__": table}, "__root__": 1}}
+        self.assertEqual(json.JSONDecoder().decode(std_json.dumps(nested)), nested)
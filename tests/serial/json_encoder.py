@@ -0,0 +1,67 @@
+from enum import IntEnum
+from io import StringIO
+from unittest import TestCase
+
+from nfb_studio.serial import json
+
+
+class Color(IntEnum):
+    RED = 1
+
+    def serialize(self):
+        return {"name": self.name}
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def serialize(self):
+        return {"x": self.x, "y": self.y, "color": Color.RED}
+
+
+class Shape:
+    def __init__(self):
+        self.points = (Point(0, 0), Point(1.5, -2))
+        self.labels = {"a": Point(3, 4), 5: None, "b": "text"}
+        self.empty = ([], {})
+
+    def serialize(self):
+        return {"points": self.points, "labels": self.labels, "empty": self.empty}
+
+
+class TestJSONEncoder(TestCase):
+    maxDiff = None
+
+    def test_single_pass(self):
+        obj = [Shape(), {"shape": Shape()}, "string", 1, 0.5, True, None]
+
+        for indent in (None, "\t"):
+            expected_result = json.JSONEncoder(indent=indent).encode(obj)
+            encoder = json.JSONEncoder(indent=indent, single_pass=True)
+
+            self.assertEqual(encoder.encode(obj), expected_result)
+            self.assertEqual("".join(encoder.iterencode(obj)), expected_result)
+
+    def test_single_pass_hooks(self):
+        hooks = {Point: lambda point: {"xy": [point.x, point.y]}}
+        obj = Shape()
+
+        expected_result = json.JSONEncoder(hooks=hooks).encode(obj)
+        self.assertEqual(json.JSONEncoder(hooks=hooks, single_pass=True).encode(obj), expected_result)
+
+    def test_single_pass_unknown_objects(self):
+        encoder = json.JSONEncoder(single_pass=True)
+
+        with self.assertRaises(TypeError):
+            encoder.encode({"set": {1, 2, 3}})
+
+    def test_dump(self):
+        obj = [Shape() for _ in range(1000)]
+        encoder = json.JSONEncoder(indent="\t")
+
+        file = StringIO()
+        json.dump(obj, file, encoder=encoder)
+
+        self.assertEqual(file.getvalue(), json.dumps(obj, encoder=encoder))
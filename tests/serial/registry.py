@@ -0,0 +1,77 @@
+from importlib import import_module
+from unittest import TestCase
+from unittest.mock import patch
+
+from nfb_studio.serial import base, ClassRegistry
+
+from .example_class import ExampleClass
+from .base_decoder import TestBaseDecoder
+
+
+class TestClassRegistry(TestCase):
+    def test_resolve(self):
+        registry = ClassRegistry()
+
+        cls, deserializer = registry.resolve("tests.serial.example_class", "ExampleClass.Nested")
+        self.assertIs(cls, ExampleClass.Nested)
+        self.assertEqual(deserializer, ExampleClass.Nested.deserialize)
+
+    def test_resolve_cached(self):
+        registry = ClassRegistry()
+        registry.resolve("tests.serial.example_class", "ExampleClass")
+
+        with patch("nfb_studio.serial.registry.import_module") as mock:
+            registry.resolve("tests.serial.example_class", "ExampleClass")
+            mock.assert_not_called()
+
+    def test_maxsize(self):
+        registry = ClassRegistry(maxsize=1)
+        registry.resolve("tests.serial.example_class", "ExampleClass")
+        registry.resolve("tests.serial.example_class", "ExampleClass.Nested")
+
+        with patch("nfb_studio.serial.registry.import_module", wraps=import_module) as mock:
+            registry.resolve("tests.serial.example_class", "ExampleClass")
+            mock.assert_called_once_with("tests.serial.example_class")
+
+    def test_disallowed_module(self):
+        registry = ClassRegistry(modules=["nfb_studio"])
+
+        with patch("nfb_studio.serial.registry.import_module") as mock:
+            with self.assertRaises(ImportError):
+                registry.resolve("tests.serial.example_class", "ExampleClass")
+            mock.assert_not_called()
+
+    def test_registered(self):
+        def hook(data):
+            return ExampleClass.Nested.deserialize(data)
+
+        registry = ClassRegistry({ExampleClass.Nested: hook}, modules=[])
+
+        self.assertEqual(registry.resolve("tests.serial.example_class", "ExampleClass.Nested"),
+                         (ExampleClass.Nested, hook))
+        with self.assertRaises(ImportError):
+            registry.resolve("tests.serial.example_class", "ExampleClass")
+
+    def test_decoder_registry(self):
+        decoder = base.BaseDecoder(registry=ClassRegistry(modules=["tests.serial"]))
+        self.assertEqual(decoder.decode(TestBaseDecoder.source_data), ExampleClass())
+
+        decoder = base.BaseDecoder(registry=ClassRegistry(modules=["nfb_studio"]))
+        with self.assertRaises(ImportError):
+            decoder.decode(TestBaseDecoder.source_data)
+
+    def test_alias(self):
+        alias = ("tests.serial.example_class", "ExampleClass")
+        registry = ClassRegistry(modules=[])
+        registry.register(ExampleClass.Nested, name=alias)
+
+        self.assertEqual(registry.name(ExampleClass.Nested), alias)
+        self.assertEqual(registry.name(ExampleClass), ("tests.serial.example_class", "ExampleClass"))
+        self.assertIs(registry.resolve(*alias)[0], ExampleClass.Nested)
+
+        encoder = base.BaseEncoder(registry=registry)
+        decoder = base.BaseDecoder(registry=registry)
+        data = encoder.encode(ExampleClass.Nested())
+
+        self.assertEqual(data["__class__"]["__qualname__"], "ExampleClass")
+        self.assertEqual(decoder.decode(data), ExampleClass.Nested())
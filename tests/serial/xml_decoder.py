@@ -1,5 +1,9 @@
 import os
 from unittest import TestCase
+from xml.etree import ElementTree
+
+import xmltodict
+
 from nfb_studio.serial import xml
 from .example_class import ExampleClass
 
@@ -28,3 +32,20 @@ class TestXMLEncoder(TestCase):
 
         obj = {"root": ExampleClass()}
         self.assertEqual(encoder.encode(obj), expected_result)
+
+
+class TestElementToDict(TestCase):
+    def test_element_to_dict(self):
+        source_data = (
+            "<root a=\"1\">"
+            "<empty></empty><blank> </blank><text> value </text>"
+            "<repeated>1</repeated><repeated><x>2</x></repeated>"
+            "<forced>3</forced>"
+            "<mixed b=\"2\">text<x>4</x></mixed>"
+            "</root>"
+        )
+
+        element = ElementTree.fromstring(source_data)
+        expected_result = xmltodict.parse(source_data, force_list=("forced",))["root"]
+
+        self.assertEqual(xml.element_to_dict(element, force_list=("forced",)), expected_result)
@@ -1,4 +1,5 @@
 import os
+from io import StringIO
 from unittest import TestCase
 from nfb_studio.serial import xml
 from .example_class import ExampleClass
@@ -26,3 +27,33 @@ class TestXMLEncoder(TestCase):
 
         obj = {"root": ExampleClass()}
         self.assertEqual(encoder.encode(obj), expected_result)
+
+    def test_dump(self):
+        with open(this_dir+"/expected_results/xml_test.xml", "r") as f:
+            expected_result = f.read()
+
+        encoder = xml.XMLEncoder(separator="\n", indent="\t")
+
+        file = StringIO()
+        encoder.dump({"root": ExampleClass()}, file)
+        self.assertEqual(file.getvalue(), expected_result)
+
+    def test_dump_empty_list(self):
+        encoder = xml.XMLEncoder(separator="\n", indent="\t", metadata=False)
+        obj = {"root": {"groups": {"group": []}, "blocks": [], "value": 1}}
+
+        file = StringIO()
+        encoder.dump(obj, file)
+        self.assertEqual(file.getvalue(), encoder.encode(obj))
+        self.assertIn("<groups></groups>", file.getvalue())
+        self.assertNotIn("blocks", file.getvalue())
+
+    def test_dump_none(self):
+        encoder = xml.XMLEncoder(separator="\n", indent="\t", metadata=False)
+        obj = {"root": {"@attribute": None, "element": None}}
+
+        file = StringIO()
+        encoder.dump(obj, file)
+        self.assertEqual(file.getvalue(), encoder.encode(obj))
+        self.assertIn("<root attribute=\"\">", file.getvalue())
+        self.assertIn("<element></element>", file.getvalue())
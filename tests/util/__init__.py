@@ -0,0 +1 @@
+from .ordered_set import TestOrderedSet
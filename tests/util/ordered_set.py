@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+from nfb_studio.util import OrderedSet
+
+
+class TestOrderedSet(TestCase):
+    def test_insertion_order(self):
+        s = OrderedSet([3, 1, 2])
+        s.add(1)
+        s.add(0)
+
+        self.assertEqual(list(s), [3, 1, 2, 0])
+        self.assertEqual(list(reversed(s)), [0, 2, 1, 3])
+
+    def test_discard(self):
+        s = OrderedSet([3, 1, 2])
+        s.discard(1)
+        s.discard(42)
+        s.add(1)
+
+        self.assertEqual(list(s), [3, 2, 1])
+        self.assertNotIn(42, s)
+        self.assertEqual(len(s), 3)
+
+        with self.assertRaises(KeyError):
+            s.remove(42)
+
+    def test_set_operations(self):
+        a = OrderedSet([1, 2, 3])
+        b = OrderedSet([4, 3])
+
+        self.assertEqual(list(a | b), [1, 2, 3, 4])
+        self.assertEqual(list(a - b), [1, 2])
+        self.assertEqual(list(a & b), [3])
+        self.assertEqual(a, {3, 2, 1})
+
+        a |= [5, 0]
+        self.assertEqual(list(a), [1, 2, 3, 5, 0])
+
+    def test_pop(self):
+        s = OrderedSet([1, 2])
+
+        self.assertEqual(s.pop(), 2)
+        self.assertEqual(s.pop(), 1)
+        with self.assertRaises(KeyError):
+            s.pop()